@@ -0,0 +1,47 @@
+"""Time the model counter on random 3-CNF, near the satisfiability phase transition and below it.
+
+Run with `python -m benchmarks.bench_counting`.
+"""
+import random
+import time
+
+from prop_logic.counting import ModelCounter
+
+INSTANCES = 5
+# Clauses per variable and numbers of variables. Counting is hardest well below 4.26, where
+# random 3-CNF is hardest to solve, since formulas there have many models and few components.
+SIZES = ((4.26, (50, 100, 150)), (2.0, (30, 40, 50)))
+
+
+def make_clauses(num_vars: int, ratio: float, rng: random.Random) -> list[list[int]]:
+    """Return random 3-CNF clauses with `num_vars` variables and `ratio` clauses per variable."""
+    return [
+        [v if rng.random() < 0.5 else -v for v in rng.sample(range(1, num_vars + 1), 3)]
+        for _ in range(round(num_vars * ratio))
+    ]
+
+
+def main() -> None:
+    """Print the mean time and decisions to count instances of increasing size."""
+    rng = random.Random(0)
+    for ratio, sizes in SIZES:
+        for num_vars in sizes:
+            decisions = 0
+            elapsed = 0.0
+            for _ in range(INSTANCES):
+                clauses = make_clauses(num_vars, ratio, rng)
+                counter = ModelCounter()
+                start = time.perf_counter()
+                counter.count_clauses(clauses, num_vars)
+                elapsed += time.perf_counter() - start
+                decisions += counter.stats.decisions
+
+            print(
+                f"{num_vars:>4} variables, {round(num_vars * ratio):>4} clauses: "
+                f"{elapsed / INSTANCES * 1e3:9.1f} ms mean, "
+                f"{decisions // INSTANCES:>7} decisions mean"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the single-pass lexer against the original per-position TokenType scan.
+
+Run with `python -m benchmarks.bench_lexer`.
+"""
+import random
+import timeit
+from typing import Iterator
+
+from prop_logic.lexer import Token, TokenType, lex
+
+LEXEMES = ["~", "¬", "&", "∧", "/\\", "|", "∨", "\\/", ">", "→", "(", ")"]
+
+
+def lex_sequential(formula: str) -> Iterator[Token]:
+    """Lex `formula` by trying every TokenType at each position (the original algorithm)."""
+    i = 0
+    while i < len(formula):
+        for token_type in TokenType:
+            match = token_type.value.match(formula, i)
+            if match:
+                if token_type is not TokenType.WHITESPACE:
+                    yield Token(token_type, match[0], i)
+                i = match.end(0)
+                break
+        else:
+            raise ValueError(f"Unknown character {formula[i]!r} at position {i}.")
+
+
+def make_formula(length: int, seed: int = 0) -> str:
+    """Return a string of `length` random lexemes separated by single spaces."""
+    rng = random.Random(seed)
+    words = []
+    for _ in range(length):
+        if rng.random() < 0.4:
+            words.append("".join(rng.choices("ABCDEFGHpqrs", k=rng.randint(1, 4))))
+        else:
+            words.append(rng.choice(LEXEMES))
+    return " ".join(words)
+
+
+def main() -> None:
+    """Print the time each lexer takes on formulas of increasing size."""
+    for length in (100, 10_000, 100_000):
+        formula = make_formula(length)
+        assert list(lex(formula)) == list(lex_sequential(formula))
+
+        number = max(1, 200_000 // length)
+        old = min(timeit.repeat(lambda: list(lex_sequential(formula)), number=number, repeat=3))
+        new = min(timeit.repeat(lambda: list(lex(formula)), number=number, repeat=3))
+        print(
+            f"{length:>7} lexemes: sequential {old / number * 1e3:8.3f} ms, "
+            f"single-pass {new / number * 1e3:8.3f} ms, speedup {old / new:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure the throughput of parallel parsing across worker counts.
+
+Run with `python -m benchmarks.bench_parallel`.
+"""
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from prop_logic.flat import FlatFormula
+from prop_logic.lexer import lex
+from prop_logic.parallel import parse_many
+from prop_logic.parser import IterativeParser
+
+from .bench_parser import make_formula
+
+
+def main() -> None:
+    """Print formulas parsed per second serially and with increasing numbers of workers."""
+    rng = random.Random(0)
+    formulas = [make_formula(rng.randint(5, 50), seed) for seed in range(20_000)]
+
+    ast = IterativeParser(lex(formulas[0])).parse()
+    for name, value in (("AST", ast), ("flat", FlatFormula.from_formula(ast))):
+        start = time.perf_counter()
+        for _ in range(1000):
+            data = pickle.dumps(value)
+            pickle.loads(data)
+        elapsed = (time.perf_counter() - start) / 1000
+        print(f"{name:>8} pickle round trip: {len(data):6} bytes, {elapsed * 1e6:7.1f} µs")
+
+    start = time.perf_counter()
+    for formula in formulas:
+        IterativeParser(lex(formula)).parse()
+    serial = len(formulas) / (time.perf_counter() - start)
+    print(f"  serial: {serial:9.0f} formulas/s")
+
+    print(f"{os.cpu_count()} CPUs")
+    for workers in (1, 2, 4, 8, 16, 32):
+        with ProcessPoolExecutor(workers) as executor:
+            parse_many(formulas[:workers], executor=executor, chunksize=1)  # Start the workers.
+            start = time.perf_counter()
+            parse_many(formulas, executor=executor)
+            rate = len(formulas) / (time.perf_counter() - start)
+        print(f"{workers:>2} workers: {rate:9.0f} formulas/s ({rate / serial:.2f}x serial)")
+
+
+if __name__ == "__main__":
+    main()
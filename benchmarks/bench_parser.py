@@ -0,0 +1,61 @@
+"""Compare the iterative, array and Pratt parsers against the recursive parser.
+
+Run with `python -m benchmarks.bench_parser`.
+"""
+import random
+import sys
+import timeit
+
+from prop_logic.lexer import lex, lex_array
+from prop_logic.parser import ArrayParser, IterativeParser, Parser
+from prop_logic.pratt import PrattParser
+
+
+def make_formula(length: int, seed: int = 0) -> str:
+    """Return a formula with `length` variables and randomly parenthesised binary formulas."""
+    rng = random.Random(seed)
+    parts = [rng.choice(["A", "~B", "C", "~~D"])]
+    for _ in range(length - 1):
+        parts.append(rng.choice(["&", "|", ">"]))
+        parts.append(rng.choice(["A", "~B", "C", "~~D"]))
+        if rng.random() < 0.1:
+            parts = ["(", *parts, ")"]
+    return " ".join(parts)
+
+
+def main() -> None:
+    """Print the time each parser takes on formulas of increasing size."""
+    for length in (100, 1_000, 10_000):
+        formula = make_formula(length)
+        tokens = list(lex(formula))
+        array = lex_array(formula)
+        number = max(1, 100_000 // length)
+        results = {}
+        for parser_type in (Parser, IterativeParser, PrattParser):
+            try:
+                times = timeit.repeat(
+                    lambda: parser_type(iter(tokens)).parse(), number=number, repeat=3
+                )
+                results[parser_type.__name__] = min(times) / number
+            except RecursionError:
+                results[parser_type.__name__] = float("nan")
+        times = timeit.repeat(lambda: ArrayParser(array).parse(), number=number, repeat=3)
+        results[ArrayParser.__name__] = min(times) / number
+        print(
+            f"{len(tokens):>7} tokens: "
+            + ", ".join(f"{name} {time * 1e3:8.3f} ms" for name, time in results.items())
+        )
+
+    n = sys.getrecursionlimit() * 10
+    for name, formula in (
+        ("nested groups", "(" * n + "A" + ")" * n),
+        ("negation chain", "~" * n + "A"),
+        ("conjunction chain", " & ".join(["A"] * n)),
+    ):
+        tokens = list(lex(formula))
+        time = min(timeit.repeat(lambda: IterativeParser(iter(tokens)).parse(), number=1, repeat=3))
+        print(f"{name} ({len(tokens)} tokens): IterativeParser {time * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
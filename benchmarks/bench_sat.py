@@ -0,0 +1,50 @@
+"""Time the CDCL solver on random 3-SAT formulas near the satisfiability phase transition.
+
+Run with `python -m benchmarks.bench_sat`.
+"""
+import random
+import time
+
+from prop_logic.compiler import compile_formula
+from prop_logic.lexer import lex
+from prop_logic.parser import IterativeParser
+from prop_logic.sat import solve
+
+RATIO = 4.26  # Clauses per variable at which random 3-SAT is hardest.
+INSTANCES = 10
+
+
+def make_formula(num_vars: int, rng: random.Random) -> str:
+    """Return a random 3-SAT formula with `num_vars` variables as a conjunction of clauses."""
+    names = [f"x{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(num_vars)]
+    clauses = []
+    for _ in range(round(num_vars * RATIO)):
+        lits = (rng.choice(["", "~"]) + name for name in rng.sample(names, 3))
+        clauses.append("(" + " | ".join(lits) + ")")
+    return " & ".join(clauses)
+
+
+def main() -> None:
+    """Print the mean time to solve instances of increasing size."""
+    rng = random.Random(0)
+    for num_vars in (50, 100, 150):
+        satisfiable = 0
+        elapsed = 0.0
+        for _ in range(INSTANCES):
+            formula = IterativeParser(lex(make_formula(num_vars, rng))).parse()
+            start = time.perf_counter()
+            model = solve(formula)
+            elapsed += time.perf_counter() - start
+
+            if model is not None:
+                assert compile_formula(formula)(model)
+                satisfiable += 1
+
+        print(
+            f"{num_vars:>4} variables, {round(num_vars * RATIO):>4} clauses: "
+            f"{elapsed / INSTANCES * 1e3:9.1f} ms mean, {satisfiable}/{INSTANCES} satisfiable"
+        )
+
+
+if __name__ == "__main__":
+    main()
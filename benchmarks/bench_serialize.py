@@ -0,0 +1,50 @@
+"""Compare loading formulas from the binary format against parsing their text.
+
+Run with `python -m benchmarks.bench_serialize`.
+"""
+import os
+import random
+import tempfile
+import time
+
+from prop_logic.lexer import lex
+from prop_logic.parser import IterativeParser
+from prop_logic.serialize import FormulaFile, write_formulas
+
+from .bench_parser import make_formula
+
+
+def main() -> None:
+    """Print the time to parse, open and walk libraries of increasing size."""
+    rng = random.Random(0)
+    for count in (1_000, 10_000, 100_000):
+        texts = [make_formula(rng.randint(5, 50), seed) for seed in range(count)]
+
+        start = time.perf_counter()
+        formulas = [IterativeParser(lex(text)).parse() for text in texts]
+        parse = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "formulas.plf")
+            write_formulas(formulas, path)
+
+            start = time.perf_counter()
+            file = FormulaFile(path)
+            load = time.perf_counter() - start
+
+            assignment = {"A": True, "B": False, "C": True, "D": False}
+            start = time.perf_counter()
+            for formula in file:
+                formula.evaluate(assignment)
+            evaluate = time.perf_counter() - start
+            del formula
+            file.close()
+
+        print(
+            f"{count:>7} formulas: parse {parse * 1e3:9.1f} ms, open {load * 1e3:6.3f} ms, "
+            f"open+evaluate all {(load + evaluate) * 1e3:9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
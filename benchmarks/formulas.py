@@ -0,0 +1,78 @@
+"""Seeded generation of random formulas with a controlled shape for benchmarks."""
+import random
+import string
+from typing import Mapping, NamedTuple, Optional
+
+__all__ = ("FormulaShape", "generate_formula", "variable_name")
+
+DEFAULT_CONNECTIVES = {"&": 1.0, "|": 1.0, ">": 1.0}
+
+
+class FormulaShape(NamedTuple):
+    """Parameters of the shape of a generated formula.
+
+    A formula is a chain of `width` terms joined by binary connectives, chosen with the relative
+    weights in `connectives`. Up to `depth` levels deep, `groups` of the terms of each chain are
+    parenthesised formulas of the same shape, nested one level deeper; the rest are variables.
+    Each term is negated with probability `negation`. Variables are drawn from `variables` names.
+    """
+
+    depth: int = 3
+    width: int = 4
+    groups: int = 2
+    variables: int = 8
+    connectives: Mapping[str, float] = DEFAULT_CONNECTIVES
+    negation: float = 0.2
+
+
+def variable_name(index: int) -> str:
+    """Return the `index`th variable name: A to Z, then AA, AB, etc."""
+    letters = string.ascii_uppercase
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, len(letters))
+        name = letters[remainder] + name
+    return name
+
+
+def generate_formula(shape: FormulaShape, seed: int = 0) -> str:
+    """Return a random formula of the given `shape`, which is the same for the same `seed`.
+
+    Generation is iterative, so the depth isn't bounded by the recursion limit.
+    """
+    if shape.width < 1 or not 0 <= shape.groups <= shape.width:
+        raise ValueError("width must be at least 1 and groups must be between 0 and width.")
+
+    rng = random.Random(seed)
+    names = [variable_name(i) for i in range(shape.variables)]
+    lexemes = list(shape.connectives)
+    weights = list(shape.connectives.values())
+
+    pieces: list[str] = []
+    # Each entry is a piece of text to emit or, if None, a chain to generate at the next depth.
+    stack: list[tuple[Optional[str], int]] = [(None, 0)]
+    while stack:
+        piece, depth = stack.pop()
+        if piece is not None:
+            pieces.append(piece)
+            continue
+
+        nested = set()
+        if depth < shape.depth:
+            nested = set(rng.sample(range(shape.width), shape.groups))
+        connectives = rng.choices(lexemes, weights, k=shape.width - 1)
+
+        chain: list[tuple[Optional[str], int]] = []
+        for i in range(shape.width):
+            if i:
+                chain.append((f" {connectives[i - 1]} ", depth))
+            if rng.random() < shape.negation:
+                chain.append(("~", depth))
+            if i in nested:
+                chain.extend((("(", depth), (None, depth + 1), (")", depth)))
+            else:
+                chain.append((rng.choice(names), depth))
+        stack.extend(reversed(chain))
+
+    return "".join(pieces)
@@ -0,0 +1,74 @@
+"""Benchmarks of how lexing, parsing and printing scale with the shape of formulas.
+
+Run with `pytest benchmarks --benchmark-json=benchmark.json` to record the results as JSON, or
+with `--benchmark-autosave` and `--benchmark-compare` to compare against a saved run.
+"""
+import pytest
+
+from prop_logic.lexer import lex
+from prop_logic.parser import IterativeParser, Parser
+from prop_logic.pratt import PrattParser
+
+from .formulas import FormulaShape, generate_formula
+
+CASES = {
+    "small": FormulaShape(),
+    "balanced": FormulaShape(depth=6, width=4, groups=2, variables=26),
+    "chain-mixed": FormulaShape(depth=0, width=10_000, groups=0, variables=100),
+    "chain-and": FormulaShape(
+        depth=0, width=10_000, groups=0, variables=100, connectives={"&": 1.0}
+    ),
+    "chain-and-or": FormulaShape(
+        depth=0, width=10_000, groups=0, variables=100, connectives={"&": 1.0, "|": 1.0}
+    ),
+    "deep-200": FormulaShape(depth=200, width=2, groups=1, negation=0.0),
+    "deep-5k": FormulaShape(depth=5_000, width=2, groups=1, negation=0.0),
+    "wide-10k": FormulaShape(depth=1, width=100, groups=100, variables=1_000),
+    "negations-10k": FormulaShape(depth=0, width=2_000, groups=0, negation=1.0),
+}
+CHAINS = [name for name in CASES if name.startswith("chain")]
+
+
+@pytest.fixture(scope="module", params=list(CASES))
+def case(request):
+    text = generate_formula(CASES[request.param], seed=0)
+    return text, list(lex(text))
+
+
+def run_or_skip(function, *args):
+    """Call `function` once and skip the benchmark if it exceeds the recursion limit."""
+    try:
+        return function(*args)
+    except RecursionError:
+        pytest.skip("The formula exceeds the recursion limit.")
+
+
+def test_lex(benchmark, case):
+    text, tokens = case
+    assert len(benchmark(lambda: list(lex(text)))) == len(tokens)
+
+
+@pytest.mark.parametrize("parser_type", [Parser, IterativeParser, PrattParser])
+def test_parse(benchmark, case, parser_type):
+    _, tokens = case
+    run_or_skip(lambda: parser_type(iter(tokens)).parse())
+    benchmark(lambda: parser_type(iter(tokens)).parse())
+
+
+@pytest.mark.parametrize(["name", "width"], [(name, w) for name in CHAINS for w in (200, 10_000)])
+def test_parse_binary(benchmark, name, width):
+    tokens = list(lex(generate_formula(CASES[name]._replace(width=width))))
+
+    def parse_binary():
+        parser = Parser(iter(tokens))
+        return parser.parse_binary(parser.parse_term())
+
+    run_or_skip(parse_binary)
+    benchmark(parse_binary)
+
+
+def test_str(benchmark, case):
+    _, tokens = case
+    formula = IterativeParser(iter(tokens)).parse()
+    run_or_skip(str, formula)
+    benchmark(str, formula)
@@ -0,0 +1,340 @@
+from array import array
+from typing import Callable, Iterable, Optional, Sequence
+
+from prop_logic import interned, nodes
+from prop_logic.lexer import TokenType
+
+__all__ = ("BDD", "FALSE", "TRUE")
+
+FALSE = 0
+TRUE = 1
+
+_EMPTY = 0  # An empty slot of the unique table; terminals are never stored in it.
+_NONE = 0xFFFFFFFF  # An empty slot of the computed table, or the level of a freed node.
+
+
+class BDD:
+    """Manager of reduced ordered binary decision diagrams (ROBDDs).
+
+    A BDD is referred to by the integer ID of its root node; `FALSE` and `TRUE` are the terminal
+    nodes. Since diagrams are reduced and nodes are unique, two formulas are equivalent iff their
+    BDDs have the same ID.
+
+    Nodes are stored in parallel arrays of levels and low and high children rather than as
+    objects. The unique table is an open-addressing hash table of node IDs, and the computed
+    table caching the results of `ite` is a direct-mapped array of `cache_size` entries, where a
+    new entry evicts any older one in its slot.
+
+    Variables are ordered by `variables`; others are added below them as they're encountered.
+    Nodes are not reference-counted; unreferenced nodes are freed by calling `collect_garbage`
+    with the roots which are still needed.
+    """
+
+    def __init__(self, variables: Sequence[str] = (), cache_size: int = 1 << 16):
+        if cache_size < 1 or cache_size & (cache_size - 1):
+            raise ValueError(f"cache_size must be a power of 2, not {cache_size}.")
+
+        self.variables: list[str] = []
+        self._levels_by_name: dict[str, int] = {}
+
+        # The terminals' level is below all variables'.
+        self._level = array("I", [_NONE - 1, _NONE - 1])
+        self._low = array("I", [FALSE, TRUE])
+        self._high = array("I", [FALSE, TRUE])
+        self._free: list[int] = []
+
+        self._table = array("I", [_EMPTY]) * 1024
+        self._table_count = 0
+
+        self._cache_mask = cache_size - 1
+        self._cache_f = array("I", [_NONE]) * cache_size
+        self._cache_g = array("I", [0]) * cache_size
+        self._cache_h = array("I", [0]) * cache_size
+        self._cache_result = array("I", [0]) * cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        for name in variables:
+            self.add_variable(name)
+
+    def __len__(self) -> int:
+        """Return the number of live nodes, including the terminals."""
+        return len(self._level) - len(self._free)
+
+    def add_variable(self, name: str) -> int:
+        """Add a variable below all existing ones if it doesn't exist and return its level."""
+        if name not in self._levels_by_name:
+            self._levels_by_name[name] = len(self.variables)
+            self.variables.append(name)
+        return self._levels_by_name[name]
+
+    def variable(self, name: str) -> int:
+        """Return the BDD of the variable `name`, adding the variable if necessary."""
+        return self._make(self.add_variable(name), FALSE, TRUE)
+
+    def level(self, u: int) -> Optional[int]:
+        """Return the level of node `u`'s variable, or None if `u` is a terminal."""
+        return None if u <= TRUE else self._level[u]
+
+    def low(self, u: int) -> int:
+        """Return the child of node `u` for which its variable is false."""
+        return self._low[u]
+
+    def high(self, u: int) -> int:
+        """Return the child of node `u` for which its variable is true."""
+        return self._high[u]
+
+    def _make(self, level: int, low: int, high: int) -> int:
+        """Return the unique node with the given level and children."""
+        if low == high:
+            return low
+
+        levels, lows, highs, table = self._level, self._low, self._high, self._table
+        mask = len(table) - 1
+        i = ((level * 0x9E3779B1) ^ (low * 0x85EBCA77) ^ (high * 0xC2B2AE3D)) & mask
+        while True:
+            u = table[i]
+            if u == _EMPTY:
+                break
+            if levels[u] == level and lows[u] == low and highs[u] == high:
+                return u
+            i = (i + 1) & mask
+
+        if self._free:
+            u = self._free.pop()
+            levels[u], lows[u], highs[u] = level, low, high
+        else:
+            u = len(levels)
+            levels.append(level)
+            lows.append(low)
+            highs.append(high)
+        table[i] = u
+
+        self._table_count += 1
+        if 2 * self._table_count > len(table):
+            self._rehash(2 * len(table))
+        return u
+
+    def _rehash(self, size: int) -> None:
+        """Rebuild the unique table with `size` slots from all live nodes."""
+        levels, lows, highs = self._level, self._low, self._high
+        table = array("I", [_EMPTY]) * size
+        mask = size - 1
+        count = 0
+        for u in range(2, len(levels)):
+            level = levels[u]
+            if level == _NONE:
+                continue
+            i = ((level * 0x9E3779B1) ^ (lows[u] * 0x85EBCA77) ^ (highs[u] * 0xC2B2AE3D)) & mask
+            while table[i] != _EMPTY:
+                i = (i + 1) & mask
+            table[i] = u
+            count += 1
+        self._table = table
+        self._table_count = count
+
+    def _ite_terminal(self, f: int, g: int, h: int) -> Optional[int]:
+        """Return the result of `ite` if it's trivial or cached, otherwise None."""
+        if f == TRUE:
+            return g
+        elif f == FALSE:
+            return h
+        elif g == h:
+            return g
+        elif g == TRUE and h == FALSE:
+            return f
+
+        slot = ((f * 0x9E3779B1) ^ (g * 0x85EBCA77) ^ (h * 0xC2B2AE3D)) & self._cache_mask
+        if self._cache_f[slot] == f and self._cache_g[slot] == g and self._cache_h[slot] == h:
+            self.cache_hits += 1
+            return self._cache_result[slot]
+        self.cache_misses += 1
+        return None
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """Return the BDD of "if `f` then `g` else `h`".
+
+        The cofactors are computed with an explicit stack rather than recursively, so the
+        number of variables isn't bounded by the recursion limit.
+        """
+        levels, lows, highs = self._level, self._low, self._high
+        results: list[int] = []  # The BDDs of the cofactors computed so far.
+        # Triples still to compute, or to build a node of at the given level from the results.
+        stack: list[tuple[int, int, int, Optional[int]]] = [(f, g, h, None)]
+        while stack:
+            f, g, h, level = stack.pop()
+            if level is None:
+                result = self._ite_terminal(f, g, h)
+                if result is not None:
+                    results.append(result)
+                    continue
+
+                level = min(levels[f], levels[g], levels[h])
+                f0, f1 = (lows[f], highs[f]) if levels[f] == level else (f, f)
+                g0, g1 = (lows[g], highs[g]) if levels[g] == level else (g, g)
+                h0, h1 = (lows[h], highs[h]) if levels[h] == level else (h, h)
+                stack.append((f, g, h, level))
+                stack.append((f1, g1, h1, None))
+                stack.append((f0, g0, h0, None))
+                continue
+
+            high = results.pop()
+            result = self._make(level, results.pop(), high)
+            slot = ((f * 0x9E3779B1) ^ (g * 0x85EBCA77) ^ (h * 0xC2B2AE3D)) & self._cache_mask
+            self._cache_f[slot] = f
+            self._cache_g[slot] = g
+            self._cache_h[slot] = h
+            self._cache_result[slot] = result
+            results.append(result)
+        return results.pop()
+
+    def not_(self, f: int) -> int:
+        """Return the BDD of the negation of `f`."""
+        return self.ite(f, FALSE, TRUE)
+
+    def and_(self, f: int, g: int) -> int:
+        """Return the BDD of the conjunction of `f` and `g`."""
+        return self.ite(f, g, FALSE)
+
+    def or_(self, f: int, g: int) -> int:
+        """Return the BDD of the disjunction of `f` and `g`."""
+        return self.ite(f, TRUE, g)
+
+    def implies(self, f: int, g: int) -> int:
+        """Return the BDD of the material implication of `g` by `f`."""
+        return self.ite(f, g, TRUE)
+
+    def from_formula(self, formula: nodes.Formula) -> int:
+        """Return the BDD of `formula`.
+
+        New variables are added in order of first occurrence. The conversion is iterative over
+        the formula, and repeated subformulas are only converted once.
+        """
+        formula = interned.intern(formula)
+        results: dict[int, int] = {}
+        for node in nodes.iter_postorder(formula):
+            if isinstance(node, nodes.Variable):
+                result = self.variable(node.name)
+            elif isinstance(node, nodes.UnaryFormula):
+                result = self.not_(results[id(node.operand)])
+            else:
+                left, right = results[id(node.left)], results[id(node.right)]
+                type_ = node.connective.type
+                if type_ is TokenType.AND:
+                    result = self.and_(left, right)
+                elif type_ is TokenType.OR:
+                    result = self.or_(left, right)
+                elif type_ is TokenType.IMPLIES:
+                    result = self.implies(left, right)
+                else:
+                    raise ValueError(f"Unsupported connective type {type_}.")
+            results[id(node)] = result
+        return results[id(formula)]
+
+    def equivalent(self, f: int, g: int) -> bool:
+        """Return True if `f` and `g` are logically equivalent."""
+        return f == g
+
+    def _postorder(self, root: int) -> list[int]:
+        """Return the non-terminal nodes reachable from `root`, children before parents."""
+        lows, highs = self._low, self._high
+        order = []
+        seen = {FALSE, TRUE}
+        stack = [(root, False)]
+        while stack:
+            u, expanded = stack.pop()
+            if expanded:
+                order.append(u)
+            elif u not in seen:
+                seen.add(u)
+                stack.append((u, True))
+                stack.append((highs[u], False))
+                stack.append((lows[u], False))
+        return order
+
+    def count(self, f: int, num_vars: Optional[int] = None) -> int:
+        """Return the number of assignments of the first `num_vars` variables satisfying `f`.
+
+        By default, all variables of the manager are counted. `f` must not depend on any
+        variables beyond the first `num_vars`.
+        """
+        if num_vars is None:
+            num_vars = len(self.variables)
+
+        levels, lows, highs = self._level, self._low, self._high
+
+        def level(u: int) -> int:
+            return num_vars if u <= TRUE else levels[u]
+
+        counts = {FALSE: 0, TRUE: 1}
+        for u in self._postorder(f):
+            if levels[u] >= num_vars:
+                raise ValueError(f"The BDD depends on variable {self.variables[levels[u]]!r}.")
+            low, high = lows[u], highs[u]
+            counts[u] = (counts[low] << (level(low) - levels[u] - 1)) + (
+                counts[high] << (level(high) - levels[u] - 1)
+            )
+        return counts[f] << level(f)
+
+    def restrict(self, f: int, assignment: dict[str, bool]) -> int:
+        """Return the BDD of `f` with variables substituted by truth values in `assignment`."""
+        values = {self._levels_by_name[name]: value for name, value in assignment.items()}
+        levels, lows, highs = self._level, self._low, self._high
+
+        results = {FALSE: FALSE, TRUE: TRUE}
+        for u in self._postorder(f):
+            level = levels[u]
+            if level in values:
+                results[u] = results[highs[u] if values[level] else lows[u]]
+            else:
+                results[u] = self._make(level, results[lows[u]], results[highs[u]])
+        return results[f]
+
+    def exists(self, f: int, names: Iterable[str]) -> int:
+        """Return the BDD of `f` with the variables `names` existentially quantified."""
+        return self._quantify(f, names, self.or_)
+
+    def forall(self, f: int, names: Iterable[str]) -> int:
+        """Return the BDD of `f` with the variables `names` universally quantified."""
+        return self._quantify(f, names, self.and_)
+
+    def _quantify(self, f: int, names: Iterable[str], operator: Callable[[int, int], int]) -> int:
+        quantified = {self._levels_by_name[name] for name in names}
+        levels, lows, highs = self._level, self._low, self._high
+
+        results = {FALSE: FALSE, TRUE: TRUE}
+        for u in self._postorder(f):
+            low, high = results[lows[u]], results[highs[u]]
+            if levels[u] in quantified:
+                results[u] = operator(low, high)
+            else:
+                results[u] = self._make(levels[u], low, high)
+        return results[f]
+
+    def collect_garbage(self, roots: Iterable[int]) -> int:
+        """Free all nodes unreachable from `roots` and return how many were freed.
+
+        The IDs of freed nodes may be reused, so BDDs other than `roots` and their descendants
+        must not be used afterwards. The computed table is cleared.
+        """
+        levels, lows, highs = self._level, self._low, self._high
+        live = bytearray(len(levels))
+        live[FALSE] = live[TRUE] = 1
+        stack = list(roots)
+        while stack:
+            u = stack.pop()
+            if not live[u]:
+                live[u] = 1
+                stack.append(lows[u])
+                stack.append(highs[u])
+
+        freed = 0
+        for u in range(2, len(levels)):
+            if not live[u] and levels[u] != _NONE:
+                levels[u] = _NONE
+                self._free.append(u)
+                freed += 1
+
+        self._rehash(len(self._table))
+        self._cache_f = array("I", [_NONE]) * len(self._cache_f)
+        return freed
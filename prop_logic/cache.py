@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from prop_logic import interned
+from prop_logic.connectives import Connective
+from prop_logic.lexer import lex
+from prop_logic.parser import IterativeParser
+
+__all__ = ("CacheInfo", "ParseCache", "normalize")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `ParseCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+def normalize(formula: str) -> str:
+    """Return a canonical spelling of `formula`.
+
+    Whitespace is reduced to single spaces between tokens and every connective is spelt with its
+    canonical lexeme, e.g. `&`, `∙` and `/\\` all become `∧`. Formulas which only differ in such
+    spelling lex to the same tokens and thus parse to the same tree.
+    """
+    lexemes = []
+    for token in lex(formula):
+        if connective := Connective.from_token(token):
+            lexemes.append(connective.lexeme)
+        else:
+            lexemes.append(token.value)
+    return " ".join(lexemes)
+
+
+class ParseCache:
+    """Bounded cache of parsed formulas keyed by their text.
+
+    The least recently used formula is evicted once the cache holds `maxsize` formulas; if
+    `maxsize` is None, the cache is unbounded. If `normalize` is True, formulas are looked up by
+    their `normalize`d text so that equivalent spellings share one entry.
+
+    Parsed formulas are interned by `interner`, so the trees returned are immutable and may be
+    freely shared between callers.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 1024,
+        normalize: bool = False,
+        interner: interned.Interner = interned.interner,
+    ):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f"maxsize must be None or at least 0, not {maxsize}.")
+
+        self.maxsize = maxsize
+        self.normalize = normalize
+        self.interner = interner
+
+        self._cache: OrderedDict[str, interned.InternedFormula] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def parse(self, formula: str) -> interned.InternedFormula:
+        """Return the parsed `formula`, parsing it only if it isn't already cached.
+
+        Raise ValueError if `formula` is not a well-formed formula; such errors aren't cached.
+        """
+        key = normalize(formula) if self.normalize else formula
+
+        with self._lock:
+            node = self._cache.get(key)
+            if node is not None:
+                self._hits += 1
+                self._cache.move_to_end(key)
+                return node
+            self._misses += 1
+
+        node = self.interner.intern(IterativeParser(lex(key)).parse())
+
+        with self._lock:
+            if self.maxsize != 0:
+                self._cache[key] = node
+                if self.maxsize is not None and len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self._evictions += 1
+
+        return node
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss, and eviction counts and the current and maximum size."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self))
+
+    def clear(self) -> None:
+        """Remove all formulas from the cache and reset its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = 0
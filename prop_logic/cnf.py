@@ -0,0 +1,267 @@
+import os
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from prop_logic import interned, nodes
+from prop_logic.lexer import TokenType
+
+__all__ = ("Clause", "TseitinEncoder", "write_dimacs")
+
+Clause = tuple[int, ...]
+
+# Directions of a gate's definition which are needed.
+_POSITIVE = 1  # The gate's variable implies the gate's formula.
+_NEGATIVE = 2  # The gate's formula implies the gate's variable.
+_BOTH = _POSITIVE | _NEGATIVE
+
+_Leaf = tuple[nodes.Formula, bool]  # A subformula and whether it's negated.
+
+
+def _swap(directions: int) -> int:
+    return ((directions & _POSITIVE) << 1) | ((directions & _NEGATIVE) >> 1)
+
+
+def _is_conjunctive(node: nodes.Formula, negated: bool) -> bool:
+    """Return True if the binary formula `node`, or its negation if `negated`, is a conjunction.
+
+    Otherwise, it's equivalent to a disjunction, e.g. `~(A & B)` or `A > B`.
+    """
+    return (node.connective.type is TokenType.AND) is not negated
+
+
+def _operands(node: nodes.BinaryFormula, negated: bool) -> tuple[_Leaf, _Leaf]:
+    """Return the operands of the conjunction or disjunction equivalent to `node`.
+
+    For example, `~(A > B)` is `A & ~B`.
+    """
+    left_negated = negated is not (node.connective.type is TokenType.IMPLIES)
+    return (node.left, left_negated), (node.right, negated)
+
+
+class TseitinEncoder:
+    """Encoder of formulas into equisatisfiable CNF using auxiliary variables.
+
+    The formula's variables are numbered first, in order of first occurrence. Each binary
+    subformula which is referenced as an operand is a gate: a new variable defined to be
+    equivalent to it. Chains of the same connective become a single gate with many operands,
+    and negations are just negated literals.
+
+    If `plaisted_greenbaum` is True, a gate's definition is only encoded in the directions
+    required by the polarity of its occurrences, which halves the clauses of most gates. The
+    result is still equisatisfiable, but unlike a full Tseitin encoding, it doesn't preserve the
+    number of models.
+
+    Gates are shared by structurally equal subformulas, including those of different formulas
+    encoded by the same encoder, so each definition is only encoded once.
+    """
+
+    def __init__(self, plaisted_greenbaum: bool = True):
+        self.plaisted_greenbaum = plaisted_greenbaum
+        self.variables: dict[str, int] = {}
+        self.num_vars = 0
+
+        self._gates: dict[interned.InternedFormula, int] = {}
+        self._gate_operands: dict[interned.InternedFormula, list[_Leaf]] = {}
+        self._encoded: dict[interned.InternedFormula, int] = {}  # Directions already encoded.
+
+    def new_var(self) -> int:
+        """Create a new variable and return it."""
+        self.num_vars += 1
+        return self.num_vars
+
+    def variable(self, name: str) -> int:
+        """Return the variable of the formula variable called `name`, creating it if needed."""
+        if name not in self.variables:
+            self.variables[name] = self.new_var()
+        return self.variables[name]
+
+    def encode(self, formula: nodes.Formula) -> Iterator[Clause]:
+        """Yield clauses which are satisfiable iff `formula` is.
+
+        Clauses are yielded lazily, so they needn't all be held in memory; the encoder only
+        keeps the gates of the formula. The number of clauses is linear in the formula's size.
+        """
+        formula = interned.intern(formula)
+        for name in nodes.variable_names(formula):
+            self.variable(name)
+
+        uses = {formula: 1}
+        for node in nodes.iter_postorder(formula):
+            for child in node.children:
+                uses[child] = uses.get(child, 0) + 1
+
+        # The formula is asserted, so split conjunctions into separate clauses instead of gates.
+        pending: list[tuple[interned.InternedFormula, int]] = []
+        stack = [(formula, False)]
+        seen = set()
+        while stack:
+            node, negated = self._strip(*stack.pop(), None)
+            if (node, negated) in seen:
+                continue
+            seen.add((node, negated))
+
+            if isinstance(node, nodes.BinaryFormula) and _is_conjunctive(node, negated):
+                stack.extend(reversed(_operands(node, negated)))
+                continue
+            elif isinstance(node, nodes.BinaryFormula):
+                leaves = self._flatten(node, negated, uses)
+            else:
+                leaves = [(node, negated)]
+
+            clause = self._clause(leaves)
+            if clause is not None:
+                yield clause
+            for leaf, leaf_negated in leaves:
+                if isinstance(leaf, nodes.BinaryFormula):
+                    pending.append((leaf, _NEGATIVE if leaf_negated else _POSITIVE))
+
+        # Encode the definitions of the gates in the directions their polarities require.
+        while pending:
+            gate, directions = pending.pop()
+            if not self.plaisted_greenbaum:
+                directions = _BOTH
+            directions &= ~self._encoded.get(gate, 0)
+            if not directions:
+                continue
+            self._encoded[gate] = self._encoded.get(gate, 0) | directions
+
+            if gate not in self._gate_operands:
+                self._gate_operands[gate] = self._flatten(gate, False, uses)
+            leaves = self._gate_operands[gate]
+            var = self._gate(gate)
+            lits = [self._literal(leaf, leaf_negated) for leaf, leaf_negated in leaves]
+
+            if _is_conjunctive(gate, False):
+                if directions & _POSITIVE:
+                    yield from filter(None, (self._unique((-var, lit)) for lit in lits))
+                if directions & _NEGATIVE:
+                    clause = self._unique((var, *(-lit for lit in lits)))
+                    if clause is not None:
+                        yield clause
+            else:
+                if directions & _POSITIVE:
+                    clause = self._unique((-var, *lits))
+                    if clause is not None:
+                        yield clause
+                if directions & _NEGATIVE:
+                    yield from filter(None, (self._unique((var, -lit)) for lit in lits))
+
+            for leaf, leaf_negated in leaves:
+                if isinstance(leaf, nodes.BinaryFormula):
+                    pending.append((leaf, _swap(directions) if leaf_negated else directions))
+
+    @staticmethod
+    def _strip(
+        node: nodes.Formula, negated: bool, uses: Optional[dict[nodes.Formula, int]]
+    ) -> _Leaf:
+        """Remove negations from `node`, flipping `negated` for each.
+
+        If `uses` is given, stop at negations with more than one use.
+        """
+        while isinstance(node, nodes.UnaryFormula) and (uses is None or uses[node] == 1):
+            node = node.operand
+            negated = not negated
+        return node, negated
+
+    def _flatten(
+        self, node: nodes.BinaryFormula, negated: bool, uses: dict[nodes.Formula, int]
+    ) -> list[_Leaf]:
+        """Return the operands of the chain of conjunctions or disjunctions rooted at `node`.
+
+        The chain only extends through subformulas which occur once, so that shared ones become
+        gates of their own.
+        """
+        conjunctive = _is_conjunctive(node, negated)
+        leaves = []
+        stack = list(reversed(_operands(node, negated)))
+        while stack:
+            child, child_negated = self._strip(*stack.pop(), uses)
+            if (
+                isinstance(child, nodes.BinaryFormula)
+                and uses[child] == 1
+                and _is_conjunctive(child, child_negated) is conjunctive
+            ):
+                stack.extend(reversed(_operands(child, child_negated)))
+            else:
+                leaves.append(self._strip(child, child_negated, None))
+        return leaves
+
+    def _gate(self, node: nodes.BinaryFormula) -> int:
+        if node not in self._gates:
+            self._gates[node] = self.new_var()
+        return self._gates[node]
+
+    def _literal(self, node: nodes.Formula, negated: bool) -> int:
+        if isinstance(node, nodes.Variable):
+            var = self.variables[node.name]
+        else:
+            var = self._gate(node)
+        return -var if negated else var
+
+    def _clause(self, leaves: Iterable[_Leaf]) -> Optional[Clause]:
+        return self._unique(self._literal(leaf, negated) for leaf, negated in leaves)
+
+    @staticmethod
+    def _unique(lits: Iterable[int]) -> Optional[Clause]:
+        """Remove duplicate literals. Return None if the clause is a tautology."""
+        clause = tuple(dict.fromkeys(lits))
+        if len(set(map(abs, clause))) < len(clause):
+            return None
+        return clause
+
+
+def write_dimacs(
+    formula: nodes.Formula,
+    file: Union[str, os.PathLike, IO[str]],
+    plaisted_greenbaum: bool = True,
+) -> TseitinEncoder:
+    """Write a CNF encoding of `formula` to `file` in the DIMACS CNF format.
+
+    `file` is a path or a text file. Clauses are streamed to the file as they're encoded, so
+    they're never all held in memory. Since the header precedes the clauses but contains their
+    number, a placeholder header is written first and rewritten at the end if the file is
+    seekable; otherwise, the clauses are encoded twice, first only to count them.
+
+    The formula's variables are listed in comment lines. Return the encoder, whose `variables`
+    map the formula's variable names to DIMACS variables.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "w", encoding="utf-8") as f:
+            return write_dimacs(formula, f, plaisted_greenbaum)
+
+    formula = interned.intern(formula)
+    seekable = file.seekable()
+    if seekable:
+        header_pos = file.tell()
+        num_vars = num_clauses = 0
+    else:
+        counter = TseitinEncoder(plaisted_greenbaum)
+        num_clauses = sum(1 for _ in counter.encode(formula))
+        num_vars = counter.num_vars
+
+    encoder = TseitinEncoder(plaisted_greenbaum)
+    clauses = encoder.encode(formula)
+    clause = next(clauses, None)  # Ensure the formula's variables are numbered.
+
+    file.write(_header(num_vars, num_clauses, seekable))
+    for name, var in encoder.variables.items():
+        file.write(f"c {var} {name}\n")
+
+    count = 0
+    while clause is not None:
+        file.write(" ".join(map(str, clause)) + " 0\n")
+        count += 1
+        clause = next(clauses, None)
+
+    if seekable:
+        end = file.tell()
+        file.seek(header_pos)
+        file.write(_header(encoder.num_vars, count, seekable))
+        file.seek(end)
+
+    return encoder
+
+
+def _header(num_vars: int, num_clauses: int, padded: bool) -> str:
+    # Pad the counts so the header can be rewritten in place. DIMACS allows extra whitespace.
+    width = 20 if padded else 0
+    return f"p cnf {num_vars:<{width}} {num_clauses:<{width}}\n"
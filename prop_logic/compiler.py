@@ -0,0 +1,141 @@
+import weakref
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional, Sequence, Union
+
+from prop_logic import interned, nodes
+from prop_logic.connectives import Conjunction, Disjunction, Implication, Negation
+
+__all__ = ("Assignment", "Evaluator", "compile_formula", "generate_source")
+
+Assignment = Union[Mapping[str, Any], Sequence[Any]]
+Evaluator = Callable[[Assignment], bool]
+
+# Subexpressions nested deeper than this are hoisted into local variables so that the generated
+# source stays within the parser's nesting limits.
+_MAX_NESTING = 50
+
+_TEMPLATES = {
+    Negation.type: "(not {})",
+    Conjunction.type: "({} and {})",
+    Disjunction.type: "({} or {})",
+    Implication.type: "(not {} or {})",
+}
+
+
+def generate_source(formula: nodes.Formula, variables: Optional[Sequence[str]] = None) -> str:
+    """Return the source of a Python function which evaluates `formula`.
+
+    The function is named `evaluate` and takes a single argument: a mapping of variable names to
+    truth values or, if `variables` is given, a sequence of truth values ordered like `variables`.
+
+    Binary formulas become short-circuiting `and`/`or` expressions. A subformula nested more
+    deeply than the parser allows, or which is shared by several parents, as in an interned
+    formula, is emitted once, separately from its parents. If it's evaluated whatever the
+    assignment is, i.e. it isn't within a right operand, it's evaluated eagerly into a local
+    variable first. Otherwise, it's a nested function which its parents call, so that it's still
+    only evaluated if short-circuiting reaches it; the result of a shared one is memoized.
+    """
+    if variables is None:
+        lookup = {}
+    else:
+        lookup = {name: f"a[{i}]" for i, name in enumerate(variables)}
+
+    order = list(nodes.iter_postorder(formula))
+    parents: dict[int, int] = {}  # Node ID -> number of references from parents.
+    for node in order:
+        for child in node.children:
+            parents[id(child)] = parents.get(id(child), 0) + 1
+
+    # IDs of the nodes which are always evaluated: the root, and the operands of negations and
+    # left operands of binary formulas which are. Parents come after their children in `order`.
+    strict = {id(formula)}
+    for node in reversed(order):
+        if id(node) in strict and node.children:
+            strict.add(id(node.children[0]))
+
+    expressions: dict[int, tuple[str, int]] = {}  # Node ID -> expression and its nesting depth.
+    lines = ["def evaluate(a):"]
+    memoized = False
+    for node in order:
+        if isinstance(node, nodes.Variable):
+            if variables is None:
+                expression = f"a[{node.name!r}]"
+            elif node.name in lookup:
+                expression = lookup[node.name]
+            else:
+                raise ValueError(f"Variable {node.name!r} is missing from the variable order.")
+            depth = 0
+        else:
+            if isinstance(node, nodes.BinaryFormula):
+                children = (expressions[id(node.left)], expressions[id(node.right)])
+            else:
+                children = (expressions[id(node.operand)],)
+
+            template = _TEMPLATES[node.connective.type]
+            expression = template.format(*(child for child, _ in children))
+            depth = 1 + max(child_depth for _, child_depth in children)
+
+            shared = parents.get(id(node), 0) > 1
+            if (depth >= _MAX_NESTING or shared) and id(node) in strict:
+                name = f"t{len(lines)}"
+                lines.append(f"    {name} = {expression}")
+                expression, depth = name, 0
+            elif depth >= _MAX_NESTING or shared:
+                key = len(lines)
+                lines.append(f"    def f{key}(): return {expression}")
+                if shared:
+                    expression = f"(m[{key}] if {key} in m else m.setdefault({key}, f{key}()))"
+                    memoized = True
+                else:
+                    expression = f"f{key}()"
+                depth = 0
+
+        expressions[id(node)] = (expression, depth)
+
+    if memoized:
+        lines.insert(1, "    m = {}")
+    lines.append(f"    return True if {expressions[id(formula)][0]} else False")
+    return "\n".join(lines) + "\n"
+
+
+# The interned equivalents of compiled formulas, by the formula's ID, each with a weak reference to
+# the formula which removes the entry once the formula is gone.
+_interned: dict[int, tuple[weakref.ref, interned.InternedFormula]] = {}
+
+
+def _intern(formula: nodes.Formula) -> interned.InternedFormula:
+    """Return the interned equivalent of `formula`, interning it only the first time."""
+    if formula in interned.interner:
+        return formula
+    key = id(formula)
+    entry = _interned.get(key)
+    if entry is not None and entry[0]() is formula:
+        return entry[1]
+
+    result = interned.intern(formula)
+    _interned[key] = (weakref.ref(formula, lambda _: _interned.pop(key, None)), result)
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _compile(formula: interned.InternedFormula, variables: Optional[tuple[str, ...]]) -> Evaluator:
+    source = generate_source(formula, variables)
+    namespace: dict[str, Any] = {}
+    exec(compile(source, f"<formula {id(formula):#x}>", "exec"), namespace)
+    return namespace["evaluate"]
+
+
+def compile_formula(formula: nodes.Formula, variables: Optional[Sequence[str]] = None) -> Evaluator:
+    """Compile `formula` into a function which evaluates it for an assignment of truth values.
+
+    If `variables` is None, the function takes a mapping of variable names to truth values.
+    Otherwise, it takes a sequence of truth values in the order of the names in `variables`,
+    which is faster. Return True if the formula is true under the assignment and False otherwise.
+
+    Compiled functions are cached per interned formula and variable order, and the interned
+    formula is cached per formula object, so compiling the same object again doesn't walk it.
+    Formulas must therefore not be modified after they're compiled.
+    """
+    if variables is not None:
+        variables = tuple(variables)
+    return _compile(_intern(formula), variables)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import total_ordering
-from typing import Any, Optional, Protocol, Type, TypeVar, cast, runtime_checkable
+from typing import Any, Callable, Optional, Protocol, Type, TypeVar, cast, runtime_checkable
 
 from prop_logic.lexer import Token, TokenType
 
@@ -33,6 +33,7 @@ class Connective(ConnectiveProtocol, type):
     """
 
     __type_connectives: dict[TokenType, Connective] = {}
+    __listeners: list[Callable[[Connective], None]] = []
 
     def __new__(mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any]) -> Connective:
         """Create a new Connective type and ensure it's uniquely associated with a TokenType."""
@@ -43,6 +44,8 @@ class Connective(ConnectiveProtocol, type):
                 raise ValueError(f"A {mcls.__name__} with type {cls.type!r} is already defined.")
             else:
                 mcls.__type_connectives[cls.type] = cls
+                for listener in mcls.__listeners:
+                    listener(cls)
         else:
             raise ValueError(f"{cls.__name__} must subtype {ConnectiveProtocol.__name__}.")
 
@@ -68,6 +71,13 @@ class Connective(ConnectiveProtocol, type):
         """Return the connective's name."""
         return cls.__name__
 
+    @classmethod
+    def subscribe(mcls, listener: Callable[[Connective], None]) -> None:  # noqa: N804
+        """Call `listener` with each Connective created so far and each one created later."""
+        mcls.__listeners.append(listener)
+        for connective in list(mcls.__type_connectives.values()):
+            listener(connective)
+
     @classmethod
     def from_token(
         mcls: Type[ConnectiveType], token: Optional[Token]  # noqa: N804
@@ -0,0 +1,304 @@
+from collections import Counter, OrderedDict
+from typing import Iterable, NamedTuple, Optional, Union
+
+from prop_logic import cnf, nodes, sat
+
+__all__ = ("CounterStats", "ModelCounter", "count_models")
+
+Clause = tuple[int, ...]
+# A component's remaining clauses, which are its cache key, and its variables.
+Component = tuple[tuple[Clause, ...], list[int]]
+
+
+class CounterStats(NamedTuple):
+    """Counters of the work done by a `ModelCounter`."""
+
+    decisions: int
+    cache_hits: int
+    cache_misses: int
+    cache_evictions: int
+    cache_entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of component lookups which were found in the cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+
+class _Frame:
+    """A count being computed.
+
+    It's either the sum of the counts of the two branches of a decision on a component, or the
+    product of the counts of the components left after a decision.
+    """
+
+    __slots__ = ("parent", "is_sum", "component", "level", "value", "pending")
+
+    def __init__(
+        self,
+        parent: Optional["_Frame"],
+        is_sum: bool,
+        component: Optional[Component],
+        level: int,
+        value: int,
+        pending: Union[list[int], list[Component]],
+    ):
+        self.parent = parent
+        self.is_sum = is_sum
+        self.component = component  # The component to count and cache, for a sum.
+        self.level = level  # The solver's decision level to branch from, for a sum.
+        self.value = value
+        self.pending = pending  # Literals to branch on or components to multiply.
+
+
+class _Clauses:
+    """CNF clauses, whose assignments are propagated by a `sat.Solver`."""
+
+    def __init__(self, clauses: list[Clause], num_vars: int):
+        self.clauses = clauses
+        self.solver = sat.Solver()
+        while self.solver.num_vars < num_vars:
+            self.solver.new_var()
+        self.consistent = True  # False if unit propagation alone finds a conflict.
+        for clause in clauses:
+            self.consistent = self.solver.add_clause(clause)
+
+        # Whether each literal is true, indexed by the literal: negative ones index from the end.
+        self.true = [False] * (2 * num_vars + 1)
+        for var in range(1, num_vars + 1):
+            value = self.solver.value(var)
+            if value is not None:
+                self.true[var if value else -var] = True
+        self._assigned: list[list[int]] = []  # Literals assigned at each decision level.
+
+        self.occurrences: list[list[int]] = [[] for _ in range(num_vars + 1)]
+        for i, clause in enumerate(clauses):
+            for lit in clause:
+                self.occurrences[abs(lit)].append(i)
+        # Marks of the variables and clauses visited by each `split`.
+        self._var_marks = [0] * (num_vars + 1)
+        self._clause_marks = [0] * len(clauses)
+        self._mark = 0
+
+    @property
+    def level(self) -> int:
+        """Return the number of decision levels opened by `assume`."""
+        return len(self._assigned)
+
+    def assume(self, lit: int) -> bool:
+        """Assign `lit` at a new decision level and propagate it. Return False on a conflict."""
+        assigned = self.solver.assume(lit)
+        if assigned is None:
+            self._assigned.append([])
+            return False
+        true = self.true
+        for lit in assigned:
+            true[lit] = True
+        self._assigned.append(assigned)
+        return True
+
+    def backtrack(self, level: int) -> None:
+        """Undo the assignments of the decision levels above `level`."""
+        if level >= len(self._assigned):
+            return
+        true = self.true
+        for assigned in self._assigned[level:]:
+            for lit in assigned:
+                true[lit] = False
+        del self._assigned[level:]
+        self.solver.backtrack(level)
+
+    def split(self, variables: Iterable[int]) -> tuple[int, list[Component]]:
+        """Split the clauses on `variables` which aren't satisfied yet into components.
+
+        Return the number of unassigned variables in none of these clauses, which are free, and
+        the connected components of the clauses, which share no variables.
+        """
+        self._mark += 1
+        mark = self._mark
+        var_marks = self._var_marks
+        clause_marks = self._clause_marks
+        clauses = self.clauses
+        occurrences = self.occurrences
+        true = self.true
+
+        free = 0
+        components = []
+        for var in variables:
+            if var_marks[var] == mark or true[var] or true[-var]:
+                continue
+            var_marks[var] = mark
+            component_vars = [var]
+            remaining = []
+            for var in component_vars:  # Grows as the component is searched.
+                for i in occurrences[var]:
+                    if clause_marks[i] == mark:
+                        continue
+                    clause_marks[i] = mark
+                    unassigned = []
+                    for lit in clauses[i]:
+                        if true[lit]:
+                            break
+                        elif not true[-lit]:
+                            unassigned.append(lit)
+                    else:
+                        remaining.append(tuple(unassigned))
+                        for lit in unassigned:
+                            if var_marks[abs(lit)] != mark:
+                                var_marks[abs(lit)] = mark
+                                component_vars.append(abs(lit))
+            if remaining:
+                remaining.sort()
+                components.append((tuple(remaining), component_vars))
+            else:
+                free += 1
+        return free, components
+
+    def branch_variable(self, component: Component) -> int:
+        """Return the variable of `component` to branch on.
+
+        Variables are scored by their occurrences in the component plus their activity in
+        conflicts (VSADS), which favours both splitting the component and failing early.
+        """
+        occurrences = Counter(abs(lit) for clause in component[0] for lit in clause)
+        activity = self.solver.activity
+        return max(occurrences, key=lambda var: occurrences[var] + activity(var))
+
+
+class ModelCounter:
+    """Exact model counter (#SAT) of formulas and CNF clauses.
+
+    The counter is a DPLL search, which splits the clauses left after each decision into
+    connected components that share no variables, and multiplies their counts. Decisions are
+    propagated incrementally by the watched literals of a `sat.Solver`, and branch on the
+    variable with the most occurrences in the component plus conflict activity (VSADS). The
+    count of each component is cached, so a component which recurs under different decisions is
+    only counted once. The search is iterative, so it isn't bounded by the recursion limit.
+
+    Clauses aren't learnt, so the search is exponential in the worst case. Random 3-CNF near the
+    satisfiability threshold of 4.26 clauses per variable is counted in about a second with 100
+    variables and about 10 seconds with 150. Underconstrained formulas are much harder, since
+    they have many models and few components: with 2 clauses per variable, 50 variables take a
+    few seconds, each 5 more take about 3 times as long, and 80 are out of reach.
+
+    The cache holds up to `cache_size` literals of components; the least recently used ones are
+    evicted beyond that. It's kept between counts, and `stats` reports the decisions and cache
+    hit rate so far, to tune `cache_size`.
+    """
+
+    def __init__(self, cache_size: int = 1 << 20):
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be at least 0, not {cache_size}.")
+
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[Clause, ...], int] = OrderedDict()
+        self._cached_literals = 0
+
+        self._decisions = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> CounterStats:
+        """Return counters of the work done so far."""
+        return CounterStats(
+            self._decisions, self._hits, self._misses, self._evictions, len(self._cache)
+        )
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        self._cache.clear()
+        self._cached_literals = 0
+
+    def count(self, formula: nodes.Formula) -> int:
+        """Return the number of models of `formula`.
+
+        Models are assignments of truth values to the formula's variables which satisfy it. The
+        formula is encoded into CNF with a full Tseitin encoding, whose auxiliary variables
+        are determined by the formula's variables, so it has the same number of models.
+        """
+        encoder = cnf.TseitinEncoder(plaisted_greenbaum=False)
+        clauses = list(encoder.encode(formula))
+        return self.count_clauses(clauses, encoder.num_vars)
+
+    def count_clauses(self, clauses: Iterable[Iterable[int]], num_vars: int) -> int:
+        """Return the number of models of `clauses`, given as iterables of DIMACS literals.
+
+        Models are assignments of truth values to the variables 1 to `num_vars`.
+        """
+        normalized = []
+        for clause in clauses:
+            lits = set(clause)
+            for lit in lits:
+                if not 0 < abs(lit) <= num_vars:
+                    raise ValueError(f"Literal {lit} is out of range.")
+            if not any(-lit in lits for lit in lits):  # Skip tautologies.
+                normalized.append(tuple(sorted(lits)))
+
+        formula = _Clauses(normalized, num_vars)
+        if not formula.consistent:
+            return 0
+        cache = self._cache
+        free, components = formula.split(range(1, num_vars + 1))
+        frame = _Frame(None, False, None, 0, 1 << free, components)
+        value: Optional[int] = None  # A count to add to or multiply into `frame`.
+        while True:
+            if value is not None:
+                if frame.is_sum:
+                    frame.value += value
+                else:
+                    frame.value *= value
+                    if not value:
+                        frame.pending.clear()
+                value = None
+
+            if not frame.pending:
+                if frame.is_sum:
+                    formula.backtrack(frame.level)
+                    self._store(frame.component[0], frame.value)
+                value = frame.value
+                frame = frame.parent
+                if frame is None:
+                    return value
+
+            elif frame.is_sum:
+                formula.backtrack(frame.level)
+                if formula.assume(frame.pending.pop()):
+                    free, components = formula.split(frame.component[1])
+                    if components:
+                        frame = _Frame(frame, False, None, 0, 1 << free, components)
+                    else:
+                        value = 1 << free
+                else:
+                    value = 0
+
+            else:
+                component = frame.pending.pop()
+                cached = cache.get(component[0])
+                if cached is not None:
+                    self._hits += 1
+                    cache.move_to_end(component[0])
+                    value = cached
+                else:
+                    self._misses += 1
+                    self._decisions += 1
+                    var = formula.branch_variable(component)
+                    frame = _Frame(frame, True, component, formula.level, 0, [var, -var])
+
+    def _store(self, key: tuple[Clause, ...], count: int) -> None:
+        size = sum(map(len, key))
+        if size > self.cache_size:
+            return
+        self._cache[key] = count
+        self._cached_literals += size
+        while self._cached_literals > self.cache_size:
+            evicted, _ = self._cache.popitem(last=False)
+            self._cached_literals -= sum(map(len, evicted))
+            self._evictions += 1
+
+
+def count_models(formula: nodes.Formula, cache_size: int = 1 << 20) -> int:
+    """Return the number of models of `formula`, counted by a new `ModelCounter`."""
+    return ModelCounter(cache_size).count(formula)
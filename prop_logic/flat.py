@@ -0,0 +1,206 @@
+import enum
+from array import array
+from typing import IO, Iterator, Mapping, NamedTuple, Optional, Union
+
+from prop_logic import nodes
+from prop_logic.compiler import Assignment
+from prop_logic.connectives import Conjunction, Disjunction, Implication, Negation
+from prop_logic.symbols import SymbolTable
+
+__all__ = ("Opcode", "FlatFormula")
+
+
+class Opcode(enum.IntEnum):
+    """The kind of a node of a `FlatFormula`."""
+
+    VARIABLE = 0
+    NOT = 1
+    AND = 2
+    OR = 3
+    IMPLIES = 4
+
+
+_CONNECTIVES = {
+    Opcode.NOT: Negation,
+    Opcode.AND: Conjunction,
+    Opcode.OR: Disjunction,
+    Opcode.IMPLIES: Implication,
+}
+_OPCODES = {connective.type: opcode for opcode, connective in _CONNECTIVES.items()}
+
+
+class FlatFormula(NamedTuple):
+    """A propositional formula stored as parallel arrays of its nodes in post-order.
+
+    Node i has the opcode `ops[i]`. For a variable, `args[i]` is the index of its name in `names`;
+    for a negation, it's the index of the operand, and for a binary formula, the index of the left
+    operand. The right operand of a binary formula, like the operand of a negation, is always the
+    preceding node, and the root is the last node.
+
+    Each node takes 5 bytes, compared to hundreds for a `nodes.Formula` object, and the arrays
+    pickle as raw bytes. The arrays may also be memoryviews of the same types, e.g. of a file.
+    """
+
+    ops: Union[array, memoryview]
+    args: Union[array, memoryview]
+    names: list[str]
+
+    @classmethod
+    def from_formula(cls, formula: nodes.Formula) -> "FlatFormula":
+        """Return the flat representation of `formula`.
+
+        The formula is flattened as a tree, so a subformula object which is shared by several
+        parents, as in an interned formula, is stored once per occurrence.
+        """
+        ops = array("B")
+        args = array("I")
+        names: list[str] = []
+        name_indices: dict[str, int] = {}
+        opcodes = _OPCODES
+
+        # Each entry is a node and its state: -1 if its operands are yet to be pushed, 1 once its
+        # left operand has been flattened, and 0 once all its operands have been.
+        stack: list[tuple[nodes.Formula, int]] = [(formula, -1)]
+        lefts: list[int] = []  # Indices of the left operands of binary formulas being flattened.
+        while stack:
+            node, state = stack.pop()
+            if isinstance(node, nodes.Variable):
+                if node.name not in name_indices:
+                    name_indices[node.name] = len(names)
+                    names.append(node.name)
+                ops.append(Opcode.VARIABLE)
+                args.append(name_indices[node.name])
+            elif state == -1:
+                stack.append((node, 0))
+                if isinstance(node, nodes.BinaryFormula):
+                    stack.append((node.right, -1))
+                    stack.append((node, 1))  # Records the index of the left operand.
+                    stack.append((node.left, -1))
+                else:
+                    stack.append((node.operand, -1))
+                continue
+            elif state == 1:
+                lefts.append(len(ops) - 1)
+                continue
+            elif isinstance(node, nodes.BinaryFormula):
+                ops.append(opcodes[node.connective.type])
+                args.append(lefts.pop())
+            else:
+                ops.append(Opcode.NOT)
+                args.append(len(ops) - 2)
+
+        return cls(ops, args, names)
+
+    def to_formula(self, symbols: Optional[SymbolTable] = None) -> nodes.Formula:
+        """Return the formula as a tree of `nodes.Formula` objects.
+
+        Occurrences of the same variable share a single `nodes.Variable`. If `symbols` is given,
+        variable names are interned into it and variables carry their IDs.
+        """
+        if symbols is None:
+            variables = [nodes.Variable(name) for name in self.names]
+        else:
+            variables = [nodes.Variable(name, symbols.intern(name)) for name in self.names]
+        connectives = _CONNECTIVES
+        stack: list[nodes.Formula] = []
+        for op, arg in zip(self.ops, self.args):
+            if op == Opcode.VARIABLE:
+                stack.append(variables[arg])
+            elif op == Opcode.NOT:
+                stack.append(nodes.UnaryFormula(Negation, stack.pop()))
+            else:
+                right = stack.pop()
+                stack.append(nodes.BinaryFormula(stack.pop(), connectives[op], right))
+        return stack.pop()
+
+    @property
+    def size(self) -> int:
+        """Return the number of nodes."""
+        return len(self.ops)
+
+    @property
+    def root(self) -> int:
+        """Return the index of the root node."""
+        return len(self.ops) - 1
+
+    def children(self, index: int) -> tuple[int, ...]:
+        """Return the indices of the operands of node `index`."""
+        op = self.ops[index]
+        if op == Opcode.VARIABLE:
+            return ()
+        elif op == Opcode.NOT:
+            return (self.args[index],)
+        else:
+            return self.args[index], index - 1
+
+    def evaluate(self, assignment: Assignment) -> bool:
+        """Return the truth value of the formula under `assignment`.
+
+        `assignment` is a mapping of variable names to truth values or a sequence of truth values
+        ordered like `names`.
+        """
+        if isinstance(assignment, Mapping):
+            missing = [name for name in self.names if name not in assignment]
+            if missing:
+                raise ValueError(f"Variable {missing[0]!r} is missing from the assignment.")
+            values = [bool(assignment[name]) for name in self.names]
+        else:
+            if len(assignment) != len(self.names):
+                raise ValueError(
+                    f"Expected {len(self.names)} truth values but got {len(assignment)}."
+                )
+            values = [bool(value) for value in assignment]
+
+        stack: list[bool] = []
+        push, pop = stack.append, stack.pop
+        for op, arg in zip(self.ops, self.args):
+            if op == 0:  # Opcode.VARIABLE
+                push(values[arg])
+            elif op == 1:  # Opcode.NOT
+                push(not pop())
+            else:
+                right = pop()
+                left = pop()
+                if op == 2:  # Opcode.AND
+                    push(left and right)
+                elif op == 3:  # Opcode.OR
+                    push(left or right)
+                else:
+                    push(not left or right)
+        return stack[-1]
+
+    def _iter_pieces(self) -> Iterator[str]:
+        """Yield the pieces of the formula's string, which match those of `nodes.Formula`."""
+        ops, args, names = self.ops, self.args, self.names
+        stack: list[Union[int, str]] = [len(ops) - 1]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+                continue
+
+            op = ops[item]
+            if op == Opcode.VARIABLE:
+                yield names[args[item]]
+            elif op == Opcode.NOT:
+                yield Negation.lexeme
+                stack.append(args[item])
+            else:
+                yield "("
+                stack.append(")")
+                stack.append(item - 1)
+                stack.append(f" {_CONNECTIVES[op].lexeme} ")
+                stack.append(args[item])
+
+    def __str__(self) -> str:
+        return "".join(self._iter_pieces())
+
+    def write(self, file: IO[str]) -> None:
+        """Write the formula's string to the text `file` without building it in memory."""
+        buffer = []
+        for piece in self._iter_pieces():
+            buffer.append(piece)
+            if len(buffer) >= 4096:
+                file.write("".join(buffer))
+                buffer.clear()
+        file.write("".join(buffer))
@@ -0,0 +1,239 @@
+from typing import Optional
+
+from prop_logic import nodes
+from prop_logic.connectives import BinaryConnective, Connective, UnaryConnective
+from prop_logic.lexer import Token, TokenType, lex, scan
+from prop_logic.parser import IterativeParser
+from prop_logic.symbols import SymbolTable
+
+__all__ = ("IncrementalParser", "EditableFormula")
+
+# The index of a group's left parenthesis -> the index of its right parenthesis and its formula.
+Groups = dict[int, tuple[int, nodes.Formula]]
+
+
+class IncrementalParser(IterativeParser):
+    """Parser which reuses the formulas of parenthesised groups from a previous parse.
+
+    A group is parsed independently of its surroundings, so if its tokens are unchanged, so is
+    its formula. `groups` maps the indices of the left parentheses of such groups to the indices
+    of their right parentheses and their formulas; when the parser reaches one, it skips to the
+    end of the group instead of parsing it. After parsing, `groups` also has the groups which
+    were parsed.
+    """
+
+    def __init__(
+        self,
+        tokens: list[Token],
+        groups: Optional[Groups] = None,
+        symbols: Optional[SymbolTable] = None,
+    ):
+        self._tokens = tokens
+        self.index = -1
+        self.groups: Groups = {} if groups is None else groups
+        super().__init__(symbols=symbols)
+
+    def next(self) -> Optional[Token]:
+        """Save and return the next token."""
+        self.index += 1
+        self.token = self._tokens[self.index] if self.index < len(self._tokens) else None
+        return self.token
+
+    def _skip_to(self, index: int) -> None:
+        self.index = index - 1
+        self.next()
+
+    def parse(self) -> nodes.Formula:
+        """Parse tokens into an abstract syntax tree representing a propositional formula.
+
+        This is the shunting-yard parser of `IterativeParser`, which additionally records and
+        reuses groups.
+        """
+        groups = self.groups
+        operands: list[nodes.Formula] = []
+        operators: list[tuple[Optional[Connective], int]] = []  # Connectives and their arity.
+        starts: list[int] = []  # Indices of the left parentheses of unclosed groups.
+
+        while True:
+            # Parse a term; push any unary connectives or left parentheses that precede it.
+            token = self.token
+            if self.accept(TokenType.VARIABLE):
+                operands.append(self.variable(token.value))
+            elif token and token.type is TokenType.PARENTHESIS_LEFT and self.index in groups:
+                end, formula = groups[self.index]
+                operands.append(formula)
+                self._skip_to(end + 1)
+            elif self.accept(TokenType.PARENTHESIS_LEFT):
+                operators.append((None, 0))
+                starts.append(self.index - 1)
+                continue
+            elif connective := UnaryConnective.from_token(token):
+                self.next()  # Consume unary connective token.
+                operators.append((connective, 1))
+                continue
+            else:
+                raise ValueError(f"Unexpected token {token}")
+
+            # Close any groups which follow the term.
+            while True:
+                self._reduce_unary(operands, operators)
+                if starts and self.token and self.token.type is TokenType.PARENTHESIS_RIGHT:
+                    self._reduce_binary(operands, operators, 0)
+                    operators.pop()  # Discard the left parenthesis.
+                    groups[starts.pop()] = (self.index, operands[-1])
+                    self.next()
+                else:
+                    break
+
+            token = self.token
+            if connective := BinaryConnective.from_token(token):
+                self.next()  # Consume binary connective token.
+                self._reduce_binary(operands, operators, connective.precedence)
+                operators.append((connective, 2))
+            elif starts:
+                self.expect(TokenType.PARENTHESIS_RIGHT)  # Raises due to the mismatch.
+            elif token is not None:
+                raise ValueError(f"Syntax error: unexpected token {token.value!r}")
+            else:
+                self._reduce_binary(operands, operators, 0)
+                return operands.pop()
+
+
+class EditableFormula:
+    """The text of a formula and its parse, which are updated incrementally by edits.
+
+    An edit only re-lexes the text from the token before the edit until the tokens are the same
+    as before again, and only re-parses the groups which contain changed tokens, and the formula
+    outside groups. The resulting tokens and formula are identical to those of a full parse.
+
+    The positions of the tokens after an edit are shifted lazily: only the tokens between two
+    consecutive edits are rebuilt, and `tokens` rebuilds the rest when it's read.
+
+    If the text fails to lex or parse, `edit` raises the ValueError and `formula` is None until
+    an edit fixes the text. The error is the first one in the text, as for a full parse.
+    """
+
+    def __init__(self, text: str):
+        self.text = ""
+        self.formula: Optional[nodes.Formula] = None
+        self._tokens: Optional[list[Token]] = None
+        # The tokens from index `_shift_from` on start `_shift` characters after their `pos`.
+        self._shift_from = 0
+        self._shift = 0
+        self._groups: Groups = {}
+        self.edit(0, 0, text)
+
+    @property
+    def tokens(self) -> Optional[list[Token]]:
+        """Return the tokens of the text, or None if it fails to lex."""
+        if self._tokens is not None:
+            self._move_shift(self._tokens, len(self._tokens))
+        return self._tokens
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> nodes.Formula:
+        """Replace `deleted` characters at `offset` by `inserted` and return the new formula."""
+        if not 0 <= offset <= len(self.text) or not 0 <= deleted <= len(self.text) - offset:
+            raise ValueError(f"Edit at {offset} of {deleted} characters is out of range.")
+
+        tokens = self._tokens
+        self.text = self.text[:offset] + inserted + self.text[offset + deleted :]
+        self.formula = None
+        self._tokens = None
+
+        try:
+            if tokens is None:
+                tokens = list(lex(self.text))
+                self._shift_from, self._shift = 0, 0
+                groups: Groups = {}
+            else:
+                start, old_end, new_end = self._relex(tokens, offset, deleted, len(inserted))
+                # Keep the groups which are entirely before or after the changed tokens.
+                shift = new_end - old_end
+                groups = {}
+                for first, (last, formula) in self._groups.items():
+                    if last < start:
+                        groups[first] = (last, formula)
+                    elif first >= old_end:
+                        groups[first + shift] = (last + shift, formula)
+        except ValueError:
+            # A full parse lexes lazily, so it may fail on a syntax error before the unknown
+            # character; raise that error instead.
+            IterativeParser(lex(self.text)).parse()
+            raise
+
+        self._tokens = tokens
+        self._groups = groups
+        self.formula = IncrementalParser(tokens, groups).parse()
+        return self.formula
+
+    def _pos(self, tokens: list[Token], index: int) -> int:
+        """Return the position of the token at `index`, including the pending shift."""
+        return tokens[index].pos + (self._shift if index >= self._shift_from else 0)
+
+    def _move_shift(self, tokens: list[Token], index: int) -> None:
+        """Rebuild the tokens between the pending shift and `index`, and move the shift there."""
+        shift = self._shift
+        if shift and index > self._shift_from:
+            for i in range(self._shift_from, index):
+                token = tokens[i]
+                tokens[i] = Token(token.type, token.value, token.pos + shift)
+        elif shift and index < self._shift_from:
+            for i in range(index, self._shift_from):
+                token = tokens[i]
+                tokens[i] = Token(token.type, token.value, token.pos - shift)
+        self._shift_from = index
+
+    def _first_token_ending_at(self, tokens: list[Token], offset: int) -> int:
+        """Return the index of the first token which ends at or after `offset`."""
+        low, high = 0, len(tokens)
+        while low < high:
+            middle = (low + high) // 2
+            if self._pos(tokens, middle) + len(tokens[middle].value) < offset:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _relex(
+        self, tokens: list[Token], offset: int, deleted: int, inserted: int
+    ) -> tuple[int, int, int]:
+        """Re-lex the text around an edit and replace the changed tokens in `tokens`.
+
+        Return the index of the first changed token, and the indices after the last changed
+        token in the old and new tokens.
+        """
+        text = self.text
+        delta = inserted - deleted
+        edit_end = offset + deleted  # In the old text.
+
+        # Start at the token the edit touches, which may merge with inserted text.
+        start = self._first_token_ending_at(tokens, offset)
+        pos = min(self._pos(tokens, start), offset) if start < len(tokens) else offset
+
+        relexed = []
+        old = start  # Index of the first old token which could be at the current position.
+        for type_, match in scan(text, pos):
+            if type_ is TokenType.WHITESPACE:
+                continue
+            elif type_ is None:
+                i = match.start()
+                raise ValueError(f"Unknown character {text[i]!r} at position {i}.")
+
+            # Stop once a token starts where an old token after the edit did, since the rest of
+            # the text, and hence its tokens, are the same.
+            old_pos = match.start() - delta
+            while old < len(tokens) and self._pos(tokens, old) < old_pos:
+                old += 1
+            if old_pos >= edit_end and old < len(tokens) and self._pos(tokens, old) == old_pos:
+                break
+            relexed.append(Token(type_, match.group(), match.start()))
+        else:
+            old = len(tokens)
+
+        # Only the tokens from `old` on are shifted by the edit: move the pending shift there, so
+        # that it can be increased by the edit's shift, and replace the changed tokens.
+        self._move_shift(tokens, old)
+        self._shift += delta
+        tokens[start:old] = relexed
+        self._shift_from = start + len(relexed)
+        return start, old, start + len(relexed)
@@ -0,0 +1,224 @@
+import sys
+import weakref
+from dataclasses import FrozenInstanceError
+from typing import Any, Hashable, TypeVar, Union
+
+from prop_logic import nodes
+from prop_logic.connectives import BinaryConnective, UnaryConnective
+
+__all__ = (
+    "InternedUnaryFormula",
+    "InternedBinaryFormula",
+    "InternedVariable",
+    "InternedFormula",
+    "Interner",
+    "interner",
+    "intern",
+)
+
+_T = TypeVar("_T")
+
+
+class _Interned:
+    """Mixin for immutable, hash-consed nodes.
+
+    Instances are only created by an `Interner`, which guarantees that structurally equal nodes
+    it creates are the same object. Equality is therefore an identity check, and the hash is
+    computed once from the (already cached) hashes of the children. An interned node is never
+    equal to a plain `nodes` node, even a structurally equal one; intern both to compare them.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _Interned):
+            return self is other
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __copy__(self) -> "_Interned":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "_Interned":
+        return self
+
+
+class InternedUnaryFormula(_Interned, nodes.UnaryFormula):
+    """An immutable, hash-consed `UnaryFormula`."""
+
+    __slots__ = ("_hash",)
+
+    def __reduce__(self) -> tuple:
+        return _unpickle_unary, (self.connective, self.operand)
+
+
+class InternedBinaryFormula(_Interned, nodes.BinaryFormula):
+    """An immutable, hash-consed `BinaryFormula`."""
+
+    __slots__ = ("_hash",)
+
+    def __reduce__(self) -> tuple:
+        return _unpickle_binary, (self.left, self.connective, self.right)
+
+
+class InternedVariable(_Interned, nodes.Variable):
+    """An immutable, hash-consed `Variable`."""
+
+    __slots__ = ("_hash",)
+
+    def __reduce__(self) -> tuple:
+        return _unpickle_variable, (self.name,)
+
+
+InternedFormula = Union[InternedUnaryFormula, InternedBinaryFormula, InternedVariable]
+
+
+def _new(cls: type[_T], hash_: int, **fields: object) -> _T:
+    """Create an instance of an interned node type, bypassing its immutability."""
+    node = object.__new__(cls)
+    for name, value in fields.items():
+        object.__setattr__(node, name, value)
+    object.__setattr__(node, "_hash", hash_)
+    return node
+
+
+class Interner:
+    """Factory of hash-consed nodes.
+
+    Structurally equal nodes created by the same interner are the same object. Nodes are held
+    weakly, so they are discarded once no formula references them anymore. Nodes from different
+    interners are never equal.
+    """
+
+    def __init__(self):
+        self._table: weakref.WeakValueDictionary[Hashable, Any] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Return the number of live nodes in the table."""
+        return len(self._table)
+
+    def __contains__(self, node: object) -> bool:
+        """Return True if `node` was created by this interner."""
+        if isinstance(node, _Interned):
+            return self._table.get(self._key(node)) is node
+        else:
+            return False
+
+    @staticmethod
+    def _key(node: _Interned) -> Hashable:
+        if isinstance(node, nodes.BinaryFormula):
+            return node.connective.type.name, node.left, node.right
+        elif isinstance(node, nodes.UnaryFormula):
+            return node.connective.type.name, node.operand
+        else:
+            return node.name
+
+    def variable(self, name: str) -> InternedVariable:
+        """Return the variable named `name`."""
+        node = self._table.get(name)
+        if node is None:
+            name = sys.intern(name)
+            node = _new(InternedVariable, hash(name), name=name, id=None)
+            self._table[name] = node
+        return node
+
+    def unary(self, connective: UnaryConnective, operand: nodes.Formula) -> InternedUnaryFormula:
+        """Return the unary formula `connective` `operand`."""
+        if operand not in self:
+            operand = self.intern(operand)
+
+        return self._unary(connective, operand)
+
+    def _unary(self, connective: UnaryConnective, operand: InternedFormula) -> InternedUnaryFormula:
+        key = (connective.type.name, operand)
+        node = self._table.get(key)
+        if node is None:
+            node = _new(InternedUnaryFormula, hash(key), connective=connective, operand=operand)
+            self._table[key] = node
+        return node
+
+    def binary(
+        self, left: nodes.Formula, connective: BinaryConnective, right: nodes.Formula
+    ) -> InternedBinaryFormula:
+        """Return the binary formula `left` `connective` `right`."""
+        if left not in self:
+            left = self.intern(left)
+        if right not in self:
+            right = self.intern(right)
+
+        return self._binary(left, connective, right)
+
+    def _binary(
+        self, left: InternedFormula, connective: BinaryConnective, right: InternedFormula
+    ) -> InternedBinaryFormula:
+        key = (connective.type.name, left, right)
+        node = self._table.get(key)
+        if node is None:
+            node = _new(
+                InternedBinaryFormula,
+                hash(key),
+                left=left,
+                connective=connective,
+                right=right,
+            )
+            self._table[key] = node
+        return node
+
+    def intern(self, formula: nodes.Formula) -> InternedFormula:
+        """Return the hash-consed equivalent of `formula`.
+
+        Repeated subformulas of `formula` become the same object. The conversion is iterative, so
+        `formula` may be nested arbitrarily deeply.
+        """
+        if formula in self:
+            return formula
+
+        interned: dict[int, InternedFormula] = {}
+        for node in nodes.iter_postorder(formula):
+            if isinstance(node, _Interned) and node in self:
+                result = node
+            elif isinstance(node, nodes.BinaryFormula):
+                result = self._binary(
+                    interned[id(node.left)], node.connective, interned[id(node.right)]
+                )
+            elif isinstance(node, nodes.UnaryFormula):
+                result = self._unary(node.connective, interned[id(node.operand)])
+            elif isinstance(node, nodes.Variable):
+                result = self.variable(node.name)
+            else:
+                raise TypeError(f"Cannot intern {node!r}: unsupported node type.")
+            interned[id(node)] = result
+
+        return interned[id(formula)]
+
+
+interner = Interner()
+
+
+def intern(formula: nodes.Formula) -> InternedFormula:
+    """Return the hash-consed equivalent of `formula` using the default interner."""
+    return interner.intern(formula)
+
+
+# Unpickled nodes are recreated by the default interner.
+def _unpickle_unary(connective: UnaryConnective, operand: nodes.Formula) -> InternedUnaryFormula:
+    return interner.unary(connective, operand)
+
+
+def _unpickle_binary(
+    left: nodes.Formula, connective: BinaryConnective, right: nodes.Formula
+) -> InternedBinaryFormula:
+    return interner.binary(left, connective, right)
+
+
+def _unpickle_variable(name: str) -> InternedVariable:
+    return interner.variable(name)
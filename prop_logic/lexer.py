@@ -1,8 +1,22 @@
 import enum
 import re
-from typing import Iterator, NamedTuple
+from array import array
+from typing import Iterator, NamedTuple, Optional, TextIO, Union
 
-__all__ = ("TokenType", "Token", "lex")
+__all__ = (
+    "DEFAULT_CHUNK_SIZE",
+    "TOKEN_CODES",
+    "TOKEN_TYPES",
+    "TokenType",
+    "Token",
+    "TokenArray",
+    "lex",
+    "lex_array",
+    "lex_stream",
+    "scan",
+)
+
+DEFAULT_CHUNK_SIZE = 1 << 16
 
 
 class TokenType(enum.Enum):
@@ -39,16 +53,196 @@ class Token(NamedTuple):
         return f"{name}(type={self.type.name}, value={self.value!r}, pos={self.pos})"
 
 
+def _compile_master_pattern() -> re.Pattern:
+    """Combine the patterns of all token types into a single alternation of named groups.
+
+    Alternatives are tried in the order the token types are defined, so the first type whose
+    pattern matches at a position wins, just like trying each type in turn. A final catch-all
+    group matches any other single character so that unknown characters can be reported.
+    """
+    groups = (f"(?P<{token_type.name}>{token_type.value.pattern})" for token_type in TokenType)
+    return re.compile("|".join((*groups, r"(?P<ERROR>.)")), re.DOTALL)
+
+
+def _compile_bytes_pattern() -> re.Pattern:
+    """Compile the master pattern for lexing ASCII bytes.
+
+    Any byte outside ASCII is matched by the first group, so it's an unknown character; the
+    UTF-8 encodings of the non-ASCII alternatives of the token patterns thus never match.
+    """
+    groups = (
+        f"(?P<{token_type.name}>{token_type.value.pattern})".encode() for token_type in TokenType
+    )
+    return re.compile(
+        b"|".join((rb"(?P<NON_ASCII>[\x80-\xff])", *groups, rb"(?P<ERROR>.)")), re.DOTALL
+    )
+
+
+_MASTER_PATTERN = _compile_master_pattern()
+_BYTES_PATTERN = _compile_bytes_pattern()
+_GROUP_TYPES = {token_type.name: token_type for token_type in TokenType}
+# The token type of each group of the patterns, by the group's index.
+_INDEX_TYPES = (None, *TokenType, None)
+_BYTES_INDEX_TYPES = (None, None, *TokenType, None)
+
+
+def scan(
+    text: Union[str, bytes], pos: int = 0, endpos: Optional[int] = None
+) -> Iterator[tuple[Optional[TokenType], re.Match]]:
+    """Yield the lexemes of `text` from `pos` to `endpos` as matches and their token types.
+
+    Whitespace is included, and the type of an unknown character is None. `text` may also be a
+    bytes-like object such as a memory map, whose lexemes are ASCII bytes; non-ASCII bytes are
+    unknown characters, so that text which contains them can be decoded and lexed instead.
+    """
+    if isinstance(text, str):
+        pattern, types = _MASTER_PATTERN, _INDEX_TYPES
+    else:
+        pattern, types = _BYTES_PATTERN, _BYTES_INDEX_TYPES
+    endpos = len(text) if endpos is None else endpos
+    for match in pattern.finditer(text, pos, endpos):
+        yield types[match.lastindex], match
+
+
 def lex(formula: str) -> Iterator[Token]:
     """Lex a propositional formula and yield tokens."""
-    i = 0
-    while i < len(formula):
-        for token_type in TokenType:
-            match = token_type.value.match(formula, i)
-            if match:
-                if token_type is not TokenType.WHITESPACE:
-                    yield Token(token_type, match[0], i)
-                i = match.end(0)
-                break
+    types = _GROUP_TYPES
+    for match in _MASTER_PATTERN.finditer(formula):
+        group = match.lastgroup
+        if group == "WHITESPACE":
+            continue
+        elif group == "ERROR":
+            i = match.start()
+            raise ValueError(f"Unknown character {formula[i]!r} at position {i}.")
         else:
+            yield Token(types[group], match.group(), match.start())
+
+
+def lex_stream(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Token]:
+    """Lex a propositional formula read from a text stream and yield tokens.
+
+    The stream is read in chunks of `chunk_size` characters, and each chunk is lexed once, so
+    only the current chunk and the token being lexed are held in memory. The tokens, including
+    their positions, are the same as those of `lex` on the whole text.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}.")
+
+    types = _GROUP_TYPES
+    variable_pattern = TokenType.VARIABLE.value
+    held = ""  # A "/" or "\\" which ended the previous chunk and may start a token.
+    parts: list[str] = []  # The parts of a variable which may continue in the next chunk.
+    variable_pos = 0
+    offset = 0  # The position of the start of `text` in the stream.
+    eof = False
+    while not eof:
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        text = held + chunk
+        pos = 0
+
+        if parts:
+            match = variable_pattern.match(text)
+            pos = match.end() if match else 0
+            parts.append(text[:pos])
+            if pos == len(text) and not eof:
+                offset += pos
+                continue
+            yield Token(TokenType.VARIABLE, "".join(parts), variable_pos)
+            parts = []
+
+        held = ""
+        for match in _MASTER_PATTERN.finditer(text, pos):
+            group = match.lastgroup
+            # Whitespace and other tokens can't continue in the next chunk, and whitespace is
+            # dropped anyway, but a variable may, and "/" and "\\" may start "/\\" or "\\/".
+            if match.end() == len(text) and not eof:
+                if group == "VARIABLE":
+                    parts.append(match.group())
+                    variable_pos = offset + match.start()
+                    break
+                elif group == "ERROR" and match.group() in "/\\":
+                    held = match.group()
+                    break
+
+            if group == "WHITESPACE":
+                continue
+            elif group == "ERROR":
+                i = match.start()
+                raise ValueError(f"Unknown character {text[i]!r} at position {offset + i}.")
+            else:
+                yield Token(types[group], match.group(), offset + match.start())
+
+        offset += len(text) - len(held)
+
+
+#: The token types by their code in a `TokenArray`, which is their index in the definition order.
+TOKEN_TYPES = tuple(TokenType)
+#: The code of each token type in a `TokenArray`.
+TOKEN_CODES = {type_: code for code, type_ in enumerate(TOKEN_TYPES)}
+_WHITESPACE_CODE = TOKEN_CODES[TokenType.WHITESPACE]
+# The code of each group of the master pattern, by the group's index; the last is ERROR.
+_GROUP_CODES = (None, *range(len(TOKEN_TYPES)), None)
+
+
+class TokenArray:
+    """The tokens of a formula as parallel arrays rather than `Token` objects.
+
+    `types` holds the code of each token's type, as in `TOKEN_CODES`, and `starts` and `ends`
+    hold the offsets of its lexeme in `text`. Values are only sliced from `text` when they're
+    accessed.
+    """
+
+    __slots__ = ("text", "types", "starts", "ends")
+
+    def __init__(self, text: str, types: array, starts: array, ends: array):
+        self.text = text
+        self.types = types
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:
+        """Return the number of tokens."""
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        """Return the token at `index` as a `Token`."""
+        return Token(TOKEN_TYPES[self.types[index]], self.value(index), self.starts[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        """Yield the tokens as `Token`s."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def type(self, index: int) -> TokenType:
+        """Return the type of the token at `index`."""
+        return TOKEN_TYPES[self.types[index]]
+
+    def value(self, index: int) -> str:
+        """Return the lexeme of the token at `index`."""
+        return self.text[self.starts[index] : self.ends[index]]
+
+
+def lex_array(formula: str) -> TokenArray:
+    """Lex a propositional formula into a `TokenArray`.
+
+    The tokens are the same as those of `lex`, but each only takes a byte for its type and two
+    offsets, instead of a `Token` and a copy of its lexeme.
+    """
+    offset_type = "I" if len(formula) < 1 << 32 else "Q"
+    types = array("B")
+    starts = array(offset_type)
+    ends = array(offset_type)
+    codes = _GROUP_CODES
+    for match in _MASTER_PATTERN.finditer(formula):
+        code = codes[match.lastindex]
+        if code == _WHITESPACE_CODE:
+            continue
+        elif code is None:
+            i = match.start()
             raise ValueError(f"Unknown character {formula[i]!r} at position {i}.")
+        start, end = match.span()
+        types.append(code)
+        starts.append(start)
+        ends.append(end)
+    return TokenArray(formula, types, starts, ends)
@@ -0,0 +1,293 @@
+import time
+from typing import Optional, Sequence
+
+from prop_logic import cnf, interned, nodes
+from prop_logic.connectives import Conjunction, Disjunction, Negation
+from prop_logic.sat import Solver
+from prop_logic.simplify import Result
+from prop_logic.truth_table import popcount, truth_table
+
+__all__ = ("DEFAULT_EXACT_VARIABLES", "Cube", "minimize", "minimize_cubes")
+
+DEFAULT_EXACT_VARIABLES = 10
+
+# A conjunction of literals, as bit masks over variable indices: the variables which are in
+# the cube, and which of those are true.
+Cube = tuple[int, int]
+
+
+def _cost(cover: Sequence[Cube]) -> tuple[int, int]:
+    """Return the number of cubes and literals of `cover`."""
+    return len(cover), sum(popcount(care) for care, _ in cover)
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and time.perf_counter() > deadline
+
+
+def _prime_implicants(minterms: Sequence[int], num_vars: int) -> list[Cube]:
+    """Return the prime implicants of a function with the given `minterms` (Quine–McCluskey).
+
+    Implicants with the same variables are grouped in sets of their values, so two implicants
+    merge if their values differ in one bit, which is found by looking up each flipped value.
+    """
+    full = (1 << num_vars) - 1
+    level = {full: set(minterms)}
+    primes = []
+    while level:
+        next_level: dict[int, set[int]] = {}
+        for care, values in level.items():
+            merged = set()
+            for value in values:
+                bits = care
+                while bits:
+                    bit = bits & -bits
+                    bits ^= bit
+                    if value ^ bit in values:
+                        merged.add(value)
+                        if not value & bit:
+                            next_level.setdefault(care ^ bit, set()).add(value)
+            primes.extend((care, value) for value in values - merged)
+        level = next_level
+    return primes
+
+
+def _exact_cover(
+    primes: list[Cube], minterms: Sequence[int], deadline: Optional[float]
+) -> list[Cube]:
+    """Return a minimum cover of `minterms` by `primes`, by branch and bound.
+
+    The set of minterms each prime covers is a bit set over the minterms' indices. Essential
+    primes are taken first and a greedy cover bounds the search; if the deadline passes, the best
+    cover found so far is returned.
+    """
+    covers = []
+    for care, value in primes:
+        bits = 0
+        for i, minterm in enumerate(minterms):
+            if minterm & care == value:
+                bits |= 1 << i
+        covers.append(bits)
+    everything = (1 << len(minterms)) - 1
+
+    # Take the essential primes: those which are the only cover of some minterm.
+    chosen = set()
+    for i in range(len(minterms)):
+        covering = [p for p, bits in enumerate(covers) if bits >> i & 1]
+        if len(covering) == 1:
+            chosen.add(covering[0])
+    essential = sorted(chosen)
+    covered = 0
+    for p in essential:
+        covered |= covers[p]
+
+    def cost(selection: list[int]) -> tuple[int, int]:
+        return _cost([primes[p] for p in selection])
+
+    def gain(p: int, covered: int) -> tuple[int, int]:
+        """Return the number of minterms `p` adds to `covered`, and minus its literals."""
+        return popcount(covers[p] & ~covered), -popcount(primes[p][0])
+
+    # Cover the rest greedily, which bounds the search.
+    best = list(essential)
+    greedy = covered
+    while greedy != everything:
+        p = max(range(len(primes)), key=lambda p: gain(p, greedy))
+        best.append(p)
+        greedy |= covers[p]
+
+    # Branch on the primes covering the uncovered minterm with the fewest such primes.
+    stack = [(essential, covered)]
+    while stack and not _expired(deadline):
+        selection, covered = stack.pop()
+        if covered == everything:
+            if cost(selection) < cost(best):
+                best = selection
+            continue
+        elif len(selection) + 1 > len(best) or (
+            len(selection) + 1 == len(best) and cost(selection)[1] >= cost(best)[1]
+        ):
+            continue  # At least one more prime is needed, so it can't beat the best cover.
+
+        uncovered = [i for i in range(len(minterms)) if not covered >> i & 1]
+        i = min(uncovered, key=lambda i: sum(bits >> i & 1 for bits in covers))
+        candidates = [p for p, bits in enumerate(covers) if bits >> i & 1]
+        candidates.sort(key=lambda p: gain(p, covered))  # Try the best candidate first.
+        for p in candidates:
+            stack.append((selection + [p], covered | covers[p]))
+
+    return [primes[p] for p in best]
+
+
+class _Espresso:
+    """Heuristic two-level minimizer which checks cubes with a SAT solver.
+
+    A cube is an implicant if it doesn't intersect the formula's OFF-set, i.e. if the negated
+    formula is unsatisfiable under the cube's literals as assumptions. Cubes are expanded into
+    primes by dropping literals while they stay implicants, and the cover is built by repeatedly
+    expanding a minterm which it doesn't cover yet, so the truth table is never built.
+    """
+
+    def __init__(self, formula: nodes.Formula, names: Sequence[str]):
+        self.num_vars = len(names)
+        self._on = self._solver(formula, names)
+        negated = nodes.UnaryFormula(Negation, formula)
+        self._off = self._solver(negated, names)
+
+    @staticmethod
+    def _solver(formula: nodes.Formula, names: Sequence[str]) -> Solver:
+        encoder = cnf.TseitinEncoder()
+        for name in names:  # Variable i is numbered i + 1.
+            encoder.variable(name)
+        solver = Solver(encoder.encode(formula))
+        while solver.num_vars < encoder.num_vars:
+            solver.new_var()
+        return solver
+
+    def _literals(self, cube: Cube) -> list[int]:
+        care, value = cube
+        return [i + 1 if value >> i & 1 else -i - 1 for i in range(self.num_vars) if care >> i & 1]
+
+    def is_implicant(self, cube: Cube) -> bool:
+        return not self._off.solve(self._literals(cube))
+
+    def covered(self, cube: Cube, cover: Sequence[Cube]) -> bool:
+        """Return True if the union of `cover` contains `cube`."""
+        solver = Solver([-lit for lit in self._literals(other)] for other in cover)
+        return not solver.solve(self._literals(cube))
+
+    def expand(self, cube: Cube, order: Sequence[int]) -> Cube:
+        """Drop literals of `cube`, in the `order` of their variables, while it's an implicant."""
+        care, value = cube
+        for i in order:
+            bit = 1 << i
+            if care & bit and self.is_implicant((care ^ bit, value & ~bit)):
+                care ^= bit
+                value &= ~bit
+        return care, value
+
+    def initial_cover(self) -> list[Cube]:
+        """Return a cover of prime implicants, each expanded from a minterm it didn't cover."""
+        cover = []
+        order = range(self.num_vars)
+        full = (1 << self.num_vars) - 1
+        while self._on.solve():
+            model = self._on.model
+            minterm = sum(1 << i for i in range(self.num_vars) if model[i + 1])
+            cube = self.expand((full, minterm), order)
+            cover.append(cube)
+            if not self._on.add_clause(-lit for lit in self._literals(cube)):
+                break
+        return cover
+
+    def irredundant(self, cover: list[Cube]) -> list[Cube]:
+        """Remove cubes which are covered by the others, those with the most literals first."""
+        cover = sorted(cover, key=lambda cube: popcount(cube[0]), reverse=True)
+        i = 0
+        while i < len(cover):
+            if self.covered(cover[i], cover[:i] + cover[i + 1 :]):
+                del cover[i]
+            else:
+                i += 1
+        return cover
+
+    def reduce(self, cover: list[Cube]) -> list[Cube]:
+        """Add literals to each cube while the cover still covers the function."""
+        reduced = list(cover)
+        for j, (care, value) in enumerate(reduced):
+            for i in range(self.num_vars):
+                bit = 1 << i
+                if care & bit:
+                    continue
+                for polarity in (0, bit):
+                    # If the half of the cube with the opposite literal is covered by the other
+                    # cubes, only the half with this literal is needed.
+                    others = reduced[:j] + reduced[j + 1 :]
+                    if self.covered((care | bit, value | (bit ^ polarity)), others):
+                        care, value = care | bit, value | polarity
+                        reduced[j] = (care, value)
+                        break
+        return reduced
+
+    def minimize(self, deadline: Optional[float]) -> list[Cube]:
+        cover = self.irredundant(self.initial_cover())
+        best = cover
+        iteration = 0
+        while not _expired(deadline):
+            iteration += 1
+            order = [(i + iteration) % self.num_vars for i in range(self.num_vars)][::-1]
+            cover = self.reduce(cover)
+            cover = [self.expand(cube, order) for cube in cover]
+            cover = self.irredundant(list(dict.fromkeys(cover)))
+            if _cost(cover) < _cost(best):
+                best = cover
+            else:
+                break
+        return best
+
+
+def minimize_cubes(
+    formula: nodes.Formula,
+    names: Sequence[str],
+    exact_variables: int = DEFAULT_EXACT_VARIABLES,
+    time_limit: Optional[float] = None,
+) -> list[Cube]:
+    """Return a minimal or near-minimal cover of `formula` by cubes over `names`.
+
+    Bit i of a cube's masks is `names[i]`, which must include the formula's variables.
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    num_vars = len(names)
+    if num_vars > exact_variables:
+        return _Espresso(formula, names).minimize(deadline)
+
+    # Bit i of a truth table row is variable n - 1 - i, so reverse the bits of each minterm.
+    table = truth_table(formula, names)
+    minterms = []
+    for row in range(table.size):
+        if table.value(row):
+            minterms.append(sum(1 << i for i in range(num_vars) if row >> (num_vars - 1 - i) & 1))
+    primes = _prime_implicants(minterms, num_vars)
+    return _exact_cover(primes, minterms, deadline) if minterms else []
+
+
+def minimize(
+    formula: nodes.Formula,
+    exact_variables: int = DEFAULT_EXACT_VARIABLES,
+    time_limit: Optional[float] = None,
+) -> Result:
+    """Return an equivalent formula in minimal or near-minimal disjunctive normal form (DNF).
+
+    Return a constant truth value if `formula` is a tautology or contradiction. If the formula
+    has at most `exact_variables` variables, the DNF is minimized exactly with Quine–McCluskey
+    and a branch and bound cover of its truth table; otherwise heuristically, with an
+    Espresso-style loop of reducing, expanding and removing redundant cubes. If `time_limit`
+    seconds pass, the best DNF found so far is returned; it's always equivalent to `formula`.
+    The heuristic's initial cover of prime implicants is always completed, so the time limit
+    only bounds the improvements after it.
+    """
+    names = nodes.variable_names(formula)
+    cover = minimize_cubes(formula, names, exact_variables, time_limit)
+    if not cover:
+        return False
+
+    interner = interned.interner
+    variables = [interner.variable(name) for name in names]
+    terms = []
+    for care, value in sorted(cover):
+        literals = [
+            variable if value >> i & 1 else interner.unary(Negation, variable)
+            for i, variable in enumerate(variables)
+            if care >> i & 1
+        ]
+        if not literals:
+            return True
+        term = literals[0]
+        for literal in literals[1:]:
+            term = interner.binary(term, Conjunction, literal)
+        terms.append(term)
+
+    formula = terms[0]
+    for term in terms[1:]:
+        formula = interner.binary(formula, Disjunction, term)
+    return formula
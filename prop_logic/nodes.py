@@ -1,12 +1,43 @@
-from dataclasses import dataclass
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, TypeVar
 
 from prop_logic.connectives import BinaryConnective, UnaryConnective
 
-__all__ = ("Node", "Formula", "BinaryFormula", "UnaryFormula", "Variable")
+__all__ = (
+    "Node",
+    "Formula",
+    "BinaryFormula",
+    "UnaryFormula",
+    "Variable",
+    "iter_postorder",
+    "variable_names",
+)
+
+
+_T = TypeVar("_T")
+
+
+def _slots(cls: type[_T]) -> type[_T]:
+    """Recreate the dataclass `cls` with a slot for each field instead of a `__dict__`.
+
+    This is `dataclass(slots=True)`, which needs Python 3.10. Default values are kept by the
+    generated `__init__`, so the class attributes holding them are dropped for the slots.
+    """
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    dropped = {*names, "__dict__", "__weakref__"}
+    namespace = {key: value for key, value in vars(cls).items() if key not in dropped}
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
 
 class Node:
-    """Base class for all nodes of the abstract syntax tree (AST)."""
+    """Base class for all nodes of the abstract syntax tree (AST).
+
+    Nodes have slots rather than a `__dict__`, so that large formulas take less memory.
+    """
+
+    __slots__ = ("__weakref__",)
 
 
 class Formula(Node):
@@ -16,7 +47,15 @@ class Formula(Node):
     expression which denotes a proposition.
     """
 
+    __slots__ = ()
 
+    @property
+    def children(self) -> tuple["Formula", ...]:
+        """Return the immediate subformulas."""
+        return ()
+
+
+@_slots
 @dataclass
 class UnaryFormula(Formula):
     """A propositional formula connected by a unary connective."""
@@ -24,14 +63,19 @@ class UnaryFormula(Formula):
     connective: UnaryConnective
     operand: Formula
 
+    @property
+    def children(self) -> tuple[Formula, ...]:
+        """Return the operand."""
+        return (self.operand,)
+
     def __str__(self) -> str:
-        return f"{self.connective}{self.operand}"
+        return render.render(self)
 
     def __repr__(self) -> str:
-        name = self.__class__.__name__
-        return f"{name}(connective={self.connective!r}, operand={self.operand!r})"
+        return render.render(self, render.Style.REPR)
 
 
+@_slots
 @dataclass
 class BinaryFormula(Formula):
     """Two propositional formulas connected by a binary connective."""
@@ -40,14 +84,19 @@ class BinaryFormula(Formula):
     connective: BinaryConnective
     right: Formula
 
+    @property
+    def children(self) -> tuple[Formula, ...]:
+        """Return the left and right operands."""
+        return self.left, self.right
+
     def __str__(self) -> str:
-        return f"({self.left} {self.connective} {self.right})"
+        return render.render(self)
 
     def __repr__(self) -> str:
-        name = self.__class__.__name__
-        return f"{name}(left={self.left!r}, connective={self.connective!r}, right={self.right!r})"
+        return render.render(self, render.Style.REPR)
 
 
+@_slots
 @dataclass
 class Variable(Formula):
     """An atomic propositional formula (atom).
@@ -57,9 +106,45 @@ class Variable(Formula):
     """
 
     name: str
+    #: The ID of the name in a `symbols.SymbolTable`, if the variable was parsed with one.
+    id: Optional[int] = field(default=None, compare=False)
 
     def __str__(self) -> str:
         return self.name
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
+
+
+def iter_postorder(formula: Formula) -> Iterator[Formula]:
+    """Yield the nodes of `formula` in post-order, i.e. children before their parents.
+
+    Nodes are yielded once per object, so a subformula which is shared by several parents is
+    only yielded the first time it is reached. The traversal is iterative and thus supports
+    arbitrarily deep formulas.
+    """
+    seen = set()
+    stack = [(formula, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+        elif id(node) not in seen:
+            seen.add(id(node))
+            stack.append((node, True))
+            if isinstance(node, BinaryFormula):
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+            elif isinstance(node, UnaryFormula):
+                stack.append((node.operand, False))
+
+
+def variable_names(formula: Formula) -> tuple[str, ...]:
+    """Return the names of the variables in `formula` in order of first occurrence."""
+    names = {node.name: None for node in iter_postorder(formula) if isinstance(node, Variable)}
+    return tuple(names)
+
+
+# The renderer depends on the node classes, so it's imported once they're defined. Methods look
+# up `render` when they're called, by which time either import order has completed.
+from prop_logic import render  # noqa: E402
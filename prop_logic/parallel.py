@@ -0,0 +1,131 @@
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+from prop_logic import nodes
+from prop_logic.flat import FlatFormula
+from prop_logic.lexer import lex
+from prop_logic.parser import IterativeParser
+from prop_logic.symbols import SymbolTable
+
+__all__ = ("evaluate_many", "parse_many")
+
+# Chunks are sized to give each worker about this many, so they're balanced at the end of a batch
+# without paying per-formula IPC costs. Iterators of unknown length use the default size.
+_CHUNKS_PER_WORKER = 4
+_DEFAULT_CHUNKSIZE = 256
+_MAX_CHUNKSIZE = 4096
+
+
+def _parse_chunk(formulas: list[str]) -> list[Union[FlatFormula, ValueError]]:
+    results: list[Union[FlatFormula, ValueError]] = []
+    for formula in formulas:
+        try:
+            results.append(FlatFormula.from_formula(IterativeParser(lex(formula)).parse()))
+        except ValueError as e:
+            results.append(e)
+    return results
+
+
+def _evaluate_chunk(
+    formulas: list[str], assignment: Mapping[str, Any]
+) -> list[Union[bool, ValueError]]:
+    results: list[Union[bool, ValueError]] = []
+    for formula in formulas:
+        try:
+            flat = FlatFormula.from_formula(IterativeParser(lex(formula)).parse())
+            results.append(flat.evaluate(assignment))
+        except ValueError as e:
+            results.append(e)
+    return results
+
+
+def _chunksize(formulas: Iterable[str], workers: int) -> int:
+    if not isinstance(formulas, Sequence):
+        return _DEFAULT_CHUNKSIZE
+    chunks = workers * _CHUNKS_PER_WORKER
+    return max(1, min(_MAX_CHUNKSIZE, -(-len(formulas) // chunks)))
+
+
+def _map_chunks(
+    function: Callable[..., list],
+    formulas: Iterable[str],
+    args: tuple,
+    max_workers: Optional[int],
+    chunksize: Optional[int],
+    executor: Optional[Executor],
+) -> Iterator[Any]:
+    """Apply `function` to chunks of `formulas` in worker processes and yield results in order.
+
+    Only a bounded number of chunks are in flight at once, so an iterator of formulas is consumed
+    lazily rather than all being submitted up front.
+    """
+    workers = max_workers or getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = _chunksize(formulas, workers)
+    elif chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize}.")
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers)
+    try:
+        iterator = iter(formulas)
+        pending: deque[Future] = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    break
+                pending.append(executor.submit(function, chunk, *args))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def parse_many(
+    formulas: Iterable[str],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    symbols: Optional[SymbolTable] = None,
+) -> list[Union[nodes.Formula, ValueError]]:
+    """Parse `formulas` in parallel processes and return their ASTs in input order.
+
+    `formulas` are split into chunks which are parsed by a `ProcessPoolExecutor` with
+    `max_workers` workers, or by `executor` if given, which avoids starting a new pool per batch.
+    By default, a sequence is split into about 4 chunks per worker, and an iterator into chunks
+    of 256 formulas. ASTs are sent back as `FlatFormula`s, which pickle far faster
+    than nested nodes.
+
+    If a formula fails to lex or parse, its ValueError is returned in place of its AST. If
+    `symbols` is given, variable names are interned into it in input order, as if the formulas
+    were parsed sequentially with it.
+    """
+    results = _map_chunks(_parse_chunk, formulas, (), max_workers, chunksize, executor)
+    return [
+        result if isinstance(result, ValueError) else result.to_formula(symbols)
+        for result in results
+    ]
+
+
+def evaluate_many(
+    formulas: Iterable[str],
+    assignment: Mapping[str, Any],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list[Union[bool, ValueError]]:
+    """Parse and evaluate `formulas` under `assignment` in parallel processes.
+
+    Return the truth values in input order; a formula which fails to parse, or has a variable
+    missing from `assignment`, has a ValueError in place of its value. Chunking and workers are
+    as in `parse_many`.
+    """
+    args = (dict(assignment),)
+    return list(_map_chunks(_evaluate_chunk, formulas, args, max_workers, chunksize, executor))
@@ -1,15 +1,21 @@
-from typing import Iterator, Optional
+from typing import Iterable, Optional
 
 from prop_logic import nodes
-from prop_logic.connectives import BinaryConnective, UnaryConnective
-from prop_logic.lexer import Token, TokenType
+from prop_logic.connectives import BinaryConnective, Connective, UnaryConnective
+from prop_logic.lexer import TOKEN_CODES, TOKEN_TYPES, Token, TokenArray, TokenType
+from prop_logic.symbols import SymbolTable
 
 
 class Parser:
-    """Parser of propositional formulas in propositional logic."""
+    """Parser of propositional formulas in propositional logic.
 
-    def __init__(self, tokens: Iterator[Token]):
-        self.tokens = tokens
+    If `symbols` is given, variable names are interned into it and variables carry their IDs.
+    Subclasses which read tokens from elsewhere may omit `tokens`.
+    """
+
+    def __init__(self, tokens: Iterable[Token] = (), symbols: Optional[SymbolTable] = None):
+        self.tokens = iter(tokens)
+        self.symbols = symbols
         self.token = self.next()
 
     def next(self) -> Optional[Token]:
@@ -25,6 +31,13 @@ class Parser:
         else:
             return False
 
+    def variable(self, name: str) -> nodes.Variable:
+        """Create a variable, with its ID if there's a symbol table."""
+        if self.symbols is None:
+            return nodes.Variable(name)
+        else:
+            return nodes.Variable(name, self.symbols.intern(name))
+
     def expect(self, type_: TokenType) -> bool:
         """Same as `accept`, but raise ValueError for `type_` mismatches."""
         if self.accept(type_):
@@ -49,7 +62,7 @@ class Parser:
         """Parse tokens into a variable, a grouped formula, or a unary formula."""
         token = self.token
         if self.accept(TokenType.VARIABLE):
-            return nodes.Variable(token.value)
+            return self.variable(token.value)
         elif self.accept(TokenType.PARENTHESIS_LEFT):
             return self.parse_group()
         elif connective := UnaryConnective.from_token(token):
@@ -117,6 +130,170 @@ class Parser:
         return left
 
 
+class IterativeParser(Parser):
+    """Parser of propositional formulas which uses explicit stacks instead of recursion.
+
+    It builds the same trees as `Parser`, but formulas may be nested arbitrarily deeply and
+    the time taken is linear in the number of tokens.
+    """
+
+    def parse(self) -> nodes.Formula:
+        """Parse tokens into an abstract syntax tree representing a propositional formula.
+
+        This is a shunting-yard parser. Operands are pushed onto one stack, and connectives and
+        left parentheses onto another. A binary connective first reduces any binary connectives
+        on the stack whose precedence is at least as high, which makes them left-associative.
+        Unary connectives apply to the term which immediately follows them.
+        """
+        operands: list[nodes.Formula] = []
+        operators: list[tuple[Optional[Connective], int]] = []  # Connectives and their arity.
+        depth = 0  # Number of unclosed parentheses.
+
+        while True:
+            # Parse a term; push any unary connectives or left parentheses that precede it.
+            token = self.token
+            if self.accept(TokenType.VARIABLE):
+                operands.append(self.variable(token.value))
+            elif self.accept(TokenType.PARENTHESIS_LEFT):
+                operators.append((None, 0))
+                depth += 1
+                continue
+            elif connective := UnaryConnective.from_token(token):
+                self.next()  # Consume unary connective token.
+                operators.append((connective, 1))
+                continue
+            else:
+                raise ValueError(f"Unexpected token {token}")
+
+            # Close any groups which follow the term.
+            while True:
+                self._reduce_unary(operands, operators)
+                if depth and self.token and self.token.type is TokenType.PARENTHESIS_RIGHT:
+                    self._reduce_binary(operands, operators, 0)
+                    operators.pop()  # Discard the left parenthesis.
+                    depth -= 1
+                    self.next()
+                else:
+                    break
+
+            token = self.token
+            if connective := BinaryConnective.from_token(token):
+                self.next()  # Consume binary connective token.
+                self._reduce_binary(operands, operators, connective.precedence)
+                operators.append((connective, 2))
+            elif depth:
+                self.expect(TokenType.PARENTHESIS_RIGHT)  # Raises due to the mismatch.
+            elif token is not None:
+                raise ValueError(f"Syntax error: unexpected token {token.value!r}")
+            else:
+                self._reduce_binary(operands, operators, 0)
+                return operands.pop()
+
+    @staticmethod
+    def _reduce_unary(operands: list[nodes.Formula], operators: list) -> None:
+        """Apply the unary connectives at the top of the operator stack to the top operand."""
+        while operators and operators[-1][1] == 1:
+            operands.append(nodes.UnaryFormula(operators.pop()[0], operands.pop()))
+
+    @staticmethod
+    def _reduce_binary(operands: list[nodes.Formula], operators: list, min_precedence: int) -> None:
+        """Build binary formulas from connectives at the top of the operator stack.
+
+        Stop at a left parenthesis or a connective with a lower precedence than `min_precedence`.
+        """
+        while operators and operators[-1][1] == 2 and operators[-1][0].precedence >= min_precedence:
+            right = operands.pop()
+            operands.append(nodes.BinaryFormula(operands.pop(), operators.pop()[0], right))
+
+
+# The connective of each token code, for `ArrayParser`; kept up to date as connectives are
+# created. Unary and binary connectives are looked up alike, as `Connective.from_token` does.
+_CONNECTIVES_BY_CODE: list[Optional[Connective]] = [None] * len(TOKEN_TYPES)
+
+
+def _register_code(connective: Connective) -> None:
+    _CONNECTIVES_BY_CODE[TOKEN_CODES[connective.type]] = connective
+
+
+Connective.subscribe(_register_code)
+
+
+class ArrayParser(IterativeParser):
+    """Parser of propositional formulas lexed into a `TokenArray`.
+
+    It's the shunting-yard parser of `IterativeParser`, but it reads the codes of the token
+    types directly from the array, and only slices the values of variables from the text, so no
+    `Token` is created unless there's an error. It builds the same trees and raises the same
+    errors as `IterativeParser`.
+    """
+
+    def __init__(self, tokens: TokenArray, symbols: Optional[SymbolTable] = None):
+        self.array = tokens
+        super().__init__(symbols=symbols)
+
+    def _token(self, index: int) -> Optional[Token]:
+        return self.array[index] if index < len(self.array) else None
+
+    def parse(self) -> nodes.Formula:
+        """Parse tokens into an abstract syntax tree representing a propositional formula."""
+        array = self.array
+        types, starts, ends, text = array.types, array.starts, array.ends, array.text
+        count = len(types)
+        variable = TOKEN_CODES[TokenType.VARIABLE]
+        left = TOKEN_CODES[TokenType.PARENTHESIS_LEFT]
+        right = TOKEN_CODES[TokenType.PARENTHESIS_RIGHT]
+        connectives = _CONNECTIVES_BY_CODE
+
+        operands: list[nodes.Formula] = []
+        operators: list[tuple[Optional[Connective], int]] = []  # Connectives and their arity.
+        depth = 0  # Number of unclosed parentheses.
+        i = 0
+
+        while True:
+            # Parse a term; push any unary connectives or left parentheses that precede it.
+            code = types[i] if i < count else None
+            if code == variable:
+                operands.append(self.variable(text[starts[i] : ends[i]]))
+                i += 1
+            elif code == left:
+                operators.append((None, 0))
+                depth += 1
+                i += 1
+                continue
+            elif code is not None and (connective := connectives[code]):
+                operators.append((connective, 1))
+                i += 1
+                continue
+            else:
+                raise ValueError(f"Unexpected token {self._token(i)}")
+
+            # Close any groups which follow the term.
+            while True:
+                self._reduce_unary(operands, operators)
+                if depth and i < count and types[i] == right:
+                    self._reduce_binary(operands, operators, 0)
+                    operators.pop()  # Discard the left parenthesis.
+                    depth -= 1
+                    i += 1
+                else:
+                    break
+
+            code = types[i] if i < count else None
+            if code is not None and (connective := connectives[code]):
+                i += 1
+                self._reduce_binary(operands, operators, connective.precedence)
+                operators.append((connective, 2))
+            elif depth:
+                found_type = TOKEN_TYPES[code] if code is not None else "EOF"
+                expected = TokenType.PARENTHESIS_RIGHT
+                raise ValueError(f"Unexpected token: expected {expected} but found {found_type}")
+            elif code is not None:
+                raise ValueError(f"Syntax error: unexpected token {array.value(i)!r}")
+            else:
+                self._reduce_binary(operands, operators, 0)
+                return operands.pop()
+
+
 if __name__ == "__main__":
     from prop_logic.lexer import lex
 
@@ -0,0 +1,123 @@
+from typing import Callable, NamedTuple, Optional
+
+from prop_logic import nodes
+from prop_logic.connectives import BinaryConnective, Connective, UnaryConnective
+from prop_logic.lexer import Token, TokenType
+from prop_logic.parser import Parser
+
+__all__ = ("PrefixRule", "InfixRule", "PREFIX_RULES", "INFIX_RULES", "PrattParser")
+
+
+class PrefixRule(NamedTuple):
+    """How to parse a term which starts with a token of some type."""
+
+    #: Parse the term, given the parser after the token was consumed, the token, and this rule.
+    parse: Callable[["PrattParser", Token, "PrefixRule"], nodes.Formula]
+    connective: Optional[UnaryConnective] = None
+    #: The minimum binding power of connectives in the operand.
+    power: int = 0
+
+
+class InfixRule(NamedTuple):
+    """How to parse a binary formula whose connective is a token of some type."""
+
+    #: Parse the formula, given the parser after the token was consumed, the left operand, and
+    #: this rule.
+    parse: Callable[["PrattParser", nodes.Formula, "InfixRule"], nodes.Formula]
+    connective: BinaryConnective
+    #: How strongly the connective binds its left and right operands; the one which binds more
+    #: strongly takes an operand between two connectives.
+    left_power: int
+    right_power: int
+
+
+def _parse_variable(parser: "PrattParser", token: Token, rule: PrefixRule) -> nodes.Formula:
+    return parser.variable(token.value)
+
+
+def _parse_group(parser: "PrattParser", token: Token, rule: PrefixRule) -> nodes.Formula:
+    node = parser.parse_expression()
+    parser.expect(TokenType.PARENTHESIS_RIGHT)
+    return node
+
+
+def _parse_unary(parser: "PrattParser", token: Token, rule: PrefixRule) -> nodes.Formula:
+    return nodes.UnaryFormula(rule.connective, parser.parse_expression(rule.power))
+
+
+def _parse_binary(parser: "PrattParser", left: nodes.Formula, rule: InfixRule) -> nodes.Formula:
+    return nodes.BinaryFormula(left, rule.connective, parser.parse_expression(rule.right_power))
+
+
+PREFIX_RULES: dict[TokenType, PrefixRule] = {
+    TokenType.VARIABLE: PrefixRule(_parse_variable),
+    TokenType.PARENTHESIS_LEFT: PrefixRule(_parse_group),
+}
+INFIX_RULES: dict[TokenType, InfixRule] = {}
+
+
+def _register(connective: Connective) -> None:
+    """Add the rule of `connective` to the tables.
+
+    Binding powers are twice the precedence, plus one on the side the connective associates
+    to, so operators of the same precedence are left-associative unless the connective sets
+    `right_associative`. Unary connectives bind their operand more strongly than any binary
+    connective of a lower precedence.
+    """
+    power = 2 * connective.precedence
+    # The connectives' metaclasses are protocols, which break isinstance() and issubclass().
+    metaclasses = type(connective).__mro__
+    if UnaryConnective in metaclasses:
+        PREFIX_RULES[connective.type] = PrefixRule(_parse_unary, connective, power)
+    elif BinaryConnective in metaclasses:
+        if getattr(connective, "right_associative", False):
+            rule = InfixRule(_parse_binary, connective, power + 1, power)
+        else:
+            rule = InfixRule(_parse_binary, connective, power, power + 1)
+        INFIX_RULES[connective.type] = rule
+
+
+Connective.subscribe(_register)
+
+
+class PrattParser(Parser):
+    """Parser of propositional formulas driven by tables of rules per token type (Pratt parser).
+
+    The rules of connectives are added to `PREFIX_RULES` and `INFIX_RULES` when the connectives
+    are created, so a new connective needs no changes to the parser. It parses each token with a
+    single table lookup, and parses chains of binary formulas in a loop rather than recursively.
+    Groups and unary formulas still recurse.
+
+    It builds the same trees as `Parser` for well-formed formulas, but its grammar is stricter:
+    `Parser` looks up unary and binary connectives alike, so it also accepts a binary
+    connective in place of a unary one, as in "> A", and a unary connective in place of a
+    binary one, as in "A ~ B". Here, unary connectives only start terms and binary connectives
+    only join them, so such input raises ValueError. The error reports the first token which
+    doesn't fit the grammar, so its message may differ from `Parser`'s for malformed input.
+    """
+
+    def parse(self) -> nodes.Formula:
+        """Parse tokens into an abstract syntax tree representing a propositional formula."""
+        node = self.parse_expression()
+        if self.token is not None:
+            raise ValueError(f"Syntax error: unexpected token {self.token.value!r}")
+        else:
+            return node
+
+    def parse_expression(self, min_power: int = 0) -> nodes.Formula:
+        """Parse a term and any binary connectives which bind at least `min_power` strongly."""
+        token = self.token
+        prefix = PREFIX_RULES.get(token.type) if token is not None else None
+        if prefix is None:
+            raise ValueError(f"Unexpected token {token}")
+        self.token = next(self.tokens, None)
+        left = prefix.parse(self, token, prefix)
+
+        infix_rules = INFIX_RULES
+        while (token := self.token) is not None:
+            infix = infix_rules.get(token.type)
+            if infix is None or infix.left_power < min_power:
+                break
+            self.token = next(self.tokens, None)
+            left = infix.parse(self, left, infix)
+        return left
@@ -0,0 +1,111 @@
+import enum
+from typing import IO, Iterator, Union
+
+from prop_logic import nodes
+
+__all__ = ("Style", "iter_pieces", "render", "write")
+
+_BUFFER_PIECES = 4096
+
+
+class Style(enum.Enum):
+    """A style of rendering formulas as text."""
+
+    #: Every binary formula is parenthesised, e.g. `((A ∧ B) ∨ ¬C)`. This is `str()` of nodes.
+    FULL = enum.auto()
+    #: Parentheses only where the precedence and left-associativity of connectives need them,
+    #: e.g. `A ∧ B ∨ ¬C`. The text parses to the same formula.
+    MINIMAL = enum.auto()
+    #: The constructor-like representation which is `repr()` of nodes.
+    REPR = enum.auto()
+
+
+def _needs_parentheses(node: nodes.Formula, precedence: int, right: bool) -> bool:
+    """Return True if `node` must be parenthesised as an operand of a connective.
+
+    Binary formulas are left-associative, so a right operand needs parentheses even if its
+    connective has the same precedence.
+    """
+    if not isinstance(node, nodes.BinaryFormula):
+        return False
+    elif right:
+        return node.connective.precedence <= precedence
+    else:
+        return node.connective.precedence < precedence
+
+
+def iter_pieces(formula: nodes.Formula, style: Style = Style.FULL) -> Iterator[str]:
+    """Yield pieces of text which together render `formula` in `style`.
+
+    The formula is traversed iteratively with an explicit stack, so it may be arbitrarily deep,
+    and each piece is only yielded once, so joining them takes linear time.
+    """
+    stack: list[Union[nodes.Formula, str]] = [formula]
+    pop, push = stack.pop, stack.append
+    while stack:
+        item = pop()
+        if type(item) is str:
+            yield item
+        elif isinstance(item, nodes.BinaryFormula):
+            connective = item.connective
+            if style is Style.FULL:
+                yield "("
+                push(")")
+                push(item.right)
+                push(f" {connective.lexeme} ")
+                push(item.left)
+            elif style is Style.MINIMAL:
+                precedence = connective.precedence
+                if _needs_parentheses(item.right, precedence, True):
+                    push(")")
+                    push(item.right)
+                    push("(")
+                else:
+                    push(item.right)
+                push(f" {connective.lexeme} ")
+                if _needs_parentheses(item.left, precedence, False):
+                    push(")")
+                    push(item.left)
+                    yield "("
+                else:
+                    push(item.left)
+            else:
+                yield f"{item.__class__.__name__}(left="
+                push(")")
+                push(item.right)
+                push(f", connective={connective!r}, right=")
+                push(item.left)
+        elif isinstance(item, nodes.UnaryFormula):
+            if style is Style.REPR:
+                yield f"{item.__class__.__name__}(connective={item.connective!r}, operand="
+                push(")")
+                push(item.operand)
+            else:
+                yield item.connective.lexeme
+                if style is Style.MINIMAL and isinstance(item.operand, nodes.BinaryFormula):
+                    yield "("
+                    push(")")
+                push(item.operand)
+        elif style is Style.REPR:
+            yield repr(item)
+        else:
+            yield str(item)
+
+
+def render(formula: nodes.Formula, style: Style = Style.FULL) -> str:
+    """Return `formula` rendered as text in `style`."""
+    return "".join(iter_pieces(formula, style))
+
+
+def write(formula: nodes.Formula, file: IO[str], style: Style = Style.FULL) -> None:
+    """Write `formula` rendered as text in `style` to `file`.
+
+    The text is written in chunks as it's rendered, so it's never held in memory as a whole.
+    """
+    buffer = []
+    for piece in iter_pieces(formula, style):
+        buffer.append(piece)
+        if len(buffer) >= _BUFFER_PIECES:
+            file.write("".join(buffer))
+            buffer.clear()
+    file.write("".join(buffer))
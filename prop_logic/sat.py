@@ -0,0 +1,568 @@
+import heapq
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from prop_logic import cnf, nodes
+
+__all__ = ("SolverStats", "Solver", "solve", "is_satisfiable", "iter_models")
+
+# Truth values of literals.
+_FALSE = 0
+_TRUE = 1
+_UNDEF = 2
+
+
+class SolverStats(NamedTuple):
+    """Counters of the work done by a `Solver`."""
+
+    decisions: int
+    propagations: int
+    conflicts: int
+    restarts: int
+    learnts: int
+    deleted: int
+
+
+class _Clause:
+    """A disjunction of literals; the first two literals are watched."""
+
+    __slots__ = ("lits", "learnt", "activity", "lbd", "deleted")
+
+    def __init__(self, lits: list[int], learnt: bool = False, lbd: int = 0):
+        self.lits = lits
+        self.learnt = learnt
+        self.activity = 0.0
+        self.lbd = lbd
+        self.deleted = False
+
+
+def _luby(i: int) -> int:
+    """Return the `i`th element (starting from 0) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, ..."""
+    size, exponent = 1, 0
+    while size < i + 1:
+        exponent += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        exponent -= 1
+        i %= size
+    return 1 << exponent
+
+
+class Solver:
+    """Conflict-driven clause learning (CDCL) SAT solver.
+
+    Clauses are iterables of non-zero ints as in DIMACS CNF: variable v is the literal v and its
+    negation is -v. Variables are created as needed by `add_clause`.
+
+    Unit propagation uses two watched literals per clause. Conflicts are analysed to learn
+    first-UIP clauses, which are minimised and whose literal block distance (LBD) is recorded.
+    Decisions follow VSIDS activity with phase saving, the search restarts on the Luby sequence,
+    and learnt clauses with a high LBD and low activity are periodically deleted.
+    """
+
+    restart_base = 100  # Conflicts between restarts are this times the Luby sequence.
+    var_decay = 0.95
+    clause_decay = 0.999
+
+    def __init__(self, clauses: Iterable[Iterable[int]] = ()):
+        self.num_vars = 0
+        self.model: Optional[dict[int, bool]] = None
+
+        self._clauses: list[_Clause] = []
+        self._learnts: list[_Clause] = []
+        self._ok = True  # False once a conflict is found without any decisions.
+
+        # Literal l of variable v is 2v for v and 2v + 1 for -v, so l ^ 1 is the negation of l.
+        self._values: list[int] = [_UNDEF, _UNDEF]  # Truth value per literal.
+        self._watches: list[list[_Clause]] = [[], []]  # Clauses watching each literal.
+        self._levels: list[int] = [0]  # Decision level per variable.
+        self._reasons: list[Optional[_Clause]] = [None]  # Implying clause per variable.
+        self._activity: list[float] = [0.0]
+        self._phases: list[int] = [1]  # Saved polarity literal offset; 1 means negative.
+        self._seen: list[bool] = [False]
+
+        self._trail: list[int] = []
+        self._trail_limits: list[int] = []  # Trail size at the start of each decision level.
+        self._queue_head = 0
+        self._heap: list[tuple[float, int]] = []
+        self._var_inc = 1.0
+        self._clause_inc = 1.0
+        self._max_learnts = 0.0
+        self._assumptions: list[int] = []
+
+        self._decisions = 0
+        self._propagations = 0
+        self._conflicts = 0
+        self._restarts = 0
+        self._deleted = 0
+
+        for clause in clauses:
+            self.add_clause(clause)
+
+    @property
+    def stats(self) -> SolverStats:
+        """Return counters of the work done so far."""
+        return SolverStats(
+            self._decisions,
+            self._propagations,
+            self._conflicts,
+            self._restarts,
+            len(self._learnts),
+            self._deleted,
+        )
+
+    def new_var(self) -> int:
+        """Create a new variable and return it."""
+        self.num_vars += 1
+        self._values += (_UNDEF, _UNDEF)
+        self._watches += ([], [])
+        self._levels.append(0)
+        self._reasons.append(None)
+        self._activity.append(0.0)
+        self._phases.append(1)
+        self._seen.append(False)
+        heapq.heappush(self._heap, (0.0, self.num_vars))
+        return self.num_vars
+
+    def add_clause(self, clause: Iterable[int]) -> bool:
+        """Add a clause. Return False if the clauses are now trivially unsatisfiable."""
+        if not self._ok:
+            return False
+        self._backtrack(0)
+
+        lits = set()
+        for literal in clause:
+            if literal == 0:
+                raise ValueError("0 is not a valid literal.")
+            while abs(literal) > self.num_vars:
+                self.new_var()
+            lits.add(2 * literal if literal > 0 else -2 * literal + 1)
+
+        values = self._values
+        if any(lit ^ 1 in lits or values[lit] == _TRUE for lit in lits):
+            return True  # Tautology or already satisfied.
+        lits = [lit for lit in lits if values[lit] != _FALSE]
+
+        if not lits:
+            self._ok = False
+        elif len(lits) == 1:
+            self._enqueue(lits[0], None)
+            self._ok = self._propagate() is None
+        else:
+            clause = _Clause(lits)
+            self._clauses.append(clause)
+            self._watch(clause)
+        return self._ok
+
+    def solve(self, assumptions: Iterable[int] = ()) -> bool:
+        """Return True and set `model` if the clauses are satisfiable; otherwise return False.
+
+        `assumptions` are literals which are temporarily assumed true, as the first decisions of
+        the search. Learnt clauses don't depend on them, so they're kept for later calls.
+        """
+        self.model = None
+        if not self._ok:
+            return False
+
+        self._assumptions = []
+        for lit in assumptions:
+            var = abs(lit)
+            if lit == 0:
+                raise ValueError("0 is not a valid literal.")
+            while self.num_vars < var:
+                self.new_var()
+            self._assumptions.append(2 * var + (lit < 0))
+
+        self._max_learnts = max(len(self._clauses) / 3, 1000.0)
+        restarts = 0
+        while True:
+            result = self._search(self.restart_base * _luby(restarts))
+            if result is not None:
+                break
+            restarts += 1
+            self._restarts += 1
+            self._max_learnts *= 1.05
+
+        if result:
+            values = self._values
+            self.model = {var: values[2 * var] == _TRUE for var in range(1, self.num_vars + 1)}
+        self._backtrack(0)
+        return result
+
+    @property
+    def decision_level(self) -> int:
+        """Return the number of decision levels opened by `assume`."""
+        return len(self._trail_limits)
+
+    def value(self, literal: int) -> Optional[bool]:
+        """Return the truth value of `literal` under the current assignment, or None."""
+        value = self._values[2 * literal if literal > 0 else -2 * literal + 1]
+        return None if value == _UNDEF else value == _TRUE
+
+    def assume(self, literal: int) -> Optional[list[int]]:
+        """Assign true to `literal` at a new decision level and unit propagate it.
+
+        Return the literals which became true, or None if propagation finds a conflict, whose
+        variables are then bumped as in a search. The level stays until `backtrack` is called,
+        which lets a caller such as a model counter drive its own search with this propagation.
+        """
+        if literal == 0:
+            raise ValueError("0 is not a valid literal.")
+        var = abs(literal)
+        while self.num_vars < var:
+            self.new_var()
+
+        lit = 2 * var + (literal < 0)
+        start = len(self._trail)
+        self._trail_limits.append(start)
+        if not self._ok or self._values[lit] == _FALSE:
+            return None
+        elif self._values[lit] == _UNDEF:
+            self._decisions += 1
+            self._enqueue(lit, None)
+        conflict = self._propagate()
+        if conflict is None:
+            return [t >> 1 if not t & 1 else -(t >> 1) for t in self._trail[start:]]
+
+        self._conflicts += 1
+        for conflict_lit in conflict.lits:
+            self._bump_var(conflict_lit >> 1)
+        self._var_inc /= self.var_decay
+        return None
+
+    def backtrack(self, level: int = 0) -> None:
+        """Undo the assignments of the decision levels above `level`."""
+        self._backtrack(level)
+
+    def activity(self, var: int) -> float:
+        """Return the VSIDS activity of `var`, which grows with the conflicts it's involved in."""
+        return self._activity[var] / self._var_inc
+
+    def _watch(self, clause: _Clause) -> None:
+        self._watches[clause.lits[0]].append(clause)
+        self._watches[clause.lits[1]].append(clause)
+
+    def _enqueue(self, lit: int, reason: Optional[_Clause]) -> None:
+        """Assign true to `lit` because of `reason`, or as a decision if `reason` is None."""
+        var = lit >> 1
+        self._values[lit] = _TRUE
+        self._values[lit ^ 1] = _FALSE
+        self._levels[var] = len(self._trail_limits)
+        self._reasons[var] = reason
+        self._trail.append(lit)
+
+    def _propagate(self) -> Optional[_Clause]:
+        """Propagate all enqueued assignments and return a conflicting clause, if any."""
+        values = self._values
+        watches = self._watches
+        trail = self._trail
+        conflict = None
+
+        while self._queue_head < len(trail) and conflict is None:
+            false_lit = trail[self._queue_head] ^ 1
+            self._queue_head += 1
+            self._propagations += 1
+
+            watchers = watches[false_lit]
+            i = j = 0
+            end = len(watchers)
+            while i < end:
+                clause = watchers[i]
+                i += 1
+                if clause.deleted:
+                    continue
+
+                lits = clause.lits
+                # Make sure the false literal is the second watch.
+                if lits[0] == false_lit:
+                    lits[0], lits[1] = lits[1], false_lit
+                first = lits[0]
+                if values[first] == _TRUE:
+                    watchers[j] = clause
+                    j += 1
+                    continue
+
+                # Look for a new literal to watch.
+                for k in range(2, len(lits)):
+                    if values[lits[k]] != _FALSE:
+                        lits[1], lits[k] = lits[k], false_lit
+                        watches[lits[1]].append(clause)
+                        break
+                else:
+                    # The clause is unit or conflicting.
+                    watchers[j] = clause
+                    j += 1
+                    if values[first] == _FALSE:
+                        conflict = clause
+                        while i < end:
+                            watchers[j] = watchers[i]
+                            i += 1
+                            j += 1
+                    else:
+                        self._enqueue(first, clause)
+            del watchers[j:]
+
+        return conflict
+
+    def _analyze(self, conflict: _Clause) -> tuple[list[int], int, int]:
+        """Learn a first-UIP clause from `conflict`.
+
+        Return the clause with the asserting literal first and the literal with the highest
+        level of the rest second, the level to backtrack to, and the clause's LBD.
+        """
+        seen = self._seen
+        levels = self._levels
+        reasons = self._reasons
+        trail = self._trail
+        level = len(self._trail_limits)
+
+        learnt = [0]
+        counter = 0
+        lit = None
+        index = len(trail) - 1
+        clause = conflict
+        while True:
+            if clause.learnt:
+                self._bump_clause(clause)
+            for other in clause.lits if lit is None else clause.lits[1:]:
+                var = other >> 1
+                if not seen[var] and levels[var] > 0:
+                    self._bump_var(var)
+                    seen[var] = True
+                    if levels[var] >= level:
+                        counter += 1
+                    else:
+                        learnt.append(other)
+
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            clause = reasons[lit >> 1]
+            seen[lit >> 1] = False
+            counter -= 1
+            if not counter:
+                break
+        learnt[0] = lit ^ 1
+
+        # Remove literals which are implied by the rest of the clause (local minimisation).
+        minimised = [learnt[0]]
+        for other in learnt[1:]:
+            reason = reasons[other >> 1]
+            if reason is None or any(
+                not seen[r >> 1] and levels[r >> 1] > 0 for r in reason.lits[1:]
+            ):
+                minimised.append(other)
+        for other in learnt:
+            seen[other >> 1] = False
+        learnt = minimised
+
+        if len(learnt) == 1:
+            backtrack_level = 0
+        else:
+            highest = max(range(1, len(learnt)), key=lambda k: levels[learnt[k] >> 1])
+            learnt[1], learnt[highest] = learnt[highest], learnt[1]
+            backtrack_level = levels[learnt[1] >> 1]
+
+        lbd = len({levels[other >> 1] for other in learnt})
+        return learnt, backtrack_level, lbd
+
+    def _bump_var(self, var: int) -> None:
+        activity = self._activity
+        activity[var] += self._var_inc
+        if activity[var] > 1e100:
+            for v in range(1, self.num_vars + 1):
+                activity[v] *= 1e-100
+            self._var_inc *= 1e-100
+            self._rebuild_heap()
+        elif self._values[2 * var] == _UNDEF:
+            heapq.heappush(self._heap, (-activity[var], var))
+
+    def _bump_clause(self, clause: _Clause) -> None:
+        clause.activity += self._clause_inc
+        if clause.activity > 1e20:
+            for learnt in self._learnts:
+                learnt.activity *= 1e-20
+            self._clause_inc *= 1e-20
+
+    def _rebuild_heap(self) -> None:
+        values = self._values
+        self._heap = [
+            (-self._activity[v], v) for v in range(1, self.num_vars + 1) if values[2 * v] == _UNDEF
+        ]
+        heapq.heapify(self._heap)
+
+    def _backtrack(self, level: int) -> None:
+        """Undo all assignments made above decision level `level`."""
+        if len(self._trail_limits) <= level:
+            return
+
+        values = self._values
+        activity = self._activity
+        heap = self._heap
+        start = self._trail_limits[level]
+        for lit in self._trail[start:]:
+            var = lit >> 1
+            values[lit] = values[lit ^ 1] = _UNDEF
+            self._reasons[var] = None
+            self._phases[var] = lit & 1
+            heapq.heappush(heap, (-activity[var], var))
+
+        del self._trail[start:]
+        del self._trail_limits[level:]
+        self._queue_head = start
+
+        if len(heap) > 4 * self.num_vars + 100:
+            self._rebuild_heap()
+
+    def _decide(self) -> Optional[int]:
+        """Return the literal to assign next, or None if all variables are assigned."""
+        values = self._values
+        activity = self._activity
+        heap = self._heap
+        while heap:
+            negative_activity, var = heapq.heappop(heap)
+            if values[2 * var] == _UNDEF and -negative_activity == activity[var]:
+                return 2 * var + self._phases[var]
+        for var in range(1, self.num_vars + 1):  # Only reached if the heap lost entries.
+            if values[2 * var] == _UNDEF:
+                return 2 * var + self._phases[var]
+        return None
+
+    def _reduce_learnts(self) -> None:
+        """Delete about half of the learnt clauses, keeping those with a low LBD or in use."""
+        values = self._values
+        reasons = self._reasons
+        self._learnts.sort(key=lambda c: (c.lbd, -c.activity))
+
+        keep = []
+        half = len(self._learnts) // 2
+        for i, clause in enumerate(self._learnts):
+            first = clause.lits[0]
+            locked = reasons[first >> 1] is clause and values[first] == _TRUE
+            if i < half or clause.lbd <= 2 or locked:
+                keep.append(clause)
+            else:
+                clause.deleted = True
+                self._deleted += 1
+        self._learnts = keep
+
+    def _search(self, max_conflicts: int) -> Optional[bool]:
+        """Search until the clauses are proven (un)satisfiable or `max_conflicts` conflicts occur.
+
+        Return None if the search stopped due to the conflict limit.
+        """
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self._conflicts += 1
+                conflicts += 1
+                if not self._trail_limits:
+                    self._ok = False
+                    return False
+
+                learnt, level, lbd = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    clause = _Clause(learnt, learnt=True, lbd=lbd)
+                    self._learnts.append(clause)
+                    self._watch(clause)
+                    self._bump_clause(clause)
+                    self._enqueue(learnt[0], clause)
+
+                self._var_inc /= self.var_decay
+                self._clause_inc /= self.clause_decay
+            else:
+                if conflicts >= max_conflicts:
+                    self._backtrack(0)
+                    return None
+                if len(self._learnts) - len(self._trail) >= self._max_learnts:
+                    self._reduce_learnts()
+
+                # Assumptions are decided first, each at its own decision level.
+                lit = None
+                while len(self._trail_limits) < len(self._assumptions):
+                    assumption = self._assumptions[len(self._trail_limits)]
+                    if self._values[assumption] == _TRUE:
+                        self._trail_limits.append(len(self._trail))  # An empty decision level.
+                    elif self._values[assumption] == _FALSE:
+                        self._backtrack(0)
+                        return False
+                    else:
+                        lit = assumption
+                        break
+                if lit is None:
+                    lit = self._decide()
+                if lit is None:
+                    return True
+                self._decisions += 1
+                self._trail_limits.append(len(self._trail))
+                self._enqueue(lit, None)
+
+
+def solve(formula: nodes.Formula) -> Optional[dict[str, bool]]:
+    """Return an assignment of truth values to variables which satisfies `formula`.
+
+    Return None if `formula` is unsatisfiable. The formula is encoded into CNF with
+    `cnf.TseitinEncoder`.
+    """
+    encoder = cnf.TseitinEncoder()
+    solver = Solver(encoder.encode(formula))
+    while solver.num_vars < encoder.num_vars:  # Variables may only be in tautologies.
+        solver.new_var()
+    if solver.solve():
+        return {name: solver.model[var] for name, var in encoder.variables.items()}
+    else:
+        return None
+
+
+def is_satisfiable(formula: nodes.Formula) -> bool:
+    """Return True if some assignment of truth values to variables satisfies `formula`."""
+    return solve(formula) is not None
+
+
+def iter_models(
+    formula: nodes.Formula, variables: Optional[Sequence[str]] = None
+) -> Iterator[dict[str, bool]]:
+    """Yield the assignments of truth values to `variables` which extend to models of `formula`.
+
+    `variables` defaults to the formula's variables, so that its models are yielded; otherwise
+    they're projected onto `variables`, and each projected assignment is yielded once. Variables
+    which aren't in the formula may be either true or false.
+
+    Models are found lazily by the solver, as a depth-first search over the values of
+    `variables`: each model found is followed to its last variable, and then the last value
+    which hasn't been flipped yet is flipped, and assumed with the values before it. Unlike
+    blocking clauses, this only keeps the current assignment, so memory doesn't grow with the
+    number of models yielded.
+    """
+    if variables is None:
+        variables = nodes.variable_names(formula)
+    encoder = cnf.TseitinEncoder()
+    solver = Solver(encoder.encode(formula))
+    vars_ = [encoder.variable(name) for name in variables]
+    while solver.num_vars < encoder.num_vars:
+        solver.new_var()
+    if not solver.solve():
+        return
+
+    model = solver.model
+    path: list[tuple[int, bool]] = []  # The assumed literal per variable, and if it's flipped.
+    while True:
+        while len(path) < len(vars_):
+            var = vars_[len(path)]
+            path.append((var if model[var] else -var, False))
+        yield {name: lit > 0 for name, (lit, _) in zip(variables, path)}
+
+        while True:
+            while path and path[-1][1]:
+                path.pop()
+            if not path:
+                return
+            path[-1] = (-path[-1][0], True)
+            if solver.solve([lit for lit, _ in path]):
+                model = solver.model
+                break
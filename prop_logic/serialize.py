@@ -0,0 +1,213 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from prop_logic import nodes
+from prop_logic.flat import FlatFormula
+
+__all__ = ("MAGIC", "VERSION", "FormulaFile", "write_formulas")
+
+MAGIC = b"PLFF"
+VERSION = 1
+
+# Magic, version, reserved, and the numbers of formulas, names, nodes, name references, and bytes
+# of encoded names.
+_HEADER = struct.Struct("<4sHHQQQQQ")
+_ALIGNMENT = 8
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _layout(
+    num_formulas: int, num_names: int, num_nodes: int, num_refs: int, names_size: int
+) -> list[tuple[str, int, int]]:
+    """Return the typecode, offset and length of each section of a file, in order.
+
+    The sections are the node offsets and name reference offsets of each formula, the name
+    references, the args and ops of all nodes, the offsets of the encoded names, and the names.
+    """
+    sections = []
+    offset = _HEADER.size
+    for typecode, length in (
+        ("Q", num_formulas + 1),
+        ("Q", num_formulas + 1),
+        ("I", num_refs),
+        ("I", num_nodes),
+        ("B", num_nodes),
+        ("Q", num_names + 1),
+        ("B", names_size),
+    ):
+        offset = _align(offset)
+        sections.append((typecode, offset, length))
+        offset += length * array(typecode).itemsize
+    return sections
+
+
+def write_formulas(
+    formulas: Iterable[Union[nodes.Formula, FlatFormula]],
+    file: Union[str, os.PathLike, IO[bytes]],
+) -> None:
+    """Write `formulas` to `file`, a path or binary file, in the binary formula format.
+
+    Each formula is stored flat, as in a `FlatFormula`, with its variables referring to a table
+    of names shared by all formulas. Integers are little-endian and sections are aligned so that
+    `FormulaFile` can map them into memory without copying.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as f:
+            return write_formulas(formulas, f)
+
+    node_offsets = array("Q", [0])
+    ref_offsets = array("Q", [0])
+    refs = array("I")
+    args = array("I")
+    ops = array("B")
+    name_indices: dict[str, int] = {}
+
+    for formula in formulas:
+        if not isinstance(formula, FlatFormula):
+            formula = FlatFormula.from_formula(formula)
+        for name in formula.names:
+            refs.append(name_indices.setdefault(name, len(name_indices)))
+        ops.extend(formula.ops)
+        args.extend(formula.args)
+        node_offsets.append(len(ops))
+        ref_offsets.append(len(refs))
+
+    encoded = [name.encode("utf-8") for name in name_indices]
+    name_offsets = array("Q", [0])
+    for name in encoded:
+        name_offsets.append(name_offsets[-1] + len(name))
+    names = b"".join(encoded)
+
+    sections = (node_offsets, ref_offsets, refs, args, ops, name_offsets, names)
+    layout = _layout(len(node_offsets) - 1, len(encoded), len(ops), len(refs), len(names))
+
+    file.write(
+        _HEADER.pack(
+            MAGIC, VERSION, 0, len(node_offsets) - 1, len(encoded), len(ops), len(refs), len(names)
+        )
+    )
+    position = _HEADER.size
+    for section, (_, offset, _) in zip(sections, layout):
+        file.write(bytes(offset - position))
+        if isinstance(section, array) and sys.byteorder != "little":
+            section = array(section.typecode, section)
+            section.byteswap()
+        data = section if isinstance(section, bytes) else section.tobytes()
+        file.write(data)
+        position = offset + len(data)
+
+
+class FormulaFile:
+    """A file of formulas in the binary formula format, memory-mapped for reading.
+
+    Opening the file only reads its header; formulas are `FlatFormula`s whose arrays are views
+    of the mapped file, so they can be evaluated or printed without parsing or building `nodes`
+    objects. Variable names are decoded when a formula using them is first accessed.
+
+    Formulas read from the file reference the mapped memory, so they stay valid after it's
+    closed, and the file is only unmapped once they've been released too.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError("Not a formula file: the file is too short.")
+            self._mmap: Optional[mmap.mmap] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, _, *counts = _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"Not a formula file: bad magic number {magic!r}.")
+            elif version != VERSION:
+                raise ValueError(f"Unsupported formula file version {version}.")
+
+            layout = _layout(*counts)
+            _, last_offset, last_length = layout[-1]
+            if last_offset + last_length > size:
+                raise ValueError("Not a formula file: the file is truncated.")
+
+            self._view = memoryview(self._mmap)
+            self._sections = [self._section(*section) for section in layout]
+            (
+                self._node_offsets,
+                self._ref_offsets,
+                self._refs,
+                self._args,
+                self._ops,
+                self._name_offsets,
+                self._names_data,
+            ) = self._sections
+        except BaseException:
+            self.close()
+            raise
+
+        self._names: list[Optional[str]] = [None] * counts[1]
+
+    def _section(self, typecode: str, offset: int, length: int) -> Union[array, memoryview]:
+        view = self._view[offset : offset + length * array(typecode).itemsize]
+        if typecode == "B" or sys.byteorder == "little":
+            return view.cast(typecode)
+        # Big-endian hosts can't use the little-endian data in place, so copy it.
+        section = array(typecode, view.tobytes())
+        section.byteswap()
+        return section
+
+    def __enter__(self) -> "FormulaFile":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the file, and unmap it once no formulas read from it are left."""
+        for section in getattr(self, "_sections", ()):
+            if isinstance(section, memoryview):
+                section.release()
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+
+        mapping, self._mmap = self._mmap, None
+        if mapping is not None:
+            try:
+                mapping.close()
+            except BufferError:
+                # Formulas which are still alive hold views of the mapping, which keep it open;
+                # it's unmapped when the last of them is released.
+                pass
+
+    def __len__(self) -> int:
+        """Return the number of formulas."""
+        return len(self._node_offsets) - 1
+
+    def name(self, index: int) -> str:
+        """Return the variable name at `index` of the file's table of names."""
+        name = self._names[index]
+        if name is None:
+            start, end = self._name_offsets[index], self._name_offsets[index + 1]
+            name = sys.intern(bytes(self._names_data[start:end]).decode("utf-8"))
+            self._names[index] = name
+        return name
+
+    def __getitem__(self, index: int) -> FlatFormula:
+        """Return the formula at `index` as a view of the file."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Formula {index} is out of range.")
+
+        start, end = self._node_offsets[index], self._node_offsets[index + 1]
+        ref_start, ref_end = self._ref_offsets[index], self._ref_offsets[index + 1]
+        names = [self.name(ref) for ref in self._refs[ref_start:ref_end]]
+        return FlatFormula(self._ops[start:end], self._args[start:end], names)
+
+    def __iter__(self) -> Iterator[FlatFormula]:
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,288 @@
+from typing import Union
+
+from prop_logic import interned, nodes
+from prop_logic.connectives import Conjunction, Disjunction, Negation
+from prop_logic.lexer import TokenType
+
+__all__ = ("Result", "Simplifier", "simplify", "to_nnf", "to_dnf")
+
+# A simplified formula, or a constant truth value if it's a tautology or contradiction.
+Result = Union[interned.InternedFormula, bool]
+# A subformula of a chain of connectives, and whether it's negated.
+_Leaf = tuple[interned.InternedFormula, bool]
+# The literals of a term of a DNF in order, keyed by the set of them.
+_Terms = dict[frozenset, tuple]
+
+DEFAULT_MAX_TERMS = 4096
+
+
+def _chain(node: nodes.Formula, type_: TokenType) -> list[nodes.Formula]:
+    """Return the operands of the chain of `type_` connectives rooted at `node`, in order."""
+    operands = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.BinaryFormula) and node.connective.type is type_:
+            stack.append(node.right)
+            stack.append(node.left)
+        else:
+            operands.append(node)
+    return operands
+
+
+def _leaves(node: nodes.BinaryFormula) -> tuple[bool, list[_Leaf]]:
+    """Return if `node` is conjunctive, and the operands of the chain of connectives rooted at it.
+
+    Implications are disjunctions of their negated left operand and their right operand, so they
+    are part of chains of disjunctions.
+    """
+    if node.connective.type is TokenType.AND:
+        return True, [(leaf, False) for leaf in _chain(node, TokenType.AND)]
+
+    leaves = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, nodes.BinaryFormula) and node.connective.type is TokenType.OR:
+            stack.append(node.right)
+            stack.append(node.left)
+        elif isinstance(node, nodes.BinaryFormula) and node.connective.type is TokenType.IMPLIES:
+            stack.append(node.right)
+            leaves.append((node.left, True))
+        else:
+            leaves.append((node, False))
+    return False, leaves
+
+
+def _drop_subsumed(terms: _Terms) -> _Terms:
+    """Return `terms` without those which contain all the literals of another term."""
+    kept: list[frozenset] = []
+    for literals in sorted(terms, key=len):
+        if not any(other <= literals for other in kept):
+            kept.append(literals)
+    kept_set = set(kept)
+    return {literals: term for literals, term in terms.items() if literals in kept_set}
+
+
+def _limit(terms: _Terms, max_terms: int) -> _Terms:
+    """Return `terms` without subsumed terms. Raise ValueError if more than `max_terms` remain."""
+    terms = _drop_subsumed(terms)
+    if len(terms) > max_terms:
+        raise ValueError(f"The DNF has more than {max_terms} terms.")
+    return terms
+
+
+class Simplifier:
+    """Rewriter of formulas into simpler equivalent ones and into normal forms.
+
+    Formulas are hash-consed by `interner`, and the result of each rewrite is memoized per
+    subformula, so a subformula which is shared, within a formula or between formulas rewritten
+    by the same simplifier, is only rewritten once. Rewriting is iterative, so formulas may be
+    nested arbitrarily deeply. Results are interned formulas, or constant truth values.
+    """
+
+    def __init__(self, interner: interned.Interner = interned.interner):
+        self.interner = interner
+        self._simplified: dict[interned.InternedFormula, Result] = {}
+        self._nnf: dict[tuple[interned.InternedFormula, bool], interned.InternedFormula] = {}
+
+    def _negate(self, formula: Result) -> Result:
+        if isinstance(formula, bool):
+            return not formula
+        elif isinstance(formula, nodes.UnaryFormula):
+            return formula.operand
+        else:
+            return self.interner.unary(Negation, formula)
+
+    def _join(self, conjunctive: bool, operands: list[Result]) -> Result:
+        """Return the conjunction or disjunction of the simplified `operands`, simplified."""
+        type_, dual = TokenType.AND, TokenType.OR
+        if not conjunctive:
+            type_, dual = dual, type_
+
+        # Fold constants, and flatten and deduplicate operands.
+        unique: dict[Result, None] = {}
+        for operand in operands:
+            if isinstance(operand, bool):
+                if operand is not conjunctive:
+                    return operand
+            else:
+                unique.update(dict.fromkeys(_chain(operand, type_)))
+
+        # The conjunction of a formula and its negation is false, and their disjunction is true.
+        for operand in unique:
+            if isinstance(operand, nodes.UnaryFormula) and operand.operand in unique:
+                return not conjunctive
+
+        # Absorption: A ∧ (A ∨ B) is A, and (A ∨ B) ∧ (A ∨ B ∨ C) is A ∨ B. An operand of the
+        # dual connective is only compared to those which contain its least common operand.
+        duals: dict[Result, frozenset] = {}
+        containing: dict[nodes.Formula, list[Result]] = {}
+        for operand in unique:
+            if isinstance(operand, nodes.BinaryFormula) and operand.connective.type is dual:
+                duals[operand] = elements = frozenset(_chain(operand, dual))
+                for element in elements:
+                    containing.setdefault(element, []).append(operand)
+
+        absorbed = set()
+        for operand, elements in duals.items():
+            if operand in absorbed:
+                continue
+            elif any(element in unique for element in elements):
+                absorbed.add(operand)
+                continue
+            rarest = min(elements, key=lambda element: len(containing[element]))
+            for other in containing[rarest]:
+                if other is not operand and elements <= duals[other]:
+                    absorbed.add(other)
+        result = [operand for operand in unique if operand not in absorbed]
+
+        if not result:
+            return conjunctive
+        connective = Conjunction if conjunctive else Disjunction
+        formula = result[0]
+        for operand in result[1:]:
+            formula = self.interner.binary(formula, connective, operand)
+        return formula
+
+    def simplify(self, formula: nodes.Formula) -> Result:
+        """Return a simplified formula equivalent to `formula`.
+
+        Implications are eliminated, double negations are removed, conjunctions and disjunctions
+        are flattened and deduplicated (idempotence) and absorb the disjunctions and
+        conjunctions which contain their operands (absorption). Tautologies and contradictions
+        which are found on the way are folded into constants, so the result is True or False
+        if the whole formula folds.
+        """
+        root = self.interner.intern(formula)
+        memo = self._simplified
+        stack: list[tuple[interned.InternedFormula, bool]] = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in memo:
+                continue
+            elif isinstance(node, nodes.Variable):
+                memo[node] = node
+            elif isinstance(node, nodes.UnaryFormula):
+                if expanded:
+                    memo[node] = self._negate(memo[node.operand])
+                else:
+                    stack.append((node, True))
+                    stack.append((node.operand, False))
+            else:
+                # A chain of the same connective is simplified as a whole, which skips the
+                # binary formulas within it.
+                conjunctive, leaves = _leaves(node)
+                if expanded:
+                    operands = [
+                        self._negate(memo[leaf]) if negated else memo[leaf]
+                        for leaf, negated in leaves
+                    ]
+                    memo[node] = self._join(conjunctive, operands)
+                else:
+                    stack.append((node, True))
+                    stack.extend((leaf, False) for leaf, _ in reversed(leaves))
+
+        return memo[root]
+
+    def to_nnf(self, formula: nodes.Formula) -> interned.InternedFormula:
+        """Return `formula` in negation normal form (NNF).
+
+        Implications are eliminated and negations are pushed inwards with De Morgan's laws, so
+        that only variables are negated.
+        """
+        root = self.interner.intern(formula)
+        memo = self._nnf
+        interner = self.interner
+        stack: list[tuple[interned.InternedFormula, bool, bool]] = [(root, False, False)]
+        while stack:
+            node, negated, expanded = stack.pop()
+            if (node, negated) in memo:
+                continue
+            elif isinstance(node, nodes.Variable):
+                memo[node, negated] = interner.unary(Negation, node) if negated else node
+            elif isinstance(node, nodes.UnaryFormula):
+                if expanded:
+                    memo[node, negated] = memo[node.operand, not negated]
+                else:
+                    stack.append((node, negated, True))
+                    stack.append((node.operand, not negated, False))
+            else:
+                type_ = node.connective.type
+                left_negated = negated is not (type_ is TokenType.IMPLIES)
+                if expanded:
+                    conjunctive = (type_ is TokenType.AND) is not negated
+                    memo[node, negated] = interner.binary(
+                        memo[node.left, left_negated],
+                        Conjunction if conjunctive else Disjunction,
+                        memo[node.right, negated],
+                    )
+                else:
+                    stack.append((node, negated, True))
+                    stack.append((node.right, negated, False))
+                    stack.append((node.left, left_negated, False))
+
+        return memo[root, False]
+
+    def to_dnf(self, formula: nodes.Formula, max_terms: int = DEFAULT_MAX_TERMS) -> Result:
+        """Return `formula` in disjunctive normal form (DNF), or a constant truth value.
+
+        The formula is simplified first, so tautologies and contradictions within it are folded
+        before they are distributed. The DNF is a disjunction of terms, which are conjunctions of
+        literals. Terms which contain a variable and its negation, and terms which contain all
+        the literals of another term, are dropped. A DNF may be exponentially larger than the
+        formula, so raise ValueError if it would have more than `max_terms` terms.
+        """
+        simplified = self.simplify(formula)
+        if isinstance(simplified, bool):
+            return simplified
+
+        terms: dict[interned.InternedFormula, _Terms] = {}
+        nnf = self.to_nnf(simplified)
+        for node in nodes.iter_postorder(nnf):
+            if node in terms:
+                continue
+            elif isinstance(node, nodes.BinaryFormula) and node.connective.type is TokenType.OR:
+                result = dict(terms[node.left])
+                result.update(terms[node.right])
+            elif isinstance(node, nodes.BinaryFormula):
+                result = {}
+                for left_set, left in terms[node.left].items():
+                    for right_set, right in terms[node.right].items():
+                        if any(self._negate(literal) in left_set for literal in right_set):
+                            continue
+                        term = left + tuple(lit for lit in right if lit not in left_set)
+                        result[left_set | right_set] = term
+                        if len(result) > max_terms:
+                            result = _limit(result, max_terms)
+            else:
+                result = {frozenset((node,)): (node,)}  # A literal.
+
+            if len(result) > max_terms:
+                result = _limit(result, max_terms)
+            terms[node] = result
+
+        result = _drop_subsumed(terms[nnf])
+        if not result:
+            return False
+        elif () in result.values():
+            return True
+        return self._join(False, [self._join(True, list(term)) for term in result.values()])
+
+
+def simplify(formula: nodes.Formula) -> Result:
+    """Return a simplified formula equivalent to `formula`, or a constant truth value."""
+    return Simplifier().simplify(formula)
+
+
+def to_nnf(formula: nodes.Formula) -> interned.InternedFormula:
+    """Return `formula` in negation normal form (NNF)."""
+    return Simplifier().to_nnf(formula)
+
+
+def to_dnf(formula: nodes.Formula, max_terms: int = DEFAULT_MAX_TERMS) -> Result:
+    """Return `formula` in disjunctive normal form (DNF), or a constant truth value.
+
+    Raise ValueError if it would have more than `max_terms` terms.
+    """
+    return Simplifier().to_dnf(formula, max_terms)
@@ -0,0 +1,90 @@
+import mmap
+import os
+from typing import Iterator, Optional, TextIO, Union
+
+from prop_logic import nodes
+from prop_logic.lexer import DEFAULT_CHUNK_SIZE, Token, TokenType, lex, lex_stream, scan
+from prop_logic.parser import IterativeParser
+
+__all__ = ("parse_file", "parse_stream")
+
+
+def _lex_ascii(buffer: mmap.mmap, start: int, end: int) -> Optional[list[Token]]:
+    """Lex the ASCII line `buffer[start:end]` and return its tokens.
+
+    Return None if the line contains a non-ASCII byte or an unknown character.
+    """
+    tokens = []
+    for type_, match in scan(buffer, start, end):
+        if type_ is TokenType.WHITESPACE:
+            continue
+        elif type_ is None:
+            return None
+        else:
+            tokens.append(Token(type_, match.group().decode("ascii"), match.start() - start))
+    return tokens
+
+
+def _parse_line(
+    buffer: mmap.mmap, start: int, end: int
+) -> Optional[Union[nodes.Formula, ValueError]]:
+    """Parse the line `buffer[start:end]`. Return None if it's blank."""
+    tokens = _lex_ascii(buffer, start, end)
+    try:
+        if tokens is None:
+            # Lex the decoded line, which also reports unknown characters by their position.
+            line = buffer[start:end].decode("utf-8")
+            if not line or line.isspace():
+                return None
+            return IterativeParser(lex(line)).parse()
+        elif not tokens:
+            return None
+        else:
+            return IterativeParser(iter(tokens)).parse()
+    except ValueError as e:  # Including UnicodeDecodeError.
+        return e
+
+
+def parse_file(
+    path: Union[str, os.PathLike]
+) -> Iterator[tuple[int, Union[nodes.Formula, ValueError]]]:
+    """Parse a UTF-8 file with one formula per line and yield each line's number and formula.
+
+    The file is memory-mapped and lines are lexed directly from the mapping, so neither the file
+    nor its lines are read into strings; only lines containing non-ASCII characters are decoded.
+    Results are yielded lazily, so memory usage doesn't grow with the size of the file.
+
+    Line numbers start at 1 and blank lines are skipped. If a line fails to lex or parse, the
+    ValueError is yielded in place of its formula, with positions relative to the start of the
+    line, and parsing continues with the next line.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return  # Empty files can't be mapped.
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if hasattr(buffer, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+
+            size = len(buffer)
+            start = 0
+            line_number = 1
+            while start < size:
+                end = buffer.find(b"\n", start)
+                if end == -1:
+                    end = size
+                result = _parse_line(buffer, start, end)
+                if result is not None:
+                    yield line_number, result
+                start = end + 1
+                line_number += 1
+
+
+def parse_stream(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> nodes.Formula:
+    """Parse a single formula read from a text stream in chunks of `chunk_size` characters.
+
+    Tokens are lexed lazily as the parser consumes them, so the text is never held in memory as
+    a whole; memory usage is proportional to the chunk size and the size of the tree. Positions
+    in errors are relative to the start of the stream.
+    """
+    return IterativeParser(lex_stream(stream, chunk_size)).parse()
@@ -0,0 +1,84 @@
+import sys
+from typing import Iterable, Iterator, Sequence
+
+from prop_logic import nodes
+
+__all__ = ("SymbolTable", "renumber")
+
+
+class SymbolTable:
+    """A mapping of variable names to dense integer IDs, starting from 0.
+
+    IDs are assigned in the order names are first interned, so the same names in the same order
+    always get the same IDs. A table can be shared by all formulas of a batch by passing it to a
+    `Parser`, whose variables then carry their IDs, so that evaluators can index lists or bits
+    instead of hashing names.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def __len__(self) -> int:
+        """Return the number of names."""
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names in order of their IDs."""
+        return iter(self._names)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._names!r})"
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Return the names in order of their IDs."""
+        return tuple(self._names)
+
+    def intern(self, name: str) -> int:
+        """Return the ID of `name`, assigning it the next ID if it's new."""
+        id_ = self._ids.get(name)
+        if id_ is None:
+            id_ = self._ids[name] = len(self._names)
+            self._names.append(sys.intern(name))
+        return id_
+
+    def id(self, name: str) -> int:
+        """Return the ID of `name`. Raise KeyError if it has none."""
+        return self._ids[name]
+
+    def name(self, id_: int) -> str:
+        """Return the name with the ID `id_`. Raise IndexError if there's none."""
+        if id_ < 0:
+            raise IndexError(f"Invalid ID {id_}.")
+        return self._names[id_]
+
+    def merge(self, other: "SymbolTable") -> list[int]:
+        """Add the names of `other` which are missing from this table, in `other`'s order.
+
+        Return a list which maps each ID of `other` to the ID of the same name in this table,
+        e.g. to `renumber` formulas parsed with `other` by another process.
+        """
+        return [self.intern(name) for name in other._names]
+
+    def sorted(self) -> tuple["SymbolTable", list[int]]:
+        """Return a table of the names in sorted order, and a list mapping old IDs to new ones.
+
+        Unlike first-occurrence order, sorted order doesn't depend on the order of formulas.
+        """
+        table = SymbolTable(sorted(self._names))
+        return table, [table._ids[name] for name in self._names]
+
+
+def renumber(formula: nodes.Formula, mapping: Sequence[int]) -> None:
+    """Replace each variable ID in `formula` by `mapping[id]`, in place."""
+    for node in nodes.iter_postorder(formula):
+        if isinstance(node, nodes.Variable):
+            if node.id is None:
+                raise ValueError(f"Variable {node.name!r} has no ID.")
+            node.id = mapping[node.id]
@@ -0,0 +1,201 @@
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+from prop_logic import interned, nodes
+from prop_logic.lexer import TokenType
+
+__all__ = (
+    "TruthTable",
+    "truth_table",
+    "iter_chunks",
+    "count_models",
+    "is_satisfiable",
+    "is_tautology",
+    "popcount",
+)
+
+DEFAULT_CHUNK_BITS = 20
+
+
+#: Return the number of set bits of a non-negative integer. int.bit_count is only available in
+#: Python 3.10+, and the project supports 3.9.
+popcount = getattr(int, "bit_count", None) or (lambda value: bin(value).count("1"))
+
+
+class TruthTable(NamedTuple):
+    """The truth table of a propositional formula.
+
+    The table has a row for each of the 2^n assignments of the `variables`. In row r, the
+    variable at index i is true if bit (n - 1 - i) of r is set, so the first variable alternates
+    slowest and row 0 assigns false to all variables. Bit r of `rows` is the formula's truth value
+    in row r.
+    """
+
+    variables: tuple[str, ...]
+    rows: int
+    count: int
+
+    @property
+    def size(self) -> int:
+        """Return the number of rows."""
+        return 1 << len(self.variables)
+
+    @property
+    def is_tautology(self) -> bool:
+        """Return True if the formula is true in every row."""
+        return self.count == self.size
+
+    @property
+    def is_satisfiable(self) -> bool:
+        """Return True if the formula is true in at least one row."""
+        return self.count > 0
+
+    @property
+    def is_contradiction(self) -> bool:
+        """Return True if the formula is false in every row."""
+        return self.count == 0
+
+    def assignment(self, row: int) -> dict[str, bool]:
+        """Return the assignment of truth values to variables in `row`."""
+        n = len(self.variables)
+        return {name: bool(row >> (n - 1 - i) & 1) for i, name in enumerate(self.variables)}
+
+    def value(self, row: int) -> bool:
+        """Return the formula's truth value in `row`."""
+        if not 0 <= row < self.size:
+            raise IndexError(f"Row {row} is out of range.")
+        return bool(self.rows >> row & 1)
+
+
+def _periodic_pattern(bit: int, width: int) -> int:
+    """Return `width` bits where bit r is set if bit `bit` of r is set."""
+    period = 1 << (bit + 1)
+    pattern = ((1 << (period >> 1)) - 1) << (period >> 1)
+    while period < width:
+        pattern |= pattern << period
+        period <<= 1
+    return pattern
+
+
+def iter_chunks(
+    formula: nodes.Formula,
+    variables: Optional[Sequence[str]] = None,
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+) -> Iterator[tuple[int, int, int]]:
+    """Evaluate `formula` for every assignment of `variables` and yield the results in chunks.
+
+    Each chunk is a tuple of the index of its first row, its number of rows, and its rows as the
+    bits of an int; rows are numbered as in a `TruthTable`. Chunks have at most 2^`chunk_bits`
+    rows, which bounds memory usage regardless of the number of variables.
+
+    Every variable's column is an int with the variable's alternating bit pattern, and each
+    connective is a bitwise operation on its operands' columns, so a chunk is computed with a
+    single pass over the formula. Repeated subformulas are evaluated once per chunk.
+    If `variables` is None, the formula's variables are used in order of first occurrence.
+    """
+    if chunk_bits < 0:
+        raise ValueError(f"chunk_bits must be at least 0, not {chunk_bits}.")
+    if variables is None:
+        variables = nodes.variable_names(formula)
+    positions = {name: len(variables) - 1 - i for i, name in enumerate(variables)}
+
+    formula = interned.intern(formula)
+    order = list(nodes.iter_postorder(formula))
+    for node in order:
+        if isinstance(node, nodes.Variable) and node.name not in positions:
+            raise ValueError(f"Variable {node.name!r} is missing from the variable order.")
+
+    # Count the parents of each node so its column can be freed after its last use.
+    uses = {id(formula): 1}
+    for node in order:
+        for child in node.children:
+            uses[id(child)] = uses.get(id(child), 0) + 1
+
+    total = 1 << len(variables)
+    size = min(total, 1 << chunk_bits)
+    mask = (1 << size) - 1
+    patterns = {bit: _periodic_pattern(bit, size) for bit in range(min(chunk_bits, len(variables)))}
+
+    for start in range(0, total, size):
+        columns: dict[int, int] = {}
+        remaining = dict(uses)
+        for node in order:
+            if isinstance(node, nodes.Variable):
+                bit = positions[node.name]
+                if bit in patterns:
+                    column = patterns[bit]
+                else:
+                    column = mask if start >> bit & 1 else 0
+            else:
+                operands = []
+                for child in node.children:
+                    operands.append(columns[id(child)])
+                    remaining[id(child)] -= 1
+                    if not remaining[id(child)]:
+                        del columns[id(child)]
+                column = _evaluate(node.connective.type, operands, mask)
+            columns[id(node)] = column
+
+        yield start, size, columns[id(formula)]
+
+
+def _evaluate(type_: TokenType, operands: list[int], mask: int) -> int:
+    if type_ is TokenType.NOT:
+        return operands[0] ^ mask
+    elif type_ is TokenType.AND:
+        return operands[0] & operands[1]
+    elif type_ is TokenType.OR:
+        return operands[0] | operands[1]
+    elif type_ is TokenType.IMPLIES:
+        return (operands[0] ^ mask) | operands[1]
+    else:
+        raise ValueError(f"Unsupported connective type {type_}.")
+
+
+def truth_table(
+    formula: nodes.Formula,
+    variables: Optional[Sequence[str]] = None,
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+) -> TruthTable:
+    """Return the truth table of `formula` over `variables`.
+
+    If `variables` is None, the formula's variables are used in order of first occurrence.
+    The table is computed in chunks of 2^`chunk_bits` rows; see `iter_chunks`.
+    """
+    if variables is None:
+        variables = nodes.variable_names(formula)
+
+    chunks = []
+    count = 0
+    for _, size, rows in iter_chunks(formula, variables, chunk_bits):
+        count += popcount(rows)
+        chunks.append(rows)
+
+    if len(chunks) == 1:
+        rows = chunks[0]
+    elif size % 8 == 0:
+        rows = int.from_bytes(b"".join(c.to_bytes(size // 8, "little") for c in chunks), "little")
+    else:
+        rows = sum(chunk << (i * size) for i, chunk in enumerate(chunks))
+
+    return TruthTable(tuple(variables), rows, count)
+
+
+def count_models(
+    formula: nodes.Formula,
+    variables: Optional[Sequence[str]] = None,
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+) -> int:
+    """Return the number of assignments of `variables` which satisfy `formula`."""
+    return sum(popcount(rows) for _, _, rows in iter_chunks(formula, variables, chunk_bits))
+
+
+def is_satisfiable(formula: nodes.Formula, chunk_bits: int = DEFAULT_CHUNK_BITS) -> bool:
+    """Return True if some assignment satisfies `formula`, stopping at the first such chunk."""
+    return any(rows for _, _, rows in iter_chunks(formula, chunk_bits=chunk_bits))
+
+
+def is_tautology(formula: nodes.Formula, chunk_bits: int = DEFAULT_CHUNK_BITS) -> bool:
+    """Return True if every assignment satisfies `formula`, stopping at the first false chunk."""
+    return all(
+        rows == (1 << size) - 1 for _, size, rows in iter_chunks(formula, chunk_bits=chunk_bits)
+    )
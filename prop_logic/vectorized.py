@@ -0,0 +1,101 @@
+from typing import TYPE_CHECKING, Any, Mapping, Sequence, Union
+
+from prop_logic import interned, nodes
+from prop_logic.lexer import TokenType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+__all__ = ("evaluate_batch",)
+
+Columns = Union[Mapping[str, int], Sequence[str]]
+
+
+def _column(data: "npt.NDArray[Any]", index: int, packed: bool) -> "npt.NDArray[np.bool_]":
+    """Return the truth values of column `index` of `data`."""
+    if packed:
+        # Columns are packed into bytes most significant bit first, as by numpy.packbits.
+        byte = data[:, index >> 3]
+        return (byte & (0x80 >> (index & 7))).astype(bool)
+    else:
+        return data[:, index].astype(bool, copy=False)
+
+
+def evaluate_batch(
+    formula: nodes.Formula,
+    data: "npt.ArrayLike",
+    columns: Columns,
+    packed: bool = False,
+) -> "npt.NDArray[np.bool_]":
+    """Evaluate `formula` for each row of `data` and return a boolean array of the results.
+
+    `data` is a 2-D array with one row per assignment and one column per variable. `columns` maps
+    variable names to column indices; a sequence of names maps each name to its position. If
+    `packed` is True, `data` is a uint8 array whose rows are bit-packed as by
+    `numpy.packbits(..., axis=1)`; only the columns the formula uses are unpacked.
+
+    The formula is evaluated column-wise with vectorised NumPy operations. It's interned first,
+    so a repeated subformula is evaluated once, and intermediate results are freed after their
+    last use. Requires NumPy, which is available through the `numpy` extra.
+    """
+    if np is None:
+        raise ImportError("evaluate_batch requires NumPy; install prop_logic[numpy].")
+
+    data = np.asarray(data)
+    if data.ndim != 2:
+        raise ValueError(f"data must be a 2-D array, not {data.ndim}-D.")
+    if packed and data.dtype != np.uint8:
+        raise ValueError(f"Packed data must have dtype uint8, not {data.dtype}.")
+    if not isinstance(columns, Mapping):
+        columns = {name: i for i, name in enumerate(columns)}
+
+    width = data.shape[1] * 8 if packed else data.shape[1]
+    formula = interned.intern(formula)
+    order = list(nodes.iter_postorder(formula))
+
+    uses = {id(formula): 1}
+    for node in order:
+        if isinstance(node, nodes.Variable):
+            if node.name not in columns:
+                raise ValueError(f"Variable {node.name!r} is missing from the columns.")
+            elif not 0 <= columns[node.name] < width:
+                raise ValueError(f"Column {columns[node.name]} of {node.name!r} is out of range.")
+        for child in node.children:
+            uses[id(child)] = uses.get(id(child), 0) + 1
+
+    results: dict[int, "npt.NDArray[np.bool_]"] = {}
+    for node in order:
+        if isinstance(node, nodes.Variable):
+            result = _column(data, columns[node.name], packed)
+        else:
+            operands = []
+            for child in node.children:
+                operands.append(results[id(child)])
+                uses[id(child)] -= 1
+                if not uses[id(child)]:
+                    del results[id(child)]
+            result = _evaluate(node.connective.type, operands)
+        results[id(node)] = result
+
+    result = results[id(formula)]
+    if isinstance(formula, nodes.Variable):
+        result = result.copy()  # Don't return a view of `data`.
+    return result
+
+
+def _evaluate(type_: TokenType, operands: list) -> "npt.NDArray[np.bool_]":
+    if type_ is TokenType.NOT:
+        return ~operands[0]
+    elif type_ is TokenType.AND:
+        return operands[0] & operands[1]
+    elif type_ is TokenType.OR:
+        return operands[0] | operands[1]
+    elif type_ is TokenType.IMPLIES:
+        return ~operands[0] | operands[1]
+    else:
+        raise ValueError(f"Unsupported connective type {type_}.")
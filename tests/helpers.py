@@ -0,0 +1,53 @@
+import random
+
+from prop_logic import lexer
+from prop_logic.nodes import BinaryFormula, Formula, UnaryFormula
+from prop_logic.parser import Parser
+
+PARAMS_ERRORS = [
+    "",
+    "A B",
+    "A )",
+    ")",
+    "(A",
+    "(A B",
+    "((A & B)",
+    "A &",
+    "~",
+    "()",
+]
+
+
+def random_formula(rng: random.Random, size: int) -> str:
+    if size <= 1:
+        return rng.choice("~ ") + rng.choice("ABCD")
+    left = rng.randint(1, size - 1)
+    formula = " ".join(
+        (
+            random_formula(rng, left),
+            rng.choice(["&", "|", ">"]),
+            random_formula(rng, size - left),
+        )
+    )
+    return rng.choice(["({})", "~({})", "{}", "{}"]).format(formula)
+
+
+def parse(parser_type, formula: str) -> Formula:
+    return parser_type(lexer.lex(formula)).parse()
+
+
+def get_ast(formula: str) -> Formula:
+    return parse(Parser, formula)
+
+
+def depth(formula: Formula) -> int:
+    result = 0
+    stack = [(formula, 1)]
+    while stack:
+        node, level = stack.pop()
+        result = max(result, level)
+        if isinstance(node, UnaryFormula):
+            stack.append((node.operand, level + 1))
+        elif isinstance(node, BinaryFormula):
+            stack.extend(((node.left, level + 1), (node.right, level + 1)))
+    return result
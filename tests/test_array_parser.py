@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.connectives import Conjunction, Negation
+from prop_logic.nodes import Formula, Variable
+from prop_logic.parser import ArrayParser, IterativeParser
+from prop_logic.symbols import SymbolTable
+
+from .helpers import PARAMS_ERRORS, parse, random_formula
+from .test_parser import PARAMS_GROUPED, PARAMS_GROUPED_NOT, PARAMS_UNGROUPED_NOT
+
+
+def parse_array(formula: str) -> Formula:
+    return ArrayParser(lexer.lex_array(formula)).parse()
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [params[0] for params in PARAMS_GROUPED + PARAMS_UNGROUPED_NOT + PARAMS_GROUPED_NOT],
+)
+def test_same_tree_as_iterative_parser(formula):
+    assert parse_array(formula) == parse(IterativeParser, formula)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_same_tree_as_iterative_parser_random(seed):
+    formula = random_formula(random.Random(seed), 20)
+    assert parse_array(formula) == parse(IterativeParser, formula)
+
+
+@pytest.mark.parametrize("formula", PARAMS_ERRORS + ["A ~", "~)", "(A &"])
+def test_same_errors_as_iterative_parser(formula):
+    with pytest.raises(ValueError) as expected:
+        parse(IterativeParser, formula)
+    with pytest.raises(ValueError) as actual:
+        parse_array(formula)
+    assert str(actual.value) == str(expected.value)
+
+
+def test_deep_nesting():
+    n = 10_000
+    result = parse_array("(" * n + "~" * n + "A" + ")" * n)
+    for _ in range(n):
+        assert result.connective is Negation
+        result = result.operand
+    assert result == Variable("A")
+
+
+def test_long_binary_chain():
+    n = 10_000
+    result = parse_array(" & ".join(["A"] * n))
+    for _ in range(n - 1):
+        assert result.connective is Conjunction
+        assert result.right == Variable("A")
+        result = result.left
+    assert result == Variable("A")
+
+
+def test_symbols():
+    symbols = SymbolTable()
+    result = ArrayParser(lexer.lex_array("~foo & bar & foo"), symbols).parse()
+    assert result.left.left.connective is Negation
+    assert result.left.left.operand.id == result.right.id == symbols.intern("foo")
+    assert result.left.right.id == symbols.intern("bar")
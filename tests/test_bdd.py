@@ -0,0 +1,144 @@
+import random
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.bdd import BDD, FALSE, TRUE
+from prop_logic.nodes import variable_names
+from prop_logic.parser import IterativeParser
+from prop_logic.truth_table import count_models, truth_table
+
+from .helpers import get_ast, random_formula
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("A | ~A", TRUE),
+        ("A & ~A", FALSE),
+        ("A > A", TRUE),
+        ("(A > B) > A > A", TRUE),
+        ("~(A | B) & A", FALSE),
+    ],
+)
+def test_constants(formula, expected):
+    assert BDD().from_formula(get_ast(formula)) == expected
+
+
+@pytest.mark.parametrize(
+    ["formula1", "formula2", "expected"],
+    [
+        ("A > B", "~A | B", True),
+        ("~(A & B)", "~A | ~B", True),
+        ("A & (B | C)", "A & B | A & C", True),
+        ("A > B", "B > A", False),
+        ("A & B", "A | B", False),
+    ],
+)
+def test_equivalent(formula1, formula2, expected):
+    bdd = BDD()
+    f, g = bdd.from_formula(get_ast(formula1)), bdd.from_formula(get_ast(formula2))
+    assert bdd.equivalent(f, g) is expected
+
+
+def test_ordering():
+    bdd = BDD(["C", "B", "A"])
+    f = bdd.from_formula(get_ast("A & B & C & D"))
+    assert bdd.variables == ["C", "B", "A", "D"]
+    assert bdd.level(f) == 0
+    assert bdd.level(bdd.high(f)) == 1
+    assert bdd.low(f) == FALSE
+
+
+def test_ordering_size():
+    # Interleaving the pairs gives a linear BDD; separating them gives an exponential one.
+    pairs = [(a, a.lower()) for a in "ABCDEF"]
+    formula = get_ast(" | ".join(f"{a} & {b}" for a, b in pairs))
+    good = BDD([name for pair in pairs for name in pair])
+    bad = BDD([a for a, _ in pairs] + [b for _, b in pairs])
+    for bdd, expected in [(good, 2 + 12), (bad, 2 + 2**7 - 2)]:
+        bdd.collect_garbage([bdd.from_formula(formula)])
+        assert len(bdd) == expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_count(seed):
+    formula = get_ast(random_formula(random.Random(seed), 30))
+    bdd = BDD()
+    f = bdd.from_formula(formula)
+    assert bdd.count(f) == count_models(formula, bdd.variables)
+
+
+def test_count_extra_variables():
+    bdd = BDD(["A", "B", "C"])
+    assert bdd.count(bdd.variable("B")) == 4
+    assert bdd.count(TRUE) == 8
+    assert bdd.count(bdd.variable("A"), 1) == 1
+    with pytest.raises(ValueError, match="depends on variable 'C'"):
+        bdd.count(bdd.variable("C"), 2)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_restrict(seed):
+    formula = get_ast(random_formula(random.Random(seed), 30))
+    names = variable_names(formula)
+    bdd = BDD(names)
+    f = bdd.from_formula(formula)
+    g = bdd.restrict(f, {names[0]: True})
+    table = truth_table(formula, names)
+    for row in range(table.size):
+        assignment = table.assignment(row)
+        if assignment[names[0]]:
+            assert _evaluate(bdd, g, assignment) == table.value(row)
+
+
+def test_quantify():
+    bdd = BDD()
+    f = bdd.from_formula(get_ast("A & B | C"))
+    assert bdd.exists(f, ["A"]) == bdd.from_formula(get_ast("B | C"))
+    assert bdd.forall(f, ["A"]) == bdd.variable("C")
+    assert bdd.exists(f, ["A", "B", "C"]) == TRUE
+    assert bdd.forall(f, ["C"]) == bdd.from_formula(get_ast("A & B"))
+
+
+def test_collect_garbage():
+    bdd = BDD()
+    keep = bdd.from_formula(get_ast("A & B"))
+    bdd.from_formula(get_ast("(C | D) & (E | F)"))
+    size = len(bdd)
+
+    # Only the terminals, "A & B" and "B" are reachable.
+    assert bdd.collect_garbage([keep]) == size - 4
+    assert len(bdd) == 4
+    assert bdd.from_formula(get_ast("B & A")) == keep
+    # Freed nodes are reused.
+    bdd.from_formula(get_ast("C | D"))
+    assert len(bdd._level) == size
+
+
+def test_cache_size():
+    with pytest.raises(ValueError, match="power of 2"):
+        BDD(cache_size=100)
+    bdd = BDD(cache_size=1)
+    formula = get_ast(random_formula(random.Random(0), 50))
+    assert bdd.count(bdd.from_formula(formula)) == count_models(formula, bdd.variables)
+
+
+def test_many_variables():
+    n = 1200
+    letters = "ABCDEFGHIJKL"
+    names = [letters[i // 100] + letters[i // 10 % 10] + letters[i % 10] for i in range(n)]
+    formula = IterativeParser(lexer.lex(" | ".join(names))).parse()
+    bdd = BDD()
+    f = bdd.from_formula(formula)
+    assert bdd.variables == names
+    assert bdd.count(f) == 2**n - 1
+    assert bdd.not_(f) == bdd.from_formula(
+        IterativeParser(lexer.lex(" & ".join("~" + name for name in names))).parse()
+    )
+
+
+def _evaluate(bdd, u, assignment):
+    while u > TRUE:
+        u = bdd.high(u) if assignment[bdd.variables[bdd.level(u)]] else bdd.low(u)
+    return u == TRUE
@@ -0,0 +1,86 @@
+import pytest
+
+from prop_logic import lexer
+from prop_logic.cache import CacheInfo, ParseCache, normalize
+from prop_logic.interned import Interner, intern
+from prop_logic.parser import Parser
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("A&B", "A ∧ B"),
+        ("  A  /\\ B ", "A ∧ B"),
+        ("~(p \\/ q) > r", "¬ ( p ∨ q ) → r"),
+        ("¬(p∨q)⇒r", "¬ ( p ∨ q ) → r"),
+    ],
+)
+def test_normalize(formula, expected):
+    assert normalize(formula) == expected
+
+
+def test_returns_parsed_tree():
+    cache = ParseCache()
+    assert cache.parse("A & ~B > C") is intern(Parser(lexer.lex("A & ~B > C")).parse())
+
+
+def test_hits_and_misses():
+    cache = ParseCache()
+    first = cache.parse("A & B")
+    assert cache.parse("A & B") is first
+    cache.parse("A  &  B")
+
+    assert cache.info() == CacheInfo(hits=1, misses=2, evictions=0, maxsize=1024, currsize=2)
+
+
+def test_normalized_spellings_share_entry():
+    cache = ParseCache(normalize=True)
+    first = cache.parse("A & B")
+
+    assert cache.parse("A/\\B") is first
+    assert cache.parse(" A ∧ B ") is first
+    assert cache.info() == CacheInfo(hits=2, misses=1, evictions=0, maxsize=1024, currsize=1)
+
+
+def test_lru_eviction():
+    cache = ParseCache(maxsize=2)
+    cache.parse("A")
+    cache.parse("B")
+    cache.parse("A")  # B is now the least recently used.
+    cache.parse("C")
+
+    assert cache.info() == CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+    cache.parse("A")
+    assert cache.info().hits == 2
+    cache.parse("B")
+    assert cache.info().misses == 4
+
+
+def test_zero_maxsize_disables_caching():
+    cache = ParseCache(maxsize=0)
+    cache.parse("A")
+    cache.parse("A")
+    assert cache.info() == CacheInfo(hits=0, misses=2, evictions=0, maxsize=0, currsize=0)
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=-1)
+
+
+def test_errors_are_not_cached():
+    cache = ParseCache()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.parse("A &")
+    assert len(cache) == 0
+
+
+def test_custom_interner_and_clear():
+    local = Interner()
+    cache = ParseCache(interner=local)
+    node = cache.parse("A | B")
+    assert node in local
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=1024, currsize=0)
@@ -0,0 +1,110 @@
+import io
+import itertools
+import random
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.cnf import TseitinEncoder, write_dimacs
+from prop_logic.compiler import compile_formula
+from prop_logic.parser import IterativeParser
+from prop_logic.truth_table import truth_table
+
+from .helpers import get_ast, random_formula
+
+
+def models(clauses, num_vars):
+    for values in itertools.product([False, True], repeat=num_vars):
+        if all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses):
+            yield values
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_tseitin_preserves_models(seed):
+    formula = get_ast(random_formula(random.Random(seed), 7))
+    encoder = TseitinEncoder(plaisted_greenbaum=False)
+    clauses = list(encoder.encode(formula))
+
+    assert sum(1 for _ in models(clauses, encoder.num_vars)) == truth_table(formula).count
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_plaisted_greenbaum_is_equisatisfiable(seed):
+    formula = get_ast(random_formula(random.Random(seed), 7))
+    encoder = TseitinEncoder()
+    clauses = list(encoder.encode(formula))
+    evaluator = compile_formula(formula)
+
+    found = False
+    for values in models(clauses, encoder.num_vars):
+        found = True
+        assert evaluator({name: values[var - 1] for name, var in encoder.variables.items()})
+    assert found is truth_table(formula).is_satisfiable
+
+
+def test_cnf_formula_needs_no_gates():
+    encoder = TseitinEncoder()
+    clauses = list(encoder.encode(get_ast("(A | ~B | C) & (~A | B) & ~C & (B > (C | D))")))
+
+    assert clauses == [(1, -2, 3), (-1, 2), (-3,), (-2, 3, 4)]
+    assert encoder.num_vars == 4
+    assert encoder.variables == {"A": 1, "B": 2, "C": 3, "D": 4}
+
+
+def test_chains_become_one_gate():
+    encoder = TseitinEncoder(plaisted_greenbaum=False)
+    clauses = list(encoder.encode(get_ast("~(A & B & C & D) | E")))
+    assert clauses == [(-1, -2, -3, -4, 5)]
+
+    clauses = list(encoder.encode(get_ast("(A & B & C & D) > E | ~(A & B & C & D)")))
+    assert encoder.num_vars == 6
+    assert clauses == [(-6, 5), (-6, 1), (-6, 2), (-6, 3), (-6, 4), (6, -1, -2, -3, -4)]
+
+
+def test_shared_subformulas_share_gates():
+    formula = get_ast("((A | B) & C | D) & ((A | B) & C | ~E) & ~((A | B) & C)")
+    encoder = TseitinEncoder()
+    clauses = list(encoder.encode(formula))
+
+    # Gate 6 is the shared conjunction and gate 7 is the disjunction within it.
+    assert encoder.num_vars == 7
+    assert clauses == [(6, 4), (6, -5), (-7, -3), (7, -1), (7, -2), (-6, 7), (-6, 3), (-7, 1, 2)]
+
+    # Gates are already encoded, so only the asserted clauses are repeated.
+    assert list(encoder.encode(formula)) == clauses[:3]
+
+
+def test_encode_is_lazy():
+    encoder = TseitinEncoder()
+    clauses = encoder.encode(get_ast("A & (B | C & D)"))
+    assert next(clauses) == (1,)
+
+
+def test_deep_formula():
+    n = 10_000
+    formula = IterativeParser(lexer.lex("(A > " * n + "B" + ")" * n)).parse()
+    assert list(TseitinEncoder().encode(formula)) == [(-1, 2)]
+
+    formula = IterativeParser(lexer.lex("(A & " * n + "(B | A)" + ")" * n)).parse()
+    assert list(TseitinEncoder().encode(formula)) == [(1,), (2, 1)]
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_write_dimacs(seekable, tmp_path):
+    formula = get_ast("(A | B) & ~(A & ~C)")
+
+    class Stream(io.StringIO):
+        def seekable(self):
+            return seekable
+
+    stream = Stream()
+    encoder = write_dimacs(formula, stream)
+    lines = stream.getvalue().splitlines()
+
+    assert lines[0].split() == ["p", "cnf", "3", "2"]
+    assert lines[1:] == ["c 1 A", "c 2 B", "c 3 C", "1 2 0", "-1 3 0"]
+    assert encoder.variables == {"A": 1, "B": 2, "C": 3}
+
+    path = tmp_path / "formula.cnf"
+    write_dimacs(formula, path)
+    assert path.read_text().split() == stream.getvalue().split()
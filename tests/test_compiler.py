@@ -0,0 +1,130 @@
+import itertools
+import random
+
+import pytest
+
+from prop_logic import interned, lexer
+from prop_logic.compiler import compile_formula, generate_source
+from prop_logic.nodes import BinaryFormula, UnaryFormula, variable_names
+from prop_logic.parser import IterativeParser
+
+from .helpers import get_ast, random_formula
+
+
+def evaluate(node, assignment):
+    if isinstance(node, BinaryFormula):
+        left = evaluate(node.left, assignment)
+        right = evaluate(node.right, assignment)
+        return {"∧": left and right, "∨": left or right, "→": not left or right}[
+            node.connective.lexeme
+        ]
+    elif isinstance(node, UnaryFormula):
+        return not evaluate(node.operand, assignment)
+    else:
+        return assignment[node.name]
+
+
+@pytest.mark.parametrize(
+    ["formula", "assignment", "expected"],
+    [
+        ("A", {"A": True}, True),
+        ("~A", {"A": True}, False),
+        ("A & B", {"A": True, "B": False}, False),
+        ("A | B", {"A": False, "B": True}, True),
+        ("A > B", {"A": True, "B": False}, False),
+        ("A > B", {"A": False, "B": False}, True),
+        ("~(A & B) > C", {"A": True, "B": True, "C": False}, True),
+    ],
+)
+def test_evaluate_mapping(formula, assignment, expected):
+    assert compile_formula(get_ast(formula))(assignment) is expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_tree_walk(seed):
+    formula = get_ast(random_formula(random.Random(seed), 12))
+    names = variable_names(formula)
+    by_name = compile_formula(formula)
+    by_index = compile_formula(formula, names)
+
+    for values in itertools.product([False, True], repeat=len(names)):
+        expected = evaluate(formula, dict(zip(names, values)))
+        assert by_name(dict(zip(names, values))) is expected
+        assert by_index(values) is expected
+
+
+def test_short_circuit():
+    evaluator = compile_formula(get_ast("A & B | C > D"))
+    # Missing variables aren't looked up if they don't affect the result.
+    assert evaluator({"A": False, "C": False}) is True
+
+
+def test_variable_order():
+    evaluator = compile_formula(get_ast("A & ~B"), ["B", "Unused", "A"])
+    assert evaluator((False, None, True)) is True
+    assert evaluator((True, None, True)) is False
+
+
+def test_missing_variable_in_order():
+    with pytest.raises(ValueError, match="'B'"):
+        compile_formula(get_ast("A & B"), ["A"])
+
+
+def test_cached_per_formula():
+    first = compile_formula(get_ast("A | ~B"))
+    assert compile_formula(get_ast("A | ~B")) is first
+    assert compile_formula(get_ast("A | ~B"), ["A", "B"]) is not first
+
+
+def test_interned_once_per_formula(monkeypatch):
+    formula = get_ast("A & (B | ~C)")
+    first = compile_formula(formula)
+    calls = []
+    monkeypatch.setattr(interned, "intern", lambda formula: calls.append(formula))
+    assert compile_formula(formula) is first
+    assert calls == []
+
+
+def test_shared_subformulas_emitted_once():
+    formula = interned.intern(get_ast("(A & B) | ~(A & B) > (A & B)"))
+    source = generate_source(formula)
+    assert source.count("a['A']") == 1
+    assert compile_formula(formula)({"A": True, "B": True}) is True
+    assert compile_formula(formula)({"A": True, "B": False}) is False
+
+
+def test_shared_subformula_short_circuits():
+    formula = get_ast("(A & (C | D)) | (B & (C | D))")
+    evaluator = compile_formula(formula)
+    # C and D aren't looked up since neither conjunction reaches them.
+    assert evaluator({"A": False, "B": False}) is False
+    assert evaluator({"A": False, "B": True, "C": False, "D": True}) is True
+    assert generate_source(interned.intern(formula)).count("a['C']") == 1
+
+
+def test_deep_right_operand_short_circuits():
+    n = 3000
+    formula = IterativeParser(lexer.lex("A | ~(" * n + "B" + ")" * n)).parse()
+    evaluator = compile_formula(formula)
+    assert evaluator({"A": True}) is True
+    assert evaluator({"A": False, "B": True}) is True
+    assert evaluator({"A": False, "B": False}) is False
+
+
+def test_generate_source():
+    assert generate_source(get_ast("A > ~B"), ["A", "B"]) == (
+        "def evaluate(a):\n    return True if (not a[0] or (not a[1])) else False\n"
+    )
+
+
+def test_deep_formula():
+    n = 5000
+    conjunction = " & ".join(f"~~~X{chr(65 + i % 26)}" for i in range(n))
+    evaluator = compile_formula(IterativeParser(lexer.lex(conjunction)).parse())
+    assignment = {f"X{chr(65 + i)}": False for i in range(26)}
+    assert evaluator(assignment) is True
+    assignment["XZ"] = True
+    assert evaluator(assignment) is False
+
+    negation = IterativeParser(lexer.lex("~" * n + "A")).parse()
+    assert compile_formula(negation)({"A": True}) is True
@@ -0,0 +1,120 @@
+import itertools
+import random
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.bdd import BDD
+from prop_logic.counting import ModelCounter, count_models
+from prop_logic.parser import IterativeParser
+from prop_logic.truth_table import truth_table
+
+from .helpers import get_ast, random_formula
+
+
+def names(n):
+    return ["".join(letters) for letters in itertools.product("ABCDEFGHIJ", "abcdefghij", "xyz")][
+        :n
+    ]
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_count_models(seed):
+    formula = get_ast(random_formula(random.Random(seed), 10))
+    assert count_models(formula) == truth_table(formula).count
+
+
+@pytest.mark.parametrize("cache_size", [0, 10, 100])
+def test_small_cache(cache_size):
+    counter = ModelCounter(cache_size)
+    for seed in range(20):
+        formula = get_ast(random_formula(random.Random(seed), 12))
+        assert counter.count(formula) == truth_table(formula).count
+
+    stats = counter.stats
+    assert stats.cache_entries == len(counter._cache)
+    assert counter._cached_literals <= cache_size
+    if cache_size == 0:
+        assert stats.cache_hits == 0 and stats.cache_entries == 0
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("A & ~A", 0),
+        ("A | ~A", 2),
+        ("A", 1),
+        ("A > B", 3),
+        ("(A | B) & (C | D)", 9),
+        ("((A | ~A) & B) | C", 6),
+    ],
+)
+def test_count_models_exact(formula, expected):
+    assert count_models(get_ast(formula)) == expected
+
+
+def test_many_variables():
+    # Independent clauses are separate components: 3^60 models.
+    variables = names(120)
+    formula = get_ast(" & ".join(f"({a} | {b})" for a, b in zip(variables[::2], variables[1::2])))
+    counter = ModelCounter()
+    assert counter.count(formula) == 3**60
+    assert counter.stats.decisions <= 120
+
+    # A chain of overlapping clauses, checked against a BDD.
+    text = " & ".join(
+        f"({a} | ~{b} | {c})" for a, b, c in zip(variables, variables[1:], variables[2:])
+    )
+    formula = get_ast(text)
+    bdd = BDD()
+    assert count_models(formula) == bdd.count(bdd.from_formula(formula))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_3cnf(seed):
+    rng = random.Random(seed)
+    num_vars = rng.randint(3, 12)
+    clauses = [
+        [v if rng.random() < 0.5 else -v for v in rng.sample(range(1, num_vars + 1), 3)]
+        for _ in range(rng.randint(0, 5 * num_vars))
+    ]
+    expected = sum(
+        all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses)
+        for values in itertools.product([False, True], repeat=num_vars)
+    )
+    assert ModelCounter(rng.choice([0, 100])).count_clauses(clauses, num_vars) == expected
+
+
+def test_stats():
+    counter = ModelCounter()
+    formula = get_ast("(A | B) & (B | C) & (C | D) & (D | E)")
+    assert counter.count(formula) == truth_table(formula).count
+    first = counter.stats
+    assert first.decisions > 0 and first.cache_misses == first.decisions
+    assert 0.0 <= first.hit_rate <= 1.0
+
+    assert counter.count(formula) == truth_table(formula).count
+    second = counter.stats
+    assert second.decisions == first.decisions
+    assert second.cache_hits > first.cache_hits
+
+    counter.clear()
+    assert counter.stats.cache_entries == 0
+
+
+def test_count_clauses():
+    counter = ModelCounter()
+    assert counter.count_clauses([], 3) == 8
+    assert counter.count_clauses([[1, -1]], 1) == 2
+    assert counter.count_clauses([[1, 2], [-1, -2]], 3) == 4
+    assert counter.count_clauses([[1], [-1]], 1) == 0
+    with pytest.raises(ValueError, match="Literal 4 is out of range."):
+        counter.count_clauses([[1, 4]], 3)
+    with pytest.raises(ValueError):
+        ModelCounter(-1)
+
+
+def test_deep_formula():
+    n = 5000
+    formula = IterativeParser(lexer.lex("(" * n + "A | B" + ")" * n)).parse()
+    assert count_models(formula) == 3
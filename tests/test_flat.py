@@ -0,0 +1,90 @@
+import io
+import itertools
+import pickle
+import random
+from array import array
+
+import pytest
+
+from prop_logic import interned
+from prop_logic.compiler import compile_formula
+from prop_logic.flat import FlatFormula, Opcode
+from prop_logic.parser import IterativeParser
+
+from .helpers import get_ast, parse, random_formula
+
+
+def test_from_formula():
+    flat = FlatFormula.from_formula(get_ast("~A & (B | A)"))
+    assert list(flat.ops) == [
+        Opcode.VARIABLE,
+        Opcode.NOT,
+        Opcode.VARIABLE,
+        Opcode.VARIABLE,
+        Opcode.OR,
+        Opcode.AND,
+    ]
+    assert list(flat.args) == [0, 0, 1, 0, 2, 1]
+    assert flat.names == ["A", "B"]
+    assert flat.size == 6
+    assert flat.root == 5
+    assert flat.children(5) == (1, 4)
+    assert flat.children(4) == (2, 3)
+    assert flat.children(1) == (0,)
+    assert flat.children(0) == ()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_round_trip(seed):
+    formula = get_ast(random_formula(random.Random(seed), 50))
+    flat = FlatFormula.from_formula(formula)
+    assert str(flat) == str(formula)
+    assert str(flat.to_formula()) == str(formula)
+    assert FlatFormula.from_formula(flat.to_formula()) == flat
+
+
+def test_interned():
+    formula = get_ast("(A & B) | (A & B)")
+    flat = FlatFormula.from_formula(interned.intern(formula))
+    assert flat.size == 7
+    assert str(flat) == str(formula)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_evaluate(seed):
+    formula = get_ast(random_formula(random.Random(seed), 30))
+    flat = FlatFormula.from_formula(formula)
+    evaluate = compile_formula(formula)
+    for values in itertools.product([False, True], repeat=len(flat.names)):
+        assignment = dict(zip(flat.names, values))
+        assert flat.evaluate(assignment) is evaluate(assignment)
+        assert flat.evaluate(values) is evaluate(assignment)
+
+
+def test_evaluate_errors():
+    flat = FlatFormula.from_formula(get_ast("A & B"))
+    with pytest.raises(ValueError, match="Variable 'B' is missing from the assignment."):
+        flat.evaluate({"A": True})
+    with pytest.raises(ValueError, match="Expected 2 truth values but got 1."):
+        flat.evaluate([True])
+
+
+def test_deep():
+    n = 100_000
+    formula = parse(IterativeParser, "~" * n + "(" * n + "A" + " & B)" * n)
+    flat = FlatFormula.from_formula(formula)
+    assert flat.size == 2 * n + 1 + n
+    assert flat.evaluate({"A": True, "B": True}) is (n % 2 == 0)
+    assert str(flat) == "¬" * n + "(" * n + "A" + " ∧ B)" * n
+    file = io.StringIO()
+    flat.write(file)
+    assert file.getvalue() == str(flat)
+
+
+def test_pickle():
+    formula = get_ast(random_formula(random.Random(0), 50))
+    flat = FlatFormula.from_formula(formula)
+    data = pickle.dumps(flat)
+    assert pickle.loads(data) == flat
+    assert len(data) < len(pickle.dumps(formula)) / 2
+    assert isinstance(pickle.loads(data).ops, array)
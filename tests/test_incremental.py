@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.incremental import EditableFormula, IncrementalParser
+
+from .helpers import get_ast, random_formula
+
+
+def check(formula):
+    assert formula.tokens == list(lexer.lex(formula.text))
+    assert str(formula.formula) == str(get_ast(formula.text))
+
+
+@pytest.mark.parametrize(
+    ["text", "offset", "deleted", "inserted", "expected"],
+    [
+        ("A & B", 4, 1, "C", "A & C"),
+        ("A & B", 1, 0, "B", "AB & B"),
+        ("A & B", 1, 1, "", "A& B"),
+        ("A & B", 1, 3, "", "AB"),
+        ("A & B", 0, 0, "(", "(A & B"),
+        ("(A & B) | C", 7, 0, ")", "(A & B)) | C"),
+        ("(A & B) | (C > D)", 6, 0, " | E", "(A & B | E) | (C > D)"),
+        ("(A & B) | (C > D)", 8, 1, "&", "(A & B) & (C > D)"),
+        ("(A & B) | (C > D)", 0, 17, "~X", "~X"),
+        ("AB", 1, 0, " | ", "A | B"),
+        ("A & B", 5, 0, " & ~C", "A & B & ~C"),
+    ],
+)
+def test_edit(text, offset, deleted, inserted, expected):
+    formula = EditableFormula(text)
+    try:
+        formula.edit(offset, deleted, inserted)
+    except ValueError as e:
+        with pytest.raises(ValueError, match=str(e).replace("(", r"\(").replace(")", r"\)")):
+            get_ast(expected)
+        assert formula.formula is None
+    else:
+        check(formula)
+    assert formula.text == expected
+
+
+def test_reuse():
+    formula = EditableFormula("(A & (B | C)) > (D & E)")
+    left = formula.formula.left
+    right = formula.formula.right
+
+    formula.edit(len(formula.text) - 2, 1, "F")
+    assert formula.formula.left is left
+    assert formula.formula.right is not right
+    check(formula)
+
+    formula.edit(0, 0, "X | ")
+    assert formula.formula.left.right is left
+    check(formula)
+
+
+def test_errors():
+    formula = EditableFormula("(A & B) | C")
+    with pytest.raises(ValueError, match="Unknown character '\\$' at position 10."):
+        formula.edit(10, 0, "$")
+    assert formula.formula is None and formula.tokens is None
+
+    formula.edit(10, 1, "")
+    check(formula)
+
+    with pytest.raises(ValueError, match="Unexpected token None"):
+        formula.edit(len(formula.text), 0, " &")
+    formula.edit(len(formula.text), 0, " D")
+    check(formula)
+
+    # As for a full parse, a syntax error before an unknown character is raised instead.
+    with pytest.raises(ValueError, match="Syntax error: unexpected token 'C'"):
+        formula.edit(8, 1, "C $")
+    assert formula.formula is None and formula.tokens is None
+    with pytest.raises(ValueError, match="Syntax error: unexpected token 'B'"):
+        EditableFormula("A B $")
+
+    with pytest.raises(ValueError, match="out of range"):
+        formula.edit(len(formula.text) + 1, 0, "")
+    with pytest.raises(ValueError, match="out of range"):
+        formula.edit(0, len(formula.text) + 1, "")
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_edits(seed):
+    rng = random.Random(seed)
+    formula = EditableFormula(random_formula(rng, 20))
+    for _ in range(30):
+        text = formula.text
+        offset = rng.randint(0, len(text))
+        deleted = rng.randint(0, min(3, len(text) - offset))
+        inserted = "".join(rng.choice("AB ~&|>()") for _ in range(rng.randint(0, 3)))
+        try:
+            formula.edit(offset, deleted, inserted)
+        except ValueError as e:
+            with pytest.raises(ValueError) as info:
+                get_ast(formula.text)
+            assert str(info.value) == str(e)
+        else:
+            check(formula)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_edits_without_reading_tokens(seed):
+    # The positions of tokens are shifted lazily, until `tokens` is read.
+    rng = random.Random(seed)
+    formula = EditableFormula(random_formula(rng, 50))
+    for i in range(100):
+        text = formula.text
+        offset = rng.randint(0, len(text))
+        deleted = rng.randint(0, min(3, len(text) - offset))
+        inserted = "".join(rng.choice("AB ~&|>()$") for _ in range(rng.randint(0, 3)))
+        try:
+            formula.edit(offset, deleted, inserted)
+        except ValueError as e:
+            with pytest.raises(ValueError) as info:
+                get_ast(formula.text)
+            assert str(info.value) == str(e)
+        else:
+            assert str(formula.formula) == str(get_ast(formula.text))
+        if i % 10 == 9 and formula.tokens is not None:
+            assert formula.tokens == list(lexer.lex(formula.text))
+
+
+def test_parser_records_groups():
+    tokens = list(lexer.lex("((A) & B) | (C)"))
+    parser = IncrementalParser(tokens)
+    formula = parser.parse()
+    assert sorted((start, end) for start, (end, _) in parser.groups.items()) == [
+        (0, 6),
+        (1, 3),
+        (8, 10),
+    ]
+    assert parser.groups[8][1] is formula.right
@@ -0,0 +1,118 @@
+import copy
+import dataclasses
+import gc
+import pickle
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.connectives import Conjunction, Disjunction, Negation
+from prop_logic.interned import (
+    InternedBinaryFormula,
+    InternedUnaryFormula,
+    InternedVariable,
+    Interner,
+    intern,
+    interner,
+)
+from prop_logic.nodes import BinaryFormula, UnaryFormula, Variable, iter_postorder
+from prop_logic.parser import IterativeParser
+
+from .helpers import get_ast
+
+
+def test_structurally_equal_nodes_are_identical():
+    first = intern(get_ast("(A & ~B) | (A & ~B)"))
+    second = intern(get_ast("(A & ~B) | (A & ~B)"))
+
+    assert first is second
+    assert first.left is first.right
+    assert first.left.left is first.left.left is interner.variable("A")
+
+
+def test_different_formulas_are_not_equal():
+    assert intern(get_ast("A & B")) != intern(get_ast("A | B"))
+    assert intern(get_ast("A & B")) != intern(get_ast("B & A"))
+    assert intern(get_ast("~A")) != intern(get_ast("A"))
+
+
+def test_types_and_fields():
+    node = intern(get_ast("~A & B"))
+
+    assert isinstance(node, InternedBinaryFormula)
+    assert isinstance(node, BinaryFormula)
+    assert isinstance(node.left, InternedUnaryFormula)
+    assert isinstance(node.left, UnaryFormula)
+    assert isinstance(node.right, InternedVariable)
+    assert isinstance(node.right, Variable)
+    assert node.connective is Conjunction
+    assert node.left.connective is Negation
+    assert node.right.name == "B"
+    assert str(node) == str(get_ast("~A & B"))
+
+
+def test_usable_as_keys():
+    node = intern(get_ast("A & B | C"))
+    table = {node: 1}
+
+    assert table[intern(get_ast("(A & B) | C"))] == 1
+    assert hash(node) == hash(intern(get_ast("(A & B) | C")))
+
+
+def test_nodes_are_immutable():
+    node = intern(get_ast("A & B"))
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.connective = Disjunction
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del node.left
+    for child in iter_postorder(node):
+        assert not hasattr(child, "__dict__")
+
+
+def test_not_equal_to_plain_nodes():
+    plain = get_ast("A & ~B")
+    node = intern(plain)
+
+    assert node != plain
+    assert plain != node
+    assert node.right.operand != Variable("B")
+    assert intern(plain) is node
+
+
+def test_copy_and_pickle_preserve_identity():
+    node = intern(get_ast("A & (B | ~C)"))
+
+    assert copy.copy(node) is node
+    assert copy.deepcopy(node) is node
+    assert pickle.loads(pickle.dumps(node)) is node
+
+
+def test_factory_interns_children():
+    local = Interner()
+    node = local.binary(Variable("A"), Conjunction, UnaryFormula(Negation, Variable("A")))
+
+    assert node.left is local.variable("A")
+    assert node.right.operand is node.left
+    assert node in local
+    assert node not in interner
+
+
+def test_intern_already_interned_is_noop():
+    node = intern(get_ast("A > B"))
+    assert intern(node) is node
+
+
+def test_table_is_weak():
+    local = Interner()
+    local.intern(get_ast("Unused & Formula"))
+    gc.collect()
+    assert len(local) == 0
+
+
+def test_deep_formula():
+    n = 10_000
+    node = intern(IterativeParser(lexer.lex("~" * n + "A")).parse())
+
+    assert len(list(iter_postorder(node))) == n + 1
+    assert intern(IterativeParser(lexer.lex("~" * n + "A")).parse()) is node
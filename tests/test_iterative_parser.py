@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from prop_logic.connectives import Conjunction, Implication, Negation
+from prop_logic.nodes import BinaryFormula, Variable
+from prop_logic.parser import IterativeParser, Parser
+
+from .helpers import PARAMS_ERRORS, depth, parse, random_formula
+from .test_parser import PARAMS_GROUPED, PARAMS_GROUPED_NOT, PARAMS_UNGROUPED_NOT
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [params[0] for params in PARAMS_GROUPED + PARAMS_UNGROUPED_NOT + PARAMS_GROUPED_NOT],
+)
+def test_same_tree_as_parser(formula):
+    assert parse(IterativeParser, formula) == parse(Parser, formula)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_same_tree_as_parser_random(seed):
+    formula = random_formula(random.Random(seed), 20)
+    assert parse(IterativeParser, formula) == parse(Parser, formula)
+
+
+@pytest.mark.parametrize("formula", PARAMS_ERRORS)
+def test_same_errors_as_parser(formula):
+    with pytest.raises(ValueError) as expected:
+        parse(Parser, formula)
+    with pytest.raises(ValueError) as actual:
+        parse(IterativeParser, formula)
+    assert str(actual.value) == str(expected.value)
+
+
+def test_deep_nesting():
+    n = 10_000
+    result = parse(IterativeParser, "(" * n + "A" + ")" * n)
+    assert result == Variable("A")
+
+
+def test_long_negation_chain():
+    n = 10_000
+    result = parse(IterativeParser, "~" * n + "A")
+    for _ in range(n):
+        assert result.connective is Negation
+        result = result.operand
+    assert result == Variable("A")
+
+
+def test_long_binary_chain():
+    n = 10_000
+    result = parse(IterativeParser, " & ".join(["A"] * n + ["B > C"]))
+    assert result.connective is Implication
+    assert result.right == Variable("C")
+    assert depth(result) == n + 2
+
+    node = result.left
+    assert node.right == Variable("B")
+    while isinstance(node, BinaryFormula):
+        assert node.connective is Conjunction
+        node = node.left
+    assert node == Variable("A")
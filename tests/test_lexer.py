@@ -0,0 +1,175 @@
+import io
+import re
+
+import pytest
+
+from prop_logic.lexer import (
+    TOKEN_CODES,
+    TOKEN_TYPES,
+    Token,
+    TokenType,
+    lex,
+    lex_array,
+    lex_stream,
+    scan,
+)
+
+PARAMS_TOKENS = [
+    ("A", [Token(TokenType.VARIABLE, "A", 0)]),
+    ("  foo ", [Token(TokenType.VARIABLE, "foo", 2)]),
+    (
+        "~A&B",
+        [
+            Token(TokenType.NOT, "~", 0),
+            Token(TokenType.VARIABLE, "A", 1),
+            Token(TokenType.AND, "&", 2),
+            Token(TokenType.VARIABLE, "B", 3),
+        ],
+    ),
+    (
+        "(A /\\ B) \\/ C",
+        [
+            Token(TokenType.PARENTHESIS_LEFT, "(", 0),
+            Token(TokenType.VARIABLE, "A", 1),
+            Token(TokenType.AND, "/\\", 3),
+            Token(TokenType.VARIABLE, "B", 6),
+            Token(TokenType.PARENTHESIS_RIGHT, ")", 7),
+            Token(TokenType.OR, "\\/", 9),
+            Token(TokenType.VARIABLE, "C", 12),
+        ],
+    ),
+    (
+        "¬p ∧ q ∨ r → s ⇒ t",
+        [
+            Token(TokenType.NOT, "¬", 0),
+            Token(TokenType.VARIABLE, "p", 1),
+            Token(TokenType.AND, "∧", 3),
+            Token(TokenType.VARIABLE, "q", 5),
+            Token(TokenType.OR, "∨", 7),
+            Token(TokenType.VARIABLE, "r", 9),
+            Token(TokenType.IMPLIES, "→", 11),
+            Token(TokenType.VARIABLE, "s", 13),
+            Token(TokenType.IMPLIES, "⇒", 15),
+            Token(TokenType.VARIABLE, "t", 17),
+        ],
+    ),
+]
+
+PARAMS_UNKNOWN = [
+    ("A # B", "Unknown character '#' at position 2."),
+    ("A /", "Unknown character '/' at position 2."),
+    ("\\", "Unknown character '\\\\' at position 0."),
+    ("A\nB1", "Unknown character '1' at position 3."),
+]
+
+
+@pytest.mark.parametrize(["formula", "expected"], PARAMS_TOKENS)
+def test_lex_tokens(formula, expected):
+    assert list(lex(formula)) == expected
+
+
+@pytest.mark.parametrize(["formula", "message"], PARAMS_UNKNOWN)
+def test_lex_unknown_character(formula, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        list(lex(formula))
+
+
+def test_lex_is_lazy():
+    tokens = lex("A # B")
+    assert next(tokens) == Token(TokenType.VARIABLE, "A", 0)
+    with pytest.raises(ValueError):
+        next(tokens)
+
+
+@pytest.mark.parametrize(["formula", "expected"], PARAMS_TOKENS)
+def test_lex_array_tokens(formula, expected):
+    tokens = lex_array(formula)
+    assert len(tokens) == len(expected)
+    assert list(tokens) == expected
+    for i, token in enumerate(expected):
+        assert tokens.type(i) is token.type
+        assert tokens.value(i) == token.value
+        assert tokens[i] == token
+
+
+@pytest.mark.parametrize(["formula", "message"], PARAMS_UNKNOWN)
+def test_lex_array_unknown_character(formula, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        lex_array(formula)
+
+
+def test_lex_array_is_compact():
+    tokens = lex_array("(A & Bc) | ~D " * 1000)
+    assert len(tokens) == 8000
+    assert tokens.types.itemsize == 1
+    assert tokens.starts.typecode == tokens.ends.typecode == "I"
+    assert tokens.types[0] == TOKEN_CODES[TokenType.PARENTHESIS_LEFT]
+    assert [TOKEN_TYPES[code] for code in tokens.types[:8]] == [token.type for token in tokens][:8]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+@pytest.mark.parametrize(["formula", "expected"], PARAMS_TOKENS)
+def test_lex_stream_tokens(formula, expected, chunk_size):
+    assert list(lex_stream(io.StringIO(formula), chunk_size)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+@pytest.mark.parametrize(["formula", "message"], PARAMS_UNKNOWN)
+def test_lex_stream_unknown_character(formula, message, chunk_size):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        list(lex_stream(io.StringIO(formula), chunk_size))
+
+
+def test_lex_stream_long_token():
+    formula = "A" * 1000 + " /\\ " + "b" * 999
+    tokens = list(lex_stream(io.StringIO(formula), 7))
+    assert tokens == list(lex(formula))
+    assert [token.pos for token in tokens] == [0, 1001, 1004]
+
+
+class CountingStream(io.StringIO):
+    def __init__(self, text):
+        super().__init__(text)
+        self.sizes = []
+
+    def read(self, size=-1):
+        self.sizes.append(size)
+        return super().read(size)
+
+
+@pytest.mark.parametrize("formula", [" " * 800_000 + "A", "A & " + "b" * 800_000 + " | C"])
+def test_lex_stream_tokens_across_many_chunks(formula):
+    # Each chunk is read and lexed once, even when a token spans many chunks.
+    stream = CountingStream(formula)
+    tokens = list(lex_stream(stream, 64))
+    assert tokens == list(lex(formula))
+    assert stream.sizes == [64] * (-(-len(formula) // 64) + 1)
+
+
+def test_lex_stream_is_lazy():
+    stream = io.StringIO("A & B # C")
+    tokens = lex_stream(stream, 2)
+    assert next(tokens) == Token(TokenType.VARIABLE, "A", 0)
+    assert stream.tell() < len("A & B # C")
+
+
+def test_lex_stream_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size must be at least 1, not 0."):
+        next(lex_stream(io.StringIO("A"), 0))
+
+
+def test_scan():
+    assert [(type_, match.group()) for type_, match in scan("~A  # B", 1)] == [
+        (TokenType.VARIABLE, "A"),
+        (TokenType.WHITESPACE, "  "),
+        (None, "#"),
+        (TokenType.WHITESPACE, " "),
+        (TokenType.VARIABLE, "B"),
+    ]
+    assert [(type_, match.group()) for type_, match in scan("A /\\ ¬B".encode(), 0, 6)] == [
+        (TokenType.VARIABLE, b"A"),
+        (TokenType.WHITESPACE, b" "),
+        (TokenType.AND, b"/\\"),
+        (TokenType.WHITESPACE, b" "),
+        (None, b"\xc2"),
+    ]
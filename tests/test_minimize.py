@@ -0,0 +1,133 @@
+import itertools
+import random
+import re
+
+import pytest
+
+from prop_logic import nodes
+from prop_logic.compiler import compile_formula
+from prop_logic.connectives import Conjunction, Disjunction, Negation
+from prop_logic.minimize import minimize, minimize_cubes
+from prop_logic.sat import is_satisfiable
+
+from .helpers import get_ast, random_formula
+
+
+def models(formula, names):
+    evaluate = compile_formula(formula)
+    return {
+        values
+        for values in itertools.product([False, True], repeat=len(names))
+        if evaluate(dict(zip(names, values)))
+    }
+
+
+def cube_models(cube, names):
+    care, value = cube
+    return {
+        values
+        for values in itertools.product([False, True], repeat=len(names))
+        if all(values[i] == bool(value >> i & 1) for i in range(len(names)) if care >> i & 1)
+    }
+
+
+def check_cover(formula, names, cover):
+    """Assert that `cover` is an irredundant cover of prime implicants of `formula`."""
+    expected = models(formula, names)
+    cubes = [cube_models(cube, names) for cube in cover]
+    assert set().union(*cubes) == expected
+    for i, (cube, cube_set) in enumerate(zip(cover, cubes)):
+        others = set().union(*cubes[:i], *cubes[i + 1 :])
+        assert not cube_set <= others
+        care, value = cube
+        for j in range(len(names)):
+            if care >> j & 1:
+                assert not cube_models((care & ~(1 << j), value & ~(1 << j)), names) <= expected
+
+
+def minimum_cover_size(formula, names):
+    expected = models(formula, names)
+    implicants = []
+    for literals in itertools.product([None, False, True], repeat=len(names)):
+        care = sum(1 << i for i, lit in enumerate(literals) if lit is not None)
+        value = sum(1 << i for i, lit in enumerate(literals) if lit)
+        if cube_models((care, value), names) <= expected:
+            implicants.append(frozenset(cube_models((care, value), names)))
+    primes = [cube for cube in implicants if not any(cube < other for other in implicants)]
+    for size in range(len(expected) + 1):
+        for cover in itertools.combinations(primes, size):
+            if set().union(*cover) == expected:
+                return size
+
+
+def random_wide_formula(rng, size, num_vars):
+    names = ["".join(letters) for letters in itertools.product("ABCDEF", "abcdef")][:num_vars]
+    return re.sub("[A-D]", lambda _: rng.choice(names), random_formula(rng, size))
+
+
+def xor(left, right):
+    return nodes.BinaryFormula(
+        nodes.BinaryFormula(left, Conjunction, nodes.UnaryFormula(Negation, right)),
+        Disjunction,
+        nodes.BinaryFormula(nodes.UnaryFormula(Negation, left), Conjunction, right),
+    )
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("(A & B) | (A & ~B)", "A"),
+        ("A & ~A", False),
+        ("A | ~A", True),
+        ("~(A > (B > C)) | (A & B & C)", "(A ∧ B)"),
+        ("(A & B) | (B & C) | (A & C)", "(((A ∧ B) ∨ (A ∧ C)) ∨ (B ∧ C))"),
+        ("(A > B) & (B > C) & (C > A)", "(((¬A ∧ ¬B) ∧ ¬C) ∨ ((A ∧ B) ∧ C))"),
+    ],
+)
+@pytest.mark.parametrize("exact_variables", [10, 0])
+def test_minimize(formula, expected, exact_variables):
+    result = minimize(get_ast(formula), exact_variables)
+    assert (result if isinstance(result, bool) else str(result)) == expected
+
+
+@pytest.mark.parametrize("seed", range(40))
+@pytest.mark.parametrize("exact_variables", [10, 0])
+def test_minimize_cubes_random(seed, exact_variables):
+    formula = get_ast(random_formula(random.Random(seed), 12))
+    names = nodes.variable_names(formula)
+    cover = minimize_cubes(formula, names, exact_variables)
+    check_cover(formula, names, cover)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_exact_is_minimum(seed):
+    formula = get_ast(random_formula(random.Random(seed), 10))
+    names = nodes.variable_names(formula)
+    assert len(minimize_cubes(formula, names)) == minimum_cover_size(formula, names)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_minimize_many_variables(seed):
+    rng = random.Random(seed)
+    formula = get_ast(random_wide_formula(rng, 40, 30))
+    assert len(nodes.variable_names(formula)) > 10
+    result = minimize(formula, time_limit=1.0)
+    if isinstance(result, bool):
+        assert not is_satisfiable(nodes.UnaryFormula(Negation, formula) if result else formula)
+    else:
+        assert not is_satisfiable(xor(formula, result))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_heuristic_cover(seed):
+    formula = get_ast(random_wide_formula(random.Random(seed), 14, 8))
+    names = nodes.variable_names(formula)
+    check_cover(formula, names, minimize_cubes(formula, names, exact_variables=0))
+
+
+def test_time_limit():
+    formula = get_ast(random_formula(random.Random(0), 40))
+    names = nodes.variable_names(formula)
+    for exact_variables in (len(names), 0):
+        cover = minimize_cubes(formula, names, exact_variables, time_limit=0.0)
+        assert set().union(*(cube_models(cube, names) for cube in cover)) == models(formula, names)
@@ -0,0 +1,57 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from prop_logic.compiler import compile_formula
+from prop_logic.parallel import evaluate_many, parse_many
+
+from .helpers import get_ast, random_formula
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 7])
+def test_parse_many(executor, chunksize):
+    rng = random.Random(0)
+    formulas = [random_formula(rng, rng.randint(1, 20)) for _ in range(100)]
+    results = parse_many(formulas, chunksize=chunksize, executor=executor)
+    assert [str(result) for result in results] == [str(get_ast(f)) for f in formulas]
+
+
+def test_parse_many_iterator(executor):
+    formulas = (f"A{'&' if i % 2 else '|'}B" for i in range(1000))
+    results = parse_many(formulas, executor=executor)
+    assert [str(result) for result in results[:2]] == ["(A ∨ B)", "(A ∧ B)"]
+    assert len(results) == 1000
+
+
+def test_parse_many_errors(executor):
+    results = parse_many(["A & B", "A $ B", "(A", "C"], executor=executor)
+    assert str(results[0]) == "(A ∧ B)"
+    assert isinstance(results[1], ValueError)
+    assert str(results[1]) == "Unknown character '$' at position 2."
+    assert isinstance(results[2], ValueError)
+    assert str(results[3]) == "C"
+
+
+def test_parse_many_own_executor():
+    assert [str(result) for result in parse_many(["A > B"], max_workers=1)] == ["(A → B)"]
+    assert parse_many([], max_workers=1) == []
+    with pytest.raises(ValueError, match="chunksize"):
+        parse_many(["A"], max_workers=1, chunksize=0)
+
+
+def test_evaluate_many(executor):
+    rng = random.Random(1)
+    formulas = [random_formula(rng, rng.randint(1, 20)) for _ in range(100)]
+    assignment = {"A": True, "B": False, "C": True, "D": False}
+    results = evaluate_many(formulas + ["E", "A &"], assignment, chunksize=9, executor=executor)
+
+    assert results[:-2] == [compile_formula(get_ast(f))(assignment) for f in formulas]
+    assert str(results[-2]) == "Variable 'E' is missing from the assignment."
+    assert isinstance(results[-1], ValueError)
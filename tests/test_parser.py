@@ -1,9 +1,9 @@
 import pytest
 
-from prop_logic import lexer
 from prop_logic.connectives import Conjunction, Implication, Negation
 from prop_logic.nodes import BinaryFormula, UnaryFormula, Variable
-from prop_logic.parser import Parser
+
+from .helpers import get_ast
 
 PARAMS_GROUPED = [
     (
@@ -451,12 +451,6 @@ PARAMS_GROUPED_NOT = [
 ]
 
 
-def get_ast(function):
-    tokens = lexer.lex(function)
-    parser = Parser(tokens)
-    return parser.parse()
-
-
 @pytest.mark.parametrize(["function", "expected"], PARAMS_GROUPED)
 def test_parser_grouped(function, expected):
     assert get_ast(function) == expected
@@ -0,0 +1,101 @@
+import random
+import re
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.connectives import Conjunction, Implication
+from prop_logic.lexer import TokenType
+from prop_logic.nodes import BinaryFormula, Variable
+from prop_logic.parser import Parser
+from prop_logic.pratt import INFIX_RULES, PREFIX_RULES, PrattParser
+from prop_logic.symbols import SymbolTable
+
+from .helpers import PARAMS_ERRORS, depth, parse, random_formula
+from .test_parser import PARAMS_GROUPED, PARAMS_GROUPED_NOT, PARAMS_UNGROUPED_NOT
+
+
+@pytest.mark.parametrize(
+    "formula",
+    [params[0] for params in PARAMS_GROUPED + PARAMS_UNGROUPED_NOT + PARAMS_GROUPED_NOT],
+)
+def test_same_tree_as_parser(formula):
+    assert parse(PrattParser, formula) == parse(Parser, formula)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_same_tree_as_parser_random(seed):
+    formula = random_formula(random.Random(seed), 20)
+    assert parse(PrattParser, formula) == parse(Parser, formula)
+
+
+@pytest.mark.parametrize("formula", PARAMS_ERRORS)
+def test_same_errors_as_parser(formula):
+    with pytest.raises(ValueError) as expected:
+        parse(Parser, formula)
+    with pytest.raises(ValueError) as actual:
+        parse(PrattParser, formula)
+    assert str(actual.value) == str(expected.value)
+
+
+@pytest.mark.parametrize(
+    ["formula", "message"],
+    [
+        ("A ~ B", "Syntax error: unexpected token '~'"),
+        ("(A ~ B)", "expected TokenType.PARENTHESIS_RIGHT but found TokenType.NOT"),
+        ("> A", "Unexpected token >"),
+        ("~ & A", "Unexpected token &"),
+        ("A & > B", "Unexpected token >"),
+    ],
+)
+def test_stricter_than_parser(formula, message):
+    # Parser accepts connectives of either arity in place of each other; PrattParser doesn't.
+    parse(Parser, formula)
+    with pytest.raises(ValueError, match=re.escape(message)):
+        parse(PrattParser, formula)
+
+
+def test_tables():
+    assert set(PREFIX_RULES) == {
+        TokenType.VARIABLE,
+        TokenType.PARENTHESIS_LEFT,
+        TokenType.NOT,
+    }
+    assert set(INFIX_RULES) == {TokenType.AND, TokenType.OR, TokenType.IMPLIES}
+    assert INFIX_RULES[TokenType.AND].connective is Conjunction
+    for rule in INFIX_RULES.values():
+        assert rule.right_power == rule.left_power + 1
+        assert PREFIX_RULES[TokenType.NOT].power > rule.left_power
+
+
+def test_right_associative_rule(monkeypatch):
+    rule = INFIX_RULES[TokenType.IMPLIES]
+    monkeypatch.setitem(
+        INFIX_RULES,
+        TokenType.IMPLIES,
+        rule._replace(left_power=rule.right_power, right_power=rule.left_power),
+    )
+    result = parse(PrattParser, "A > B > C & D")
+    assert str(result) == "(A → (B → (C ∧ D)))"
+
+
+def test_long_binary_chain():
+    n = 10_000
+    result = parse(PrattParser, " & ".join(["A"] * n + ["B > C"]))
+    assert result.connective is Implication
+    assert result.right == Variable("C")
+    assert depth(result) == n + 2
+
+    node = result.left
+    assert node.right == Variable("B")
+    while isinstance(node, BinaryFormula):
+        assert node.connective is Conjunction
+        node = node.left
+    assert node == Variable("A")
+
+
+def test_symbols():
+    symbols = SymbolTable()
+    result = PrattParser(lexer.lex("B & A | B"), symbols).parse()
+    assert symbols.names == ("B", "A")
+    assert result.right.id == 0
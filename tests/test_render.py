@@ -0,0 +1,89 @@
+import io
+import random
+
+import pytest
+
+from prop_logic import interned, nodes
+from prop_logic.connectives import Conjunction, Implication, Negation
+from prop_logic.render import Style, iter_pieces, render, write
+
+from .helpers import get_ast, random_formula
+
+
+def render_recursively(formula):
+    """Render like the original recursive `__str__` methods."""
+    if isinstance(formula, nodes.BinaryFormula):
+        left, right = render_recursively(formula.left), render_recursively(formula.right)
+        return f"({left} {formula.connective} {right})"
+    elif isinstance(formula, nodes.UnaryFormula):
+        return f"{formula.connective}{render_recursively(formula.operand)}"
+    else:
+        return formula.name
+
+
+@pytest.mark.parametrize(
+    ["formula", "full", "minimal"],
+    [
+        ("A", "A", "A"),
+        ("~~A", "¬¬A", "¬¬A"),
+        ("~(A & B)", "¬(A ∧ B)", "¬(A ∧ B)"),
+        ("A & B & C", "((A ∧ B) ∧ C)", "A ∧ B ∧ C"),
+        ("A & (B & C)", "(A ∧ (B ∧ C))", "A ∧ (B ∧ C)"),
+        ("A > B > C", "((A → B) → C)", "A → B → C"),
+        ("A > (B > C)", "(A → (B → C))", "A → (B → C)"),
+        ("A | B & C", "(A ∨ (B ∧ C))", "A ∨ B ∧ C"),
+        ("(A | B) & C", "((A ∨ B) ∧ C)", "(A ∨ B) ∧ C"),
+        ("~A & ~(B | C) > D", "((¬A ∧ ¬(B ∨ C)) → D)", "¬A ∧ ¬(B ∨ C) → D"),
+        ("A ~ B & C", "((A ¬ B) ∧ C)", "A ¬ B ∧ C"),
+        ("A & (B ~ C)", "(A ∧ (B ¬ C))", "A ∧ B ¬ C"),
+    ],
+)
+def test_render(formula, full, minimal):
+    ast = get_ast(formula)
+    assert render(ast) == str(ast) == full
+    assert render(ast, Style.MINIMAL) == minimal
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random(seed):
+    formula = get_ast(random_formula(random.Random(seed), 40))
+    assert str(formula) == render_recursively(formula)
+    minimal = render(formula, Style.MINIMAL)
+    assert str(get_ast(minimal)) == str(formula)
+    assert len(minimal) <= len(str(formula))
+
+
+def test_repr():
+    formula = nodes.BinaryFormula(
+        nodes.UnaryFormula(Negation, nodes.Variable("A")), Implication, nodes.Variable("B")
+    )
+    assert repr(formula) == (
+        "BinaryFormula(left=UnaryFormula(connective=Negation, operand=Variable(name='A')), "
+        "connective=Implication, right=Variable(name='B'))"
+    )
+    assert repr(interned.intern(nodes.UnaryFormula(Negation, nodes.Variable("A")))) == (
+        "InternedUnaryFormula(connective=Negation, operand=InternedVariable(name='A'))"
+    )
+
+
+def test_deep():
+    n = 200_000
+    formula = nodes.Variable("A")
+    for i in range(n):
+        if i % 2:
+            formula = nodes.UnaryFormula(Negation, formula)
+        else:
+            formula = nodes.BinaryFormula(formula, Conjunction, nodes.Variable("B"))
+
+    text = str(formula)
+    assert len(text) == n // 2 * (len("¬") + len("( ∧ B)")) + 1
+    assert render(formula, Style.MINIMAL).count("(") == n // 2
+    assert repr(formula).startswith("UnaryFormula(connective=Negation, operand=BinaryFormula(")
+
+
+@pytest.mark.parametrize("style", list(Style))
+def test_write(style):
+    formula = get_ast(random_formula(random.Random(0), 3000))
+    file = io.StringIO()
+    write(formula, file, style)
+    assert file.getvalue() == "".join(iter_pieces(formula, style)) == render(formula, style)
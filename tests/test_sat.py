@@ -0,0 +1,224 @@
+import itertools
+import random
+
+import pytest
+
+from prop_logic import lexer
+from prop_logic.compiler import compile_formula
+from prop_logic.parser import IterativeParser
+from prop_logic.sat import Solver, is_satisfiable, iter_models, solve
+from prop_logic.truth_table import truth_table
+
+from .helpers import get_ast, random_formula
+
+
+def random_3sat(rng, num_vars, num_clauses):
+    return [
+        [v if rng.random() < 0.5 else -v for v in rng.sample(range(1, num_vars + 1), 3)]
+        for _ in range(num_clauses)
+    ]
+
+
+def pigeonhole(holes):
+    pigeons = holes + 1
+    var = {(p, h): p * holes + h + 1 for p in range(pigeons) for h in range(holes)}
+    clauses = [[var[p, h] for h in range(holes)] for p in range(pigeons)]
+    for h in range(holes):
+        for p, q in itertools.combinations(range(pigeons), 2):
+            clauses.append([-var[p, h], -var[q, h]])
+    return clauses
+
+
+def brute_force(clauses, num_vars):
+    for values in itertools.product([False, True], repeat=num_vars):
+        if all(any(values[abs(lit) - 1] == (lit > 0) for lit in clause) for clause in clauses):
+            return True
+    return False
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_solver_random_3sat(seed):
+    rng = random.Random(seed)
+    clauses = random_3sat(rng, 12, 52)
+    solver = Solver(clauses)
+
+    assert solver.solve() is brute_force(clauses, 12)
+    if solver.model is not None:
+        assert all(any(solver.model[abs(lit)] == (lit > 0) for lit in c) for c in clauses)
+
+
+def test_solver_larger_instances():
+    rng = random.Random(0)
+    for _ in range(5):
+        clauses = random_3sat(rng, 100, 426)
+        solver = Solver(clauses)
+        if solver.solve():
+            assert all(any(solver.model[abs(lit)] == (lit > 0) for lit in c) for c in clauses)
+        assert solver.stats.conflicts >= 0
+
+
+@pytest.mark.parametrize("holes", [2, 3, 4, 5, 6])
+def test_solver_pigeonhole_unsat(holes):
+    solver = Solver(pigeonhole(holes))
+    assert not solver.solve()
+    assert solver.model is None
+
+
+def test_solver_trivial_clauses():
+    assert Solver().solve()
+    assert Solver([[1, -1]]).solve()
+    assert not Solver([[1], [-1]]).solve()
+    assert not Solver([[]]).solve()
+
+    solver = Solver([[1, 2]])
+    assert solver.solve()
+    assert solver.add_clause([-1])
+    assert solver.solve()
+    assert solver.model == {1: False, 2: True}
+    assert not solver.add_clause([-2])
+    assert not solver.solve()
+
+
+def test_solver_assumptions():
+    solver = Solver([[1, 2], [-1, 3]])
+    assert solver.solve([-3])
+    assert solver.model[1] is False and solver.model[2] is True
+    assert not solver.solve([-2, -3])
+    assert solver.solve([1])  # Failed assumptions don't make the clauses unsatisfiable.
+    assert solver.model[3] is True
+    assert not solver.solve([1, -1])
+    assert solver.solve([4])
+    assert solver.num_vars == 4
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_solver_random_3sat_assumptions(seed):
+    rng = random.Random(seed)
+    clauses = random_3sat(rng, 10, 40)
+    solver = Solver(clauses)
+    for _ in range(5):
+        assumptions = [v if rng.random() < 0.5 else -v for v in rng.sample(range(1, 11), 3)]
+        expected = brute_force(clauses + [[lit] for lit in assumptions], 10)
+        assert solver.solve(assumptions) is expected
+        if expected:
+            assert all(solver.model[abs(lit)] == (lit > 0) for lit in assumptions)
+
+
+def test_solver_assume():
+    solver = Solver([[-1, 2], [-2, 3], [-3, -4]])
+    assert solver.decision_level == 0
+    assert solver.assume(1) == [1, 2, 3, -4]
+    assert solver.value(3) is True and solver.value(-4) is True
+    assert solver.assume(2) == []
+    assert solver.decision_level == 2
+    assert solver.assume(4) is None  # Already false.
+
+    solver.backtrack(1)
+    assert solver.decision_level == 1 and solver.value(4) is False
+    solver.backtrack()
+    assert solver.value(1) is None and solver.value(4) is None
+    assert solver.assume(4) == [4, -3, -2, -1]
+    assert solver.solve() and solver.model[4] is True
+
+
+def test_solver_assume_conflict():
+    solver = Solver([[-1, 2], [-1, 3], [-2, -3, 4], [-2, -3, -4]])
+    assert solver.assume(1) is None
+    assert solver.decision_level == 1
+    assert solver.stats.conflicts == 1
+    assert all(solver.activity(var) > 0 for var in (2, 3, 4))
+    solver.backtrack()
+    assert solver.solve() and solver.model[1] is False
+
+
+def test_solver_invalid_literal():
+    with pytest.raises(ValueError):
+        Solver([[1, 0]])
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_solve_formula(seed):
+    formula = get_ast(random_formula(random.Random(seed), 8))
+    model = solve(formula)
+
+    assert (model is not None) is truth_table(formula).is_satisfiable
+    if model is not None:
+        assert compile_formula(formula)(model)
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("A & ~A", None),
+        ("A", {"A": True}),
+        ("~A", {"A": False}),
+        ("(A > B) & A & ~B", None),
+        ("(A | B) & ~A", {"A": False, "B": True}),
+        ("~(A > B)", {"A": True, "B": False}),
+    ],
+)
+def test_solve_formula_exact(formula, expected):
+    assert solve(get_ast(formula)) == expected
+
+
+def test_deep_formula():
+    n = 5000
+    assert solve(IterativeParser(lexer.lex("~" * n + "A")).parse()) == {"A": True}
+    assert not is_satisfiable(IterativeParser(lexer.lex("(" * n + "A & ~A" + ")" * n)).parse())
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_iter_models(seed):
+    formula = get_ast(random_formula(random.Random(seed), 8))
+    table = truth_table(formula)
+    expected = [table.assignment(row) for row in range(table.size) if table.value(row)]
+
+    models = list(iter_models(formula))
+    assert sorted(sorted(model.items()) for model in models) == sorted(
+        sorted(model.items()) for model in expected
+    )
+    assert all(list(model) == list(table.variables) for model in models)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_iter_models_projection(seed):
+    rng = random.Random(seed)
+    formula = get_ast(random_formula(rng, 8))
+    table = truth_table(formula)
+    projected = rng.sample(table.variables, rng.randint(0, len(table.variables)))
+    expected = {
+        tuple(table.assignment(row)[name] for name in projected)
+        for row in range(table.size)
+        if table.value(row)
+    }
+
+    models = [tuple(model[name] for name in projected) for model in iter_models(formula, projected)]
+    assert len(models) == len(set(models))
+    assert set(models) == expected
+
+
+@pytest.mark.parametrize(
+    ["formula", "variables", "expected"],
+    [
+        ("A & ~A", None, []),
+        ("A | ~A", None, [{"A": True}, {"A": False}]),
+        ("A & B", ["B", "C"], [{"B": True, "C": True}, {"B": True, "C": False}]),
+        ("A | B", [], [{}]),
+        ("A & ~A", [], []),
+    ],
+)
+def test_iter_models_exact(formula, variables, expected):
+    models = list(iter_models(get_ast(formula), variables))
+    assert sorted(sorted(model.items()) for model in models) == sorted(
+        sorted(model.items()) for model in expected
+    )
+
+
+def test_iter_models_lazy():
+    # A disjunction of 40 variables has 2^40 - 1 models.
+    names = ["".join(letters) for letters in itertools.product("ABCDEFGH", "ab", "xyz")][:40]
+    formula = get_ast(" | ".join(names))
+    models = list(itertools.islice(iter_models(formula), 200))
+
+    assert len({tuple(model.values()) for model in models}) == 200
+    assert all(any(model.values()) and list(model) == names for model in models)
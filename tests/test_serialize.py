@@ -0,0 +1,96 @@
+import io
+import random
+import struct
+
+import pytest
+
+from prop_logic import nodes
+from prop_logic.connectives import Conjunction
+from prop_logic.flat import FlatFormula
+from prop_logic.serialize import MAGIC, VERSION, FormulaFile, write_formulas
+
+from .helpers import get_ast, random_formula
+
+
+@pytest.fixture
+def formulas():
+    rng = random.Random(0)
+    return [get_ast(random_formula(rng, rng.randint(1, 30))) for _ in range(100)]
+
+
+def test_round_trip(tmp_path, formulas):
+    path = tmp_path / "formulas.plf"
+    write_formulas(formulas, path)
+
+    with FormulaFile(path) as file:
+        assert len(file) == len(formulas)
+        for formula, loaded in zip(formulas, file):
+            flat = FlatFormula.from_formula(formula)
+            assert loaded == flat
+            assert str(loaded) == str(formula)
+            assert str(loaded.to_formula()) == str(formula)
+            assignment = dict.fromkeys(loaded.names, True)
+            assert loaded.evaluate(assignment) is flat.evaluate(assignment)
+        assert str(file[-1]) == str(formulas[-1])
+        del flat, loaded
+
+
+def test_file_object(tmp_path):
+    buffer = io.BytesIO()
+    write_formulas([FlatFormula.from_formula(get_ast("A & ~B")), get_ast("B > C")], buffer)
+    path = tmp_path / "formulas.plf"
+    path.write_bytes(buffer.getvalue())
+
+    with FormulaFile(path) as file:
+        assert [str(formula) for formula in file] == ["(A ∧ ¬B)", "(B → C)"]
+        assert [file.name(i) for i in range(3)] == ["A", "B", "C"]
+        assert file[1].names == ["B", "C"]
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "formulas.plf"
+    write_formulas([], path)
+    with FormulaFile(path) as file:
+        assert len(file) == 0
+        assert list(file) == []
+        with pytest.raises(IndexError):
+            file[0]
+
+
+def test_unicode_names(tmp_path):
+    path = tmp_path / "formulas.plf"
+    write_formulas([nodes.BinaryFormula(nodes.Variable("Äpfel"), Conjunction, get_ast("B"))], path)
+    with FormulaFile(path) as file:
+        assert str(file[0]) == "(Äpfel ∧ B)"
+
+
+def test_formula_outlives_file(tmp_path):
+    path = tmp_path / "formulas.plf"
+    write_formulas([get_ast("A & ~B"), get_ast("B > C")], path)
+    with FormulaFile(path) as file:
+        formula = file[1]
+    assert str(formula) == "(B → C)"
+    assert formula.evaluate({"B": True, "C": False}) is False
+    file.close()  # Closing again does nothing.
+    with pytest.raises(ValueError):
+        file[0]
+    del formula
+
+
+@pytest.mark.parametrize(
+    ["data", "message"],
+    [
+        (b"PLFF", "too short"),
+        (struct.pack("<4sHHQQQQQ", b"XXXX", VERSION, 0, 0, 0, 0, 0, 0), "bad magic number"),
+        (
+            struct.pack("<4sHHQQQQQ", MAGIC, 99, 0, 0, 0, 0, 0, 0),
+            "Unsupported formula file version",
+        ),
+        (struct.pack("<4sHHQQQQQ", MAGIC, VERSION, 0, 5, 0, 0, 0, 0), "truncated"),
+    ],
+)
+def test_invalid(tmp_path, data, message):
+    path = tmp_path / "formulas.plf"
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match=message):
+        FormulaFile(path)
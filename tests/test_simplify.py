@@ -0,0 +1,152 @@
+import itertools
+import random
+
+import pytest
+
+from prop_logic import interned, lexer, nodes
+from prop_logic.compiler import compile_formula
+from prop_logic.parser import IterativeParser
+from prop_logic.simplify import Simplifier, simplify, to_dnf, to_nnf
+
+from .helpers import get_ast, random_formula
+
+
+def assert_equivalent(formula, result):
+    names = nodes.variable_names(formula)
+    evaluate = compile_formula(formula)
+    if not isinstance(result, bool):
+        assert set(nodes.variable_names(result)) <= set(names)
+        evaluate_result = compile_formula(result)
+    for values in itertools.product([False, True], repeat=len(names)):
+        assignment = dict(zip(names, values))
+        expected = result if isinstance(result, bool) else evaluate_result(assignment)
+        assert evaluate(assignment) == expected
+
+
+def is_nnf(formula):
+    for node in nodes.iter_postorder(formula):
+        if isinstance(node, nodes.UnaryFormula) and not isinstance(node.operand, nodes.Variable):
+            return False
+        elif isinstance(node, nodes.BinaryFormula) and node.connective.lexeme == "→":
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("~~A", "A"),
+        ("~~~A", "¬A"),
+        ("A & A", "A"),
+        ("A | B | A", "(A ∨ B)"),
+        ("A | (A & B)", "A"),
+        ("A & (B | A)", "A"),
+        ("(A & B) | (A & B & C)", "(A ∧ B)"),
+        ("(A | B | C) & (B | A)", "(B ∨ A)"),
+        ("(A | B) & (B | A)", "(A ∨ B)"),
+        ("A > A", True),
+        ("A > B", "(¬A ∨ B)"),
+        ("(A > B) > C", "(¬(¬A ∨ B) ∨ C)"),
+        ("A & ~A", False),
+        ("A | ~A | B", True),
+        ("(A | ~A) & B", "B"),
+        ("(A & ~A) | B", "B"),
+        ("((A & ~A) | B) & ~B", False),
+        ("~(A > A) | C", "C"),
+    ],
+)
+def test_simplify(formula, expected):
+    result = simplify(get_ast(formula))
+    assert (result if isinstance(result, bool) else str(result)) == expected
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_simplify_random(seed):
+    formula = get_ast(random_formula(random.Random(seed), 12))
+    assert_equivalent(formula, simplify(formula))
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_to_nnf_random(seed):
+    formula = get_ast(random_formula(random.Random(seed), 12))
+    nnf = to_nnf(formula)
+    assert is_nnf(nnf)
+    assert_equivalent(formula, nnf)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_to_dnf_random(seed):
+    formula = get_ast(random_formula(random.Random(seed), 12))
+    dnf = to_dnf(formula)
+    assert_equivalent(formula, dnf)
+    if not isinstance(dnf, bool):
+        assert is_nnf(dnf)
+        for term in nodes.iter_postorder(dnf):
+            if isinstance(term, nodes.BinaryFormula) and term.connective.lexeme == "∧":
+                assert all(
+                    not isinstance(node, nodes.BinaryFormula) or node.connective.lexeme == "∧"
+                    for node in nodes.iter_postorder(term)
+                )
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("~(A & B)", "(¬A ∨ ¬B)"),
+        ("~(A > ~B)", "(A ∧ B)"),
+        ("~~(A | B)", "(A ∨ B)"),
+        ("A > B", "(¬A ∨ B)"),
+    ],
+)
+def test_to_nnf(formula, expected):
+    assert str(to_nnf(get_ast(formula))) == expected
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("A & (B | C)", "((A ∧ B) ∨ (A ∧ C))"),
+        ("(A | B) & ~A", "(B ∧ ¬A)"),
+        ("(A | B) & (A | C)", "(A ∨ (B ∧ C))"),
+        ("A & ~A", False),
+        ("(A > B) | A", True),
+        ("A & (B | ~B)", "A"),
+        ("(A & (B | ~B)) | (C & ~C & D)", "A"),
+        ("(B | ~B) & (C > C)", True),
+    ],
+)
+def test_to_dnf(formula, expected):
+    result = to_dnf(get_ast(formula))
+    assert (result if isinstance(result, bool) else str(result)) == expected
+
+
+def test_to_dnf_max_terms():
+    # A conjunction of n disjunctions of 2 variables has 2^n terms.
+    formula = get_ast(" & ".join(f"({a} | {b})" for a, b in zip("ABCDEFGH", "IJKLMNOP")))
+    assert len(nodes.variable_names(to_dnf(formula, 256))) == 16
+    with pytest.raises(ValueError, match="more than 255 terms"):
+        to_dnf(formula, 255)
+
+
+def test_memoization():
+    simplifier = Simplifier()
+    shared = get_ast("~~(A & A & B)")
+    formula = nodes.BinaryFormula(
+        shared, get_ast("A | B").connective, nodes.UnaryFormula(shared.connective, shared)
+    )
+    assert simplifier.simplify(formula) is True
+    simplified = len(simplifier._simplified)
+    assert simplifier.simplify(shared) is interned.intern(get_ast("A & B"))
+    assert len(simplifier._simplified) == simplified
+
+
+def test_deep_formula():
+    n = 5000
+    assert simplify(IterativeParser(lexer.lex("~" * n + "A")).parse()) is interned.intern(
+        get_ast("A")
+    )
+    formula = IterativeParser(lexer.lex("(" * n + "A & ~A" + ")" * n + " | B")).parse()
+    assert simplify(formula) is interned.intern(get_ast("B"))
+    chain = IterativeParser(lexer.lex(" & ".join("~A" for _ in range(n)))).parse()
+    assert str(to_dnf(chain)) == "¬A"
+    assert is_nnf(to_nnf(IterativeParser(lexer.lex("~(" * n + "A" + ")" * n)).parse()))
@@ -0,0 +1,80 @@
+import io
+import random
+
+import pytest
+
+from prop_logic.stream import parse_file, parse_stream
+
+from .helpers import get_ast, random_formula
+
+
+def write(tmp_path, text):
+    path = tmp_path / "formulas.txt"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parse_file(tmp_path, seed):
+    rng = random.Random(seed)
+    formulas = [random_formula(rng, rng.randint(1, 30)) for _ in range(50)]
+    results = list(parse_file(write(tmp_path, "\n".join(formulas))))
+
+    assert [number for number, _ in results] == list(range(1, 51))
+    for (_, formula), text in zip(results, formulas):
+        assert str(formula) == str(get_ast(text))
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        ("", []),
+        ("\n\n", []),
+        ("A\n  \n\r\nB", [(1, "A"), (4, "B")]),
+        ("A & B\r\n~C\n", [(1, "A & B"), (2, "~C")]),
+        ("A ∧ ¬B\nA → B", [(1, "A ∧ ¬B"), (2, "A → B")]),
+        ("A /\\ B \\/ C", [(1, "A /\\ B \\/ C")]),
+    ],
+)
+def test_parse_file_lines(tmp_path, text, expected):
+    results = [(number, str(formula)) for number, formula in parse_file(write(tmp_path, text))]
+    assert results == [(number, str(get_ast(formula))) for number, formula in expected]
+
+
+def test_parse_file_errors(tmp_path):
+    text = "A & B\nA $ B\n(A | B\nA ∧ ∆\nA &\nC\n"
+    results = list(parse_file(write(tmp_path, text)))
+
+    assert [number for number, _ in results] == [1, 2, 3, 4, 5, 6]
+    errors = [str(result) for _, result in results[1:5]]
+    assert errors == [
+        "Unknown character '$' at position 2.",
+        "Unexpected token: expected TokenType.PARENTHESIS_RIGHT but found EOF",
+        "Unknown character '∆' at position 4.",
+        "Unexpected token None",
+    ]
+    assert str(results[5][1]) == str(get_ast("C"))
+
+
+def test_parse_file_invalid_utf8(tmp_path):
+    path = tmp_path / "formulas.txt"
+    path.write_bytes(b"A\n\xff\nB\n")
+    results = list(parse_file(path))
+
+    assert [number for number, _ in results] == [1, 2, 3]
+    assert isinstance(results[1][1], UnicodeDecodeError)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_parse_stream(seed):
+    rng = random.Random(seed)
+    formula = random_formula(rng, 200).replace("&", "/\\").replace("A", "Alpha")
+    result = parse_stream(io.StringIO(formula), chunk_size=rng.randint(1, 16))
+    assert str(result) == str(get_ast(formula))
+
+
+def test_parse_stream_errors():
+    with pytest.raises(ValueError, match="Unknown character '#' at position 12."):
+        parse_stream(io.StringIO("A & B" * 2 + "  # C"), chunk_size=4)
+    with pytest.raises(ValueError, match="Syntax error: unexpected token 'B'"):
+        parse_stream(io.StringIO("A B"), chunk_size=1)
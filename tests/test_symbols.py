@@ -0,0 +1,103 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from prop_logic import interned, lexer, nodes
+from prop_logic.flat import FlatFormula
+from prop_logic.incremental import IncrementalParser
+from prop_logic.parallel import parse_many
+from prop_logic.parser import IterativeParser, Parser
+from prop_logic.symbols import SymbolTable, renumber
+
+
+def variables(formula):
+    return [
+        (node.name, node.id)
+        for node in nodes.iter_postorder(formula)
+        if isinstance(node, nodes.Variable)
+    ]
+
+
+def test_symbol_table():
+    symbols = SymbolTable(["B", "A"])
+    assert symbols.intern("C") == 2
+    assert symbols.intern("A") == 1
+    assert len(symbols) == 3
+    assert list(symbols) == ["B", "A", "C"]
+    assert symbols.names == ("B", "A", "C")
+    assert "A" in symbols and "D" not in symbols
+    assert symbols.id("C") == 2
+    assert symbols.name(0) == "B"
+    assert repr(symbols) == "SymbolTable(['B', 'A', 'C'])"
+    with pytest.raises(KeyError):
+        symbols.id("D")
+    with pytest.raises(IndexError):
+        symbols.name(3)
+    with pytest.raises(IndexError):
+        symbols.name(-1)
+    assert pickle.loads(pickle.dumps(symbols)).names == symbols.names
+
+
+@pytest.mark.parametrize("parser_type", [Parser, IterativeParser])
+def test_parser(parser_type):
+    symbols = SymbolTable()
+    first = parser_type(lexer.lex("B & (A | ~B)"), symbols).parse()
+    second = parser_type(lexer.lex("C > A"), symbols).parse()
+
+    assert symbols.names == ("B", "A", "C")
+    assert variables(first) == [("B", 0), ("A", 1), ("B", 0)]
+    assert variables(second) == [("C", 2), ("A", 1)]
+    assert parser_type(lexer.lex("A")).parse().id is None
+
+
+def test_incremental_parser():
+    symbols = SymbolTable(["X"])
+    formula = IncrementalParser(list(lexer.lex("(A & B)")), symbols=symbols).parse()
+    assert variables(formula) == [("A", 1), ("B", 2)]
+
+
+def test_ids_ignored_by_equality():
+    assert nodes.Variable("A", 0) == nodes.Variable("A", 5)
+    assert repr(nodes.Variable("A", 0)) == "Variable(name='A')"
+    assert interned.intern(nodes.Variable("A", 3)).id is None
+
+
+def test_merge():
+    first, second = SymbolTable(), SymbolTable()
+    formulas = [
+        Parser(lexer.lex("A & B"), first).parse(),
+        Parser(lexer.lex("C | A"), second).parse(),
+    ]
+
+    mapping = first.merge(second)
+    assert first.names == ("A", "B", "C")
+    assert mapping == [2, 0]
+    renumber(formulas[1], mapping)
+    assert variables(formulas[1]) == [("C", 2), ("A", 0)]
+
+    with pytest.raises(ValueError, match="Variable 'A' has no ID."):
+        renumber(Parser(lexer.lex("A")).parse(), mapping)
+
+
+def test_sorted():
+    symbols = SymbolTable(["C", "A", "B"])
+    table, mapping = symbols.sorted()
+    assert table.names == ("A", "B", "C")
+    assert mapping == [2, 0, 1]
+
+
+def test_flat_and_parallel():
+    symbols = SymbolTable(["Z"])
+    formula = FlatFormula.from_formula(Parser(lexer.lex("B & A")).parse()).to_formula(symbols)
+    assert variables(formula) == [("B", 1), ("A", 2)]
+
+    symbols = SymbolTable()
+    with ProcessPoolExecutor(1) as executor:
+        results = parse_many(["B & A", "C", "A | C"], executor=executor, symbols=symbols)
+    assert symbols.names == ("B", "A", "C")
+    assert [variables(result) for result in results] == [
+        [("B", 0), ("A", 1)],
+        [("C", 2)],
+        [("A", 1), ("C", 2)],
+    ]
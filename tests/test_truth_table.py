@@ -0,0 +1,90 @@
+import itertools
+import random
+
+import pytest
+
+from prop_logic.compiler import compile_formula
+from prop_logic.nodes import variable_names
+from prop_logic.truth_table import (
+    TruthTable,
+    count_models,
+    is_satisfiable,
+    is_tautology,
+    iter_chunks,
+    truth_table,
+)
+
+from .helpers import get_ast, random_formula
+
+
+@pytest.mark.parametrize(
+    ["formula", "expected"],
+    [
+        ("A", TruthTable(("A",), 0b10, 1)),
+        ("~A", TruthTable(("A",), 0b01, 1)),
+        ("A & B", TruthTable(("A", "B"), 0b1000, 1)),
+        ("A | B", TruthTable(("A", "B"), 0b1110, 3)),
+        ("A > B", TruthTable(("A", "B"), 0b1011, 3)),
+        ("B > A", TruthTable(("B", "A"), 0b1011, 3)),
+    ],
+)
+def test_truth_table(formula, expected):
+    assert truth_table(get_ast(formula)) == expected
+
+
+@pytest.mark.parametrize(["seed", "chunk_bits"], [(seed, seed % 5) for seed in range(20)])
+def test_matches_evaluation(seed, chunk_bits):
+    formula = get_ast(random_formula(random.Random(seed), 10))
+    table = truth_table(formula, chunk_bits=chunk_bits)
+    evaluator = compile_formula(formula, table.variables)
+
+    for row in range(table.size):
+        assert table.value(row) is evaluator(tuple(table.assignment(row).values()))
+    assert table.count == sum(
+        evaluator(values)
+        for values in itertools.product([False, True], repeat=len(table.variables))
+    )
+    assert table == truth_table(formula)
+
+
+def test_assignment_order():
+    table = truth_table(get_ast("A & ~B"), ["A", "B", "C"])
+    assert table.assignment(0) == {"A": False, "B": False, "C": False}
+    assert table.assignment(0b100) == {"A": True, "B": False, "C": False}
+    assert table.assignment(0b011) == {"A": False, "B": True, "C": True}
+    assert table.rows == 0b00110000
+    assert table.count == 2
+
+
+def test_flags():
+    assert truth_table(get_ast("A | ~A")).is_tautology
+    assert truth_table(get_ast("A & ~A")).is_contradiction
+    assert not truth_table(get_ast("A & ~A")).is_satisfiable
+    assert truth_table(get_ast("A & B")).is_satisfiable
+
+    assert is_tautology(get_ast("(A > B) | (B > A)"), chunk_bits=0)
+    assert not is_tautology(get_ast("A > B"), chunk_bits=1)
+    assert is_satisfiable(get_ast("A & ~B & C"), chunk_bits=1)
+    assert not is_satisfiable(get_ast("(A | B) & ~A & ~B"), chunk_bits=1)
+
+
+def test_chunks_are_bounded():
+    formula = get_ast(" & ".join(f"(X{a} | ~X{b})" for a, b in zip("ABCDEFGHIJ", "BCDEFGHIJA")))
+    chunks = list(iter_chunks(formula, chunk_bits=4))
+
+    assert len(chunks) == 2 ** len(variable_names(formula)) // 16
+    assert all(size == 16 for _, size, _ in chunks)
+    assert [start for start, _, _ in chunks] == list(range(0, 1024, 16))
+    assert sum(bin(rows).count("1") for _, _, rows in chunks) == count_models(formula) == 2
+
+
+def test_many_variables():
+    names = [f"V{chr(65 + i)}" for i in range(22)]
+    formula = get_ast(" | ".join(names))
+    assert count_models(formula) == 2**22 - 1
+    assert not is_tautology(formula)
+
+
+def test_missing_variable():
+    with pytest.raises(ValueError, match="'B'"):
+        truth_table(get_ast("A & B"), ["A"])
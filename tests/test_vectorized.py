@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from prop_logic.compiler import compile_formula
+from prop_logic.nodes import variable_names
+from prop_logic.vectorized import evaluate_batch
+
+from .helpers import get_ast, random_formula
+
+np = pytest.importorskip("numpy")
+
+
+def test_evaluate_batch():
+    data = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=bool)
+    formula = get_ast("A > B")
+
+    result = evaluate_batch(formula, data, ["A", "B"])
+    assert result.dtype == bool
+    assert result.tolist() == [True, True, False, True]
+    assert evaluate_batch(formula, data, {"A": 1, "B": 0}).tolist() == [True, False, True, True]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_compiled_evaluator(seed):
+    formula = get_ast(random_formula(random.Random(seed), 15))
+    names = ["Unused", *variable_names(formula)]
+    data = np.random.default_rng(seed).integers(0, 2, size=(200, len(names))).astype(bool)
+    evaluator = compile_formula(formula, names)
+
+    expected = [evaluator(tuple(row)) for row in data.tolist()]
+    assert evaluate_batch(formula, data, names).tolist() == expected
+    assert evaluate_batch(formula, np.packbits(data, axis=1), names, packed=True).tolist() == (
+        expected
+    )
+
+
+def test_variable_result_is_not_a_view():
+    data = np.array([[True], [False]])
+    result = evaluate_batch(get_ast("A"), data, ["A"])
+    result[0] = False
+    assert data[0, 0]
+
+
+def test_integer_data():
+    data = np.array([[1, 0], [1, 1]], dtype=np.int8)
+    assert evaluate_batch(get_ast("A & B"), data, ["A", "B"]).tolist() == [False, True]
+
+
+@pytest.mark.parametrize(
+    ["data", "columns", "packed", "message"],
+    [
+        (np.zeros(3, dtype=bool), ["A", "B"], False, "2-D"),
+        (np.zeros((3, 2), dtype=bool), ["A"], False, "'B'"),
+        (np.zeros((3, 2), dtype=bool), {"A": 0, "B": 2}, False, "out of range"),
+        (np.zeros((3, 1), dtype=bool), ["A", "B"], True, "uint8"),
+    ],
+)
+def test_invalid_input(data, columns, packed, message):
+    with pytest.raises(ValueError, match=message):
+        evaluate_batch(get_ast("A & B"), data, columns, packed)